@@ -0,0 +1,91 @@
+import tracemalloc
+
+from re import (
+    MULTILINE,
+    sub
+)
+from types import ModuleType
+
+from typing import (
+    Any,
+    Dict
+)
+
+import lpp.ast as ast
+import lpp.parser as parser_module
+from benchmarks.programs import generated_source
+from lpp.arena import to_arena
+from lpp.ast import Program
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+# Las mismas clases del AST pero sin __slots__, como eran antes: cada nodo guarda sus atributos en un __dict__
+def _ast_without_slots() -> ModuleType:
+
+    with open(ast.__file__, encoding="utf-8") as file:
+        source = sub(r"^\s*__slots__ = .*$", "", file.read(), flags=MULTILINE)
+
+    module = ModuleType("lpp.ast_sin_slots")
+    exec(compile(source, ast.__file__, "exec"), vars(module))
+
+    return module
+
+
+# El parser importa las clases por nombre, así que basta con cambiarlas en su módulo mientras parsea
+def _parse_with(module: ModuleType, buffer: TokenBuffer) -> Program:
+
+    originals: Dict[str, Any] = {}
+
+    for name, value in vars(parser_module).items():
+        if isinstance(value, type) and issubclass(value, ast.ASTNode):
+            originals[name] = value
+
+    try:
+
+        for name in originals:
+            setattr(parser_module, name, getattr(module, name))
+
+        return Parser(buffer).parse_program()
+
+    finally:
+
+        for name, value in originals.items():
+            setattr(parser_module, name, value)
+
+
+def main() -> None:
+
+    source = generated_source()
+    without_slots = _ast_without_slots()
+
+    # Medimos solo lo que se reserva al construir cada representación, el código fuente y los tokens en columnas ya existen
+    buffer: TokenBuffer = TokenBuffer(source)
+    tracemalloc.start()
+    with_dict = _parse_with(without_slots, buffer)
+    dictionaries, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del with_dict
+
+    buffer = TokenBuffer(source)
+    tracemalloc.start()
+    program: Program = Parser(buffer).parse_program()
+    objects, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    arena = to_arena(program)
+    flat, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nodes = len(arena)
+
+    print(f"{nodes} nodos")
+    print(f"Objetos sin __slots__ {dictionaries / nodes:8.1f} bytes por nodo")
+    print(f"Objetos con __slots__ {objects / nodes:8.1f} bytes por nodo")
+    print(f"Arena                 {flat / nodes:8.1f} bytes por nodo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from os import (
+    cpu_count,
+    path
+)
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.programs import generated_source
+from lpp.batch import validate
+
+
+FILES = 64
+
+
+def main() -> None:
+
+    source: str = generated_source(functions=200)
+
+    with TemporaryDirectory() as directory:
+
+        for idx in range(FILES):
+            # Cada archivo es distinto para que ninguno se salte por el cache de resultados
+            with open(path.join(directory, f"programa_{idx}.lpp"), "w", encoding="utf-8") as file:
+                file.write(f"variable archivo = {idx};\n{source}")
+
+        print(f"{FILES} archivos de {len(source)} caracteres, {cpu_count()} núcleos")
+
+        processes = 1
+        baseline = 0.0
+
+        while processes <= (cpu_count() or 1):
+
+            started = perf_counter()
+            validate([directory], processes, path.join(directory, f"resultados_{processes}.json"))
+            elapsed = perf_counter() - started
+            baseline = baseline or elapsed
+
+            print(f"{processes:3d} procesos {elapsed * 1000:10.2f} ms  (x{baseline / elapsed:.2f})")
+            processes *= 2
+
+        # Sin cambios no se vuelve a parsear nada
+        started = perf_counter()
+        validate([directory], 1, path.join(directory, "resultados_1.json"))
+        print(f"Sin cambios       {(perf_counter() - started) * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from sys import setrecursionlimit
+from time import perf_counter
+
+from typing import (
+    Callable,
+    Optional
+)
+
+from lpp.budget import (
+    Budget,
+    evaluate_with_budget
+)
+from lpp.engines import ENGINES
+from lpp.object import (
+    Environment,
+    Object
+)
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+ROUNDS = 5
+
+# Llamadas y vueltas de ciclo, lo único que cuenta como paso
+SOURCE: str = """
+    variable fib = funcion(n) {
+        si (n < 2) { regresa n; }
+        fib(n - 1) + fib(n - 2);
+    };
+    variable i = 0;
+    mientras (i < 5000) { i = i + 1; }
+    fib(18) + i;
+"""
+
+
+def _best(run: Callable[[], Optional[Object]]) -> float:
+
+    best = float("inf")
+
+    for _ in range(ROUNDS):
+
+        started = perf_counter()
+        result = run()
+        best = min(best, perf_counter() - started)
+
+        assert result is not None and result.inspect() == "7584"
+
+    return best
+
+
+def main() -> None:
+
+    setrecursionlimit(20_000)
+
+    program = Parser(TokenBuffer(SOURCE)).parse_program()
+
+    print(f"fib(18) y un ciclo de 5000 vueltas, mejor de {ROUNDS} rondas")
+
+    for name, evaluate in ENGINES.items():
+
+        unlimited = _best(lambda: evaluate(program, Environment()))
+        limited = _best(lambda: evaluate_with_budget(evaluate, program, Environment(), Budget(steps=10 ** 9, seconds=60)))
+
+        print(f"  {name:12} sin presupuesto {unlimited * 1000:8.2f} ms  con presupuesto {limited * 1000:8.2f} ms  (x{limited / unlimited:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.programs import generated_source
+from lpp.cache import ParseCache
+
+
+def main() -> None:
+
+    source: str = generated_source()
+
+    with TemporaryDirectory() as directory:
+
+        cache: ParseCache = ParseCache(directory)
+
+        # En frío no hay nada guardado: se lexea, se parsea y se escribe el cache
+        started = perf_counter()
+        cache.parse(source)
+        cold = perf_counter() - started
+
+        # En caliente el programa se carga directamente del archivo
+        started = perf_counter()
+        cache.parse(source)
+        warm = perf_counter() - started
+
+    print(f"Fuente de {len(source)} caracteres")
+    print(f"Arranque en frío     {cold * 1000:10.2f} ms")
+    print(f"Arranque en caliente {warm * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
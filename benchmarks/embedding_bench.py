@@ -0,0 +1,72 @@
+from time import perf_counter
+
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+import lpp
+from lpp.embedding import to_object
+from lpp.engines import ENGINES
+from lpp.evaluator import evaluate
+from lpp.lexer import Lexer
+from lpp.object import Environment
+from lpp.parser import Parser
+
+
+RUNS = 2_000
+
+# Unas reglas que se evalúan contra muchas entradas distintas
+RULES: str = """
+    variable limite = 100;
+    variable descuento = funcion(total) {
+        si (total > limite) { regresa total / 10; }
+        0;
+    };
+    variable extra = funcion(cliente) {
+        si (cliente == "frecuente") { regresa 5; }
+        si (cliente == "nuevo") { regresa 1; }
+        0;
+    };
+    descuento(total) + extra(cliente);
+"""
+
+
+def main() -> None:
+
+    inputs: List[Dict[str, Any]] = [{"total": n * 7, "cliente": "frecuente" if n % 2 else "nuevo"} for n in range(RUNS)]
+
+    # Lo que se hacía antes: lexear, parsear y evaluar el código completo con cada entrada
+    started = perf_counter()
+
+    for bindings in inputs:
+
+        env = Environment()
+
+        for name, value in bindings.items():
+            env[name] = to_object(value)
+
+        evaluate(Parser(Lexer(RULES)).parse_program(), env)
+
+    baseline = perf_counter() - started
+
+    print(f"{RUNS} ejecuciones de las mismas reglas")
+    print(f"  parseando cada vez       {baseline / RUNS * 1_000_000:8.1f} µs por ejecución")
+
+    for engine in ENGINES:
+
+        rules = lpp.compile(RULES, engine=engine)
+
+        started = perf_counter()
+
+        for bindings in inputs:
+            rules.run(bindings)
+
+        elapsed = perf_counter() - started
+
+        print(f"  compilado, {engine:12}  {elapsed / RUNS * 1_000_000:8.1f} µs por ejecución  (x{baseline / elapsed:.1f})")
+
+
+if __name__ == "__main__":
+    main()
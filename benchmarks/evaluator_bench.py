@@ -0,0 +1,74 @@
+from sys import setrecursionlimit
+from time import perf_counter
+
+from typing import Dict
+
+from lpp.ast import Program
+from lpp.engines import ENGINES
+from lpp.object import Environment
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+PROGRAMS: Dict[str, str] = {
+    "fib(20)": """
+        variable fib = funcion(n) {
+            si (n < 2) { regresa n; }
+            fib(n - 1) + fib(n - 2);
+        };
+        fib(20);
+    """,
+    "cadenas": """
+        variable construye = funcion(texto, n) {
+            si (n == 0) { regresa texto; }
+            construye(texto + "ab" + "c", n - 1);
+        };
+        variable repite = funcion(n) {
+            si (n == 0) { regresa 0; }
+            longitud(construye("", 100));
+            repite(n - 1);
+        };
+        repite(100);
+    """,
+    "closures": """
+        variable compone = funcion(f, g) { funcion(x) { f(g(x)) } };
+        variable suma = funcion(n) { funcion(x) { x + n } };
+        variable aplica = funcion(n, acumulado) {
+            si (n == 0) { regresa acumulado; }
+            aplica(n - 1, compone(suma(1), suma(2))(acumulado));
+        };
+        variable repite = funcion(n) {
+            si (n == 0) { regresa 0; }
+            aplica(100, 0);
+            repite(n - 1);
+        };
+        repite(100);
+    """,
+}
+
+
+def main() -> None:
+
+    # Los ciclos en lpp son recursión, y cada llamada de lpp son varios frames de Python
+    setrecursionlimit(20_000)
+
+    for name, source in PROGRAMS.items():
+
+        program: Program = Parser(TokenBuffer(source)).parse_program()
+        baseline = 0.0
+
+        print(name)
+
+        for backend_name, backend in ENGINES.items():
+
+            started = perf_counter()
+            result = backend(program, Environment())
+            elapsed = perf_counter() - started
+            baseline = baseline or elapsed
+
+            assert result is not None
+            print(f"  {backend_name:12} {elapsed * 1000:10.2f} ms  (x{baseline / elapsed:.2f})  {result.inspect()}")
+
+
+if __name__ == "__main__":
+    main()
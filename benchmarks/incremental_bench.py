@@ -0,0 +1,49 @@
+from timeit import timeit
+
+from typing import (
+    List,
+    Tuple
+)
+
+from benchmarks.programs import generated_source
+from lpp.incremental import IncrementalParser
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+def main() -> None:
+
+    source: str = generated_source()
+    parser: IncrementalParser = IncrementalParser(source)
+
+    # Editamos un número a la mitad del archivo, de ida y de regreso para que el código fuente no cambie de tamaño
+    start = source.index("funcion_500(500")
+    start = start + len("funcion_500(")
+    edits = [(start, start + 3, "123"), (start, start + 3, "500")]
+
+    # Y un salto de línea cerca del principio, que recorre la línea de todos los statements que siguen
+    newline = source.index("variable funcion_1 ")
+    newlines = [(newline, newline, "\n"), (newline, newline + 1, "")]
+
+    def edit(changes: List[Tuple[int, int, str]]) -> None:
+
+        for edit_start, edit_end, text in changes:
+            parser.edit(edit_start, edit_end, text)
+
+    full = timeit(lambda: Parser(TokenBuffer(parser.source)).parse_program(), number=3) / 3
+    incremental = timeit(lambda: edit(edits), number=50) / (50 * len(edits))
+    reparsed = parser.reparsed
+    new_line = timeit(lambda: edit(newlines), number=50) / (50 * len(newlines))
+
+    parser.edit(*newlines[0])
+    located = timeit(parser.located_program, number=3) / 3
+
+    print(f"Fuente de {len(source)} caracteres, {len(parser.program.statements)} statements")
+    print(f"Parseo completo      {full * 1000:10.3f} ms")
+    print(f"Edición incremental  {incremental * 1000:10.3f} ms ({reparsed} statements parseados de nuevo)")
+    print(f"Salto de línea       {new_line * 1000:10.3f} ms ({parser.reparsed} statements parseados de nuevo)")
+    print(f"located_program      {located * 1000:10.3f} ms (solo cuando se necesitan las posiciones)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+from sys import setrecursionlimit
+from time import perf_counter
+
+from typing import List
+
+import lpp.ast as ast
+from lpp.evaluator import (
+    _evaluate_identifier,
+    evaluate
+)
+from lpp.object import (
+    Environment,
+    Integer
+)
+from lpp.parser import Parser
+from lpp.token import (
+    Token,
+    TokenType
+)
+from lpp.token_buffer import TokenBuffer
+
+
+# Una función recursiva que en cada vuelta usa un builtin y dos globales
+SOURCE: str = """
+    variable texto = "abcdef";
+    variable paso = 1;
+    variable cuenta = funcion(n, total) {
+        si (n == 0) { regresa total; }
+        cuenta(n - paso, total + longitud(texto));
+    };
+    cuenta(20000, 0);
+"""
+
+ROUNDS = 10
+LOOKUPS = 500_000
+
+
+def main() -> None:
+
+    setrecursionlimit(20_000)
+
+    env = Environment()
+    env["texto"] = Integer(1)
+
+    print(f"{LOOKUPS} búsquedas de un identificador global")
+
+    for name in ("longitud", "texto"):
+
+        identifier = ast.Identifier(Token(TokenType.IDENT, name), name)
+        identifier.depth = 0
+        identifier.slot = ast.GLOBAL
+
+        started = perf_counter()
+
+        for _ in range(LOOKUPS):
+            _evaluate_identifier(identifier, env)
+
+        elapsed = perf_counter() - started
+
+        print(f"  {name:10} {elapsed / LOOKUPS * 1_000_000_000:8.1f} ns por búsqueda")
+
+    program = Parser(TokenBuffer(SOURCE)).parse_program()
+    times: List[float] = []
+    result = None
+
+    for _ in range(ROUNDS):
+        started = perf_counter()
+        result = evaluate(program, Environment())
+        times.append(perf_counter() - started)
+
+    assert result is not None
+
+    print(f"Globales y builtins en una función recursiva: {min(times) * 1000:8.2f} ms  {result.inspect()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from sys import setrecursionlimit
+from time import perf_counter
+
+from typing import (
+    Any,
+    Callable,
+    List,
+    Tuple
+)
+
+import lpp.object as lpp_object
+from lpp.evaluator import evaluate
+from lpp.object import (
+    configure_small_integers,
+    Environment,
+    Integer,
+    String
+)
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+FIB: str = """
+    variable fib = funcion(n) {
+        si (n < 2) { regresa n; }
+        fib(n - 1) + fib(n - 2);
+    };
+    fib(25);
+"""
+
+# Rangos de enteros preasignados que comparamos, el vacío equivale a no tener caché
+RANGES: List[Tuple[str, int, int]] = [
+    ("sin caché", 0, -1),
+    ("-5..256", -5, 256),
+    ("-5..1024", -5, 1024),
+    ("-5..100000", -5, 100_000),
+]
+
+
+# Cuenta cuántos objetos de una clase se crean, envolviendo su __init__
+def _counting(cls: Any, counter: List[int]) -> Callable[[], None]:
+
+    original = cls.__init__
+
+    def init(self: Any, *args: Any) -> None:
+        counter[0] += 1
+        original(self, *args)
+
+    cls.__init__ = init
+
+    def restore() -> None:
+        cls.__init__ = original
+
+    return restore
+
+
+def main() -> None:
+
+    setrecursionlimit(20_000)
+
+    default_range = (lpp_object.SMALL_INTEGER_MIN, lpp_object.SMALL_INTEGER_MAX)
+
+    print("fib(25) con el evaluador")
+
+    for name, minimum, maximum in RANGES:
+
+        configure_small_integers(minimum, maximum)
+
+        # Cada vez parseamos de nuevo para que los literales también empiecen sin su objeto
+        program = Parser(TokenBuffer(FIB)).parse_program()
+
+        integers: List[int] = [0]
+        strings: List[int] = [0]
+        restore_integers = _counting(Integer, integers)
+        restore_strings = _counting(String, strings)
+
+        started = perf_counter()
+        evaluate(program, Environment())
+        elapsed = perf_counter() - started
+
+        restore_integers()
+        restore_strings()
+
+        print(f"  {name:12} {integers[0]:9} Integer  {strings[0]:3} String  {elapsed * 1000:8.2f} ms")
+
+    configure_small_integers(*default_range)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from timeit import timeit
+
+from typing import (
+    Callable,
+    List,
+    Tuple
+)
+
+from benchmarks.programs import generated_source
+from lpp.lexer import (
+    Lexer,
+    RegexLexer,
+    TokenSource
+)
+from lpp.token import TokenType
+
+
+def _lex(lexer: TokenSource) -> int:
+
+    count = 0
+
+    while lexer.next_token().token_type != TokenType.EOF:
+        count += 1
+
+    return count
+
+
+def main() -> None:
+
+    source: str = generated_source()
+
+    engines: List[Tuple[str, Callable[[str], TokenSource]]] = [
+        ("Lexer", Lexer),
+        ("RegexLexer", RegexLexer),
+    ]
+
+    print(f"Fuente de {len(source)} caracteres, {_lex(RegexLexer(source))} tokens")
+
+    for name, engine in engines:
+
+        seconds = timeit(lambda: _lex(engine(source)), number=3) / 3
+        print(f"{name:<12} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from sys import setrecursionlimit
+from time import perf_counter
+
+from typing import Dict
+
+from lpp.ast import Program
+from lpp.engines import ENGINES
+from lpp.object import Environment
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+ITERATIONS = 2_000
+ROUNDS = 3
+
+# La misma suma hecha con un ciclo y con recursión de cola
+PROGRAMS: Dict[str, str] = {
+    "mientras": """
+        variable suma = 0;
+        variable i = 0;
+        mientras (i < {iterations}) {
+            suma = suma + i;
+            i = i + 1;
+        }
+        suma;
+    """,
+    "recursión": """
+        variable suma = funcion(i, acumulado) {
+            si (i == {iterations}) { regresa acumulado; }
+            suma(i + 1, acumulado + i)
+        };
+        suma(0, 0);
+    """,
+}
+
+
+def main() -> None:
+
+    # No todos los motores eliminan las llamadas de cola, la versión recursiva necesita espacio en la pila de Python
+    setrecursionlimit(50_000)
+
+    programs: Dict[str, Program] = {
+        name: Parser(TokenBuffer(source.replace("{iterations}", str(ITERATIONS)))).parse_program()
+        for name, source in PROGRAMS.items()
+    }
+
+    print(f"Suma de {ITERATIONS} números, mejor de {ROUNDS} rondas")
+
+    for backend_name, backend in ENGINES.items():
+
+        timings: Dict[str, float] = {}
+
+        for name, program in programs.items():
+
+            best = float("inf")
+
+            for _ in range(ROUNDS):
+
+                started = perf_counter()
+                result = backend(program, Environment())
+                best = min(best, perf_counter() - started)
+
+            assert result is not None and result.inspect() == str(sum(range(ITERATIONS)))
+            timings[name] = best
+
+        print(f"  {backend_name:12} mientras {timings['mientras'] * 1000:8.2f} ms  "
+              f"recursión {timings['recursión'] * 1000:8.2f} ms  "
+              f"(x{timings['recursión'] / timings['mientras']:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import tracemalloc
+
+from time import perf_counter
+
+from typing import (
+    Callable,
+    Dict,
+    List
+)
+
+from lpp.evaluator import (
+    _evaluate_infix_expression,
+    evaluate
+)
+from lpp.object import (
+    Boolean,
+    Error,
+    Integer,
+    Object,
+    String
+)
+from lpp.object import Environment
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+OBJECTS = 100_000
+OPERATIONS = 500_000
+
+ALLOCATIONS: Dict[str, Callable[[int], Object]] = {
+    "Integer": lambda idx: Integer(idx),
+    "Boolean": lambda idx: Boolean(idx % 2 == 0),
+    "String": lambda idx: String("abc"),
+    "Error": lambda idx: Error("mensaje", idx, idx),
+}
+
+# Cada operación pasa por _evaluate_infix_expression, que antes preguntaba el tipo de cada lado con type()
+OPERANDS: Dict[str, List[Object]] = {
+    "entero + entero": [Integer(1), Integer(2)],
+    "cadena + cadena": [String("a"), String("b")],
+    "entero == falso": [Integer(1), Boolean(False)],
+    "entero + cadena (error)": [Integer(1), String("a")],
+}
+
+FIB: str = """
+    variable fib = funcion(n) {
+        si (n < 2) { regresa n; }
+        fib(n - 1) + fib(n - 2);
+    };
+    fib(18);
+"""
+
+
+def _bytes_per_object(allocate: Callable[[int], Object]) -> float:
+
+    tracemalloc.start()
+
+    objects: List[Object] = [allocate(idx) for idx in range(OBJECTS)]
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    # Descontamos la lista que los guarda, los enteros de Python chicos ya existen
+    return (size - objects.__sizeof__()) / len(objects)
+
+
+def main() -> None:
+
+    print(f"Memoria por objeto ({OBJECTS} objetos)")
+
+    for name, allocate in ALLOCATIONS.items():
+        print(f"  {name:10} {_bytes_per_object(allocate):8.1f} bytes")
+
+    print(f"Operaciones infijas ({OPERATIONS} veces)")
+
+    for name, (left, right) in OPERANDS.items():
+
+        started = perf_counter()
+
+        for _ in range(OPERATIONS):
+            _evaluate_infix_expression("+" if "+" in name else "==", left, right)
+
+        elapsed = perf_counter() - started
+
+        print(f"  {name:25} {elapsed / OPERATIONS * 1_000_000_000:8.1f} ns por operación")
+
+    program = Parser(TokenBuffer(FIB)).parse_program()
+    times: List[float] = []
+
+    for _ in range(5):
+        started = perf_counter()
+        evaluate(program, Environment())
+        times.append(perf_counter() - started)
+
+    print(f"fib(18) con el evaluador {min(times) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
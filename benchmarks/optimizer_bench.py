@@ -0,0 +1,62 @@
+from time import perf_counter
+
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.object import Environment
+from lpp.optimizer import optimize
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+# Una función con expresiones constantes y una rama muerta que se llama muchas veces
+SOURCE: str = """
+    variable f = funcion(x) {
+        si (1 < 2) {
+            regresa x + 2 * 3 * 4 - (10 - 5) + -(-1);
+        } si_no {
+            regresa "nunca" + " pasa";
+        }
+        "inalcanzable";
+    };
+    variable repite = funcion(n) {
+        si (n == 0) { regresa 0; }
+        f(n);
+        repite(n - 1);
+    };
+    repite(100);
+"""
+
+ROUNDS = 100
+
+
+def _run(program: Program) -> float:
+
+    started = perf_counter()
+
+    for _ in range(ROUNDS):
+        evaluate(program, Environment())
+
+    return perf_counter() - started
+
+
+def _parse() -> Program:
+
+    return Parser(TokenBuffer(SOURCE)).parse_program()
+
+
+def main() -> None:
+
+    plain = _run(_parse())
+
+    started = perf_counter()
+    optimized_program = optimize(_parse())
+    optimizing = perf_counter() - started
+
+    optimized = _run(optimized_program)
+
+    print(f"Sin optimizar {plain * 1000:10.2f} ms")
+    print(f"Optimizado    {optimized * 1000:10.2f} ms  (x{plain / optimized:.2f}, la pasada tomó {optimizing * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
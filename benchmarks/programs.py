@@ -0,0 +1,23 @@
+from typing import List
+
+
+# Genera un programa grande y variado, parecido a los scripts generados que usamos en producción
+def generated_source(functions: int = 1000) -> str:
+
+    out: List[str] = []
+
+    for idx in range(functions):
+
+        out.append(f"""
+            variable funcion_{idx} = funcion(x, y) {{
+                variable saludo = "hola " + 'mundo {idx}';
+                si (x >= {idx} !== y <= 3) {{
+                    regresa x * {idx} + y / 2 - longitud(saludo);
+                }} si_no {{
+                    regresa !verdadero == falso;
+                }}
+            }};
+            funcion_{idx}({idx}, {idx + 1});
+        """)
+
+    return "".join(out)
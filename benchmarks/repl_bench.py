@@ -0,0 +1,52 @@
+from contextlib import redirect_stdout
+from io import StringIO
+from time import perf_counter
+
+from typing import List
+
+from lpp.object import Environment
+from lpp.repl import execute_program
+
+
+LINES = 1_000
+BUCKET = 100
+
+
+# Una sesión que va definiendo variables y funciones y usándolas, como la escribiría alguien en el REPL
+def _session() -> List[str]:
+
+    lines: List[str] = ["variable total = 0;", "variable suma = funcion(a, b) { a + b };"]
+
+    while len(lines) < LINES:
+
+        n = len(lines)
+        lines.append(f"variable x{n} = suma({n}, total);")
+        lines.append(f"total = total + x{n};")
+        lines.append(f"si (total > {n}) {{ x{n} }} si_no {{ total }};")
+
+    return lines[:LINES]
+
+
+def main() -> None:
+
+    env = Environment()
+    timings: List[float] = []
+
+    with redirect_stdout(StringIO()):
+
+        for line in _session():
+
+            started = perf_counter()
+            execute_program(line, env)
+            timings.append(perf_counter() - started)
+
+    print(f"Sesión de {LINES} líneas, tiempo promedio por línea")
+
+    for start in range(0, LINES, BUCKET):
+
+        bucket = timings[start:start + BUCKET]
+        print(f"  líneas {start + 1:4}-{start + len(bucket):4}  {sum(bucket) / len(bucket) * 1_000_000:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
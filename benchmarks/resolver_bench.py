@@ -0,0 +1,110 @@
+from sys import setrecursionlimit
+from time import perf_counter
+
+from typing import (
+    Any,
+    List,
+    Tuple
+)
+
+import lpp.ast as ast
+from lpp.evaluator import (
+    _evaluate_identifier,
+    evaluate
+)
+from lpp.object import (
+    Environment,
+    Frame,
+    Integer,
+    Object
+)
+from lpp.parser import Parser
+from lpp.token import (
+    Token,
+    TokenType
+)
+from lpp.token_buffer import TokenBuffer
+
+
+# Una función que usa variables de tres funciones hacia afuera, una global y un builtin en cada vuelta
+SOURCE: str = """
+    variable a = 1;
+    variable f = funcion(b) { funcion(c) { funcion(d) {
+        variable cuenta = funcion(n) {
+            si (n == 0) { regresa a + b + c + d; }
+            a + b + c + d + longitud("x");
+            cuenta(n - 1)
+        };
+        cuenta(3000)
+    } } };
+    f(1)(2)(3);
+"""
+
+LOOKUPS = 200_000
+ROUNDS = 10
+
+
+# La misma variable a depth funciones de distancia, una vez en ambientes con diccionario y otra en marcos con lista
+def _chains(depth: int) -> Tuple[Environment, Environment]:
+
+    value: Object = Integer(1)
+    scope = ast.Scope(["x"], {"x": 0}, 1)
+    empty_scope = ast.Scope([], {}, 0)
+
+    environment = Environment()
+    environment["x"] = value
+
+    frame: Environment = Frame(scope, [value], Environment())
+
+    for _ in range(depth):
+        environment = Environment(outer=environment)
+        frame = Frame(empty_scope, [], frame)
+
+    return environment, frame
+
+
+def _time_lookups(identifier: ast.Identifier, env: Environment) -> float:
+
+    started = perf_counter()
+
+    for _ in range(LOOKUPS):
+        _evaluate_identifier(identifier, env)
+
+    return perf_counter() - started
+
+
+def main() -> None:
+
+    setrecursionlimit(20_000)
+
+    print(f"{LOOKUPS} búsquedas de una variable")
+
+    for depth in range(4):
+
+        environment, frame = _chains(depth)
+
+        by_name = ast.Identifier(Token(TokenType.IDENT, "x"), "x")
+        resolved = ast.Identifier(Token(TokenType.IDENT, "x"), "x")
+        resolved.depth = depth
+        resolved.slot = 0
+
+        plain = _time_lookups(by_name, environment)
+        addressed = _time_lookups(resolved, frame)
+
+        print(f"  {depth} funciones hacia afuera  por nombre {plain * 1000:8.2f} ms  "
+              f"resuelta {addressed * 1000:8.2f} ms  (x{plain / addressed:.2f})")
+
+    program: ast.Program = Parser(TokenBuffer(SOURCE)).parse_program()
+    times: List[float] = []
+    result: Any = None
+
+    for _ in range(ROUNDS):
+        started = perf_counter()
+        result = evaluate(program, Environment())
+        times.append(perf_counter() - started)
+
+    print(f"Programa con variables de funciones de afuera {min(times) * 1000:8.2f} ms  {result.inspect()}")
+
+
+if __name__ == "__main__":
+    main()
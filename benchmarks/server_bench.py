@@ -0,0 +1,71 @@
+from os import path
+from subprocess import run
+from sys import executable
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter
+
+from lpp.server import (
+    Server,
+    submit
+)
+
+
+JOBS = 50
+
+SOURCE: str = """
+    variable fib = funcion(n) {
+        si (n < 2) { regresa n; }
+        fib(n - 1) + fib(n - 2);
+    };
+    fib(10);
+"""
+
+_MAIN = path.join(path.dirname(path.dirname(path.abspath(__file__))), "main.py")
+
+
+def main() -> None:
+
+    with TemporaryDirectory() as directory:
+
+        script = path.join(directory, "programa.lpp")
+        socket_path = path.join(directory, "lpp.sock")
+
+        with open(script, "w", encoding="utf-8") as file:
+            file.write(SOURCE)
+
+        started = perf_counter()
+
+        for _ in range(JOBS):
+            run([executable, _MAIN, script], check=True, capture_output=True)
+
+        processes = perf_counter() - started
+
+        started = perf_counter()
+        server = Server(socket_path, workers=1)
+        startup = perf_counter() - started
+
+        thread = Thread(target=server.serve_forever)
+        thread.start()
+
+        try:
+
+            started = perf_counter()
+
+            for _ in range(JOBS):
+                assert submit(socket_path, SOURCE)["resultado"] == "55"
+
+            served = perf_counter() - started
+
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    print(f"{JOBS} programas, fib(10)")
+    print(f"  un proceso por programa  {processes / JOBS * 1000:8.2f} ms por programa")
+    print(f"  servidor                 {served / JOBS * 1000:8.2f} ms por programa  (x{processes / served:.1f}, más {startup * 1000:.0f} ms al iniciar)")
+
+
+if __name__ == "__main__":
+    main()
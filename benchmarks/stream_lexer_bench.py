@@ -0,0 +1,68 @@
+import tracemalloc
+
+from os import remove
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+
+from typing import Callable
+
+from benchmarks.programs import generated_source
+from lpp.lexer import (
+    RegexLexer,
+    TokenSource
+)
+from lpp.stream_lexer import open_lexer
+from lpp.token import TokenType
+
+
+def _lex(lexer: TokenSource) -> int:
+
+    count = 0
+
+    while lexer.next_token().token_type != TokenType.EOF:
+        count += 1
+
+    return count
+
+
+def _lex_whole_file(path: str) -> int:
+
+    with open(path, encoding="utf-8") as file:
+        return _lex(RegexLexer(file.read()))
+
+
+def _lex_stream(path: str) -> int:
+
+    with open_lexer(path) as lexer:
+        return _lex(lexer)
+
+
+def _measure(name: str, run: Callable[[str], int], path: str) -> None:
+
+    tracemalloc.start()
+    started = perf_counter()
+
+    count = run(path)
+
+    elapsed = perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<14} {count} tokens {elapsed:6.2f} s pico de memoria {peak / 1024:10.1f} KiB")
+
+
+def main() -> None:
+
+    with NamedTemporaryFile("w", encoding="utf-8", suffix=".lpp", delete=False) as file:
+        file.write(generated_source(5000))
+
+    try:
+        _measure("archivo entero", _lex_whole_file, file.name)
+        _measure("StreamLexer", _lex_stream, file.name)
+
+    finally:
+        remove(file.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+from sys import setrecursionlimit
+from time import perf_counter
+
+from lpp.evaluator import evaluate
+from lpp.object import Environment
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+ITERATIONS = 10_000_000
+
+# Una cuenta regresiva donde la llamada recursiva es lo último de la función
+SOURCE: str = """
+    variable cuenta = funcion(n) {
+        si (n == 0) { regresa "listo"; }
+        cuenta(n - 1)
+    };
+    cuenta({iterations});
+"""
+
+
+def main() -> None:
+
+    # Sin eliminar las llamadas de cola cada vuelta serían varios frames de Python, con este límite no pasaría de unas decenas
+    setrecursionlimit(200)
+
+    program = Parser(TokenBuffer(SOURCE.replace("{iterations}", str(ITERATIONS)))).parse_program()
+
+    started = perf_counter()
+    result = evaluate(program, Environment())
+    elapsed = perf_counter() - started
+
+    assert result is not None
+
+    print(f"Cuenta regresiva de {ITERATIONS} con límite de recursión 200: {result.inspect()}")
+    print(f"  {elapsed:.2f} s  ({elapsed / ITERATIONS * 1_000_000:.2f} µs por llamada)")
+
+
+if __name__ == "__main__":
+    main()
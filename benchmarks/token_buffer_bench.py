@@ -0,0 +1,51 @@
+import tracemalloc
+
+from typing import List
+
+from benchmarks.programs import generated_source
+from lpp.lexer import RegexLexer
+from lpp.token import (
+    Token,
+    TokenType
+)
+from lpp.token_buffer import TokenBuffer
+
+
+def _token_list(source: str) -> List[Token]:
+
+    lexer: RegexLexer = RegexLexer(source)
+    tokens: List[Token] = []
+
+    while (token := lexer.next_token()).token_type != TokenType.EOF:
+        tokens.append(token)
+
+    tokens.append(token)
+
+    return tokens
+
+
+def _measure(name: str, source: str) -> None:
+
+    tracemalloc.start()
+
+    tokens = _token_list(source) if name == "List[Token]" else TokenBuffer(source)
+
+    # Medimos lo que sigue vivo mientras todavía tenemos la representación en memoria
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(tokens)
+
+    print(f"{name:<12} {count} tokens {current / count:8.1f} bytes por token")
+
+
+def main() -> None:
+
+    source: str = generated_source()
+
+    for name in ("List[Token]", "TokenBuffer"):
+        _measure(name, source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+from lpp.embedding import (
+    compile,
+    CompiledProgram,
+    ParseError
+)
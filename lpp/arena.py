@@ -0,0 +1,206 @@
+from array import array
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+import lpp.ast as ast
+from lpp.token import (
+    Token,
+    TokenType
+)
+
+
+# Por cada tipo de nodo: el atributo que guarda su valor literal, sus hijos fijos y su lista de hijos (si tiene)
+_SPECS: Dict[Type[ast.ASTNode], Tuple[Optional[str], Tuple[str, ...], Optional[str]]] = {
+    ast.Program: (None, (), "statements"),
+    ast.LetStatement: (None, ("name", "value"), None),
+    ast.AssignStatement: (None, ("name", "value"), None),
+    ast.ReturnStatement: (None, ("return_value",), None),
+    ast.ExpressionStatement: (None, ("expression",), None),
+    ast.Identifier: ("value", (), None),
+    ast.Integer: ("value", (), None),
+    ast.Boolean: ("value", (), None),
+    ast.StringLiteral: ("value", (), None),
+    ast.Prefix: ("operator", ("right",), None),
+    ast.Infix: ("operator", ("left", "right"), None),
+    ast.Block: (None, (), "statements"),
+    ast.If: (None, ("condition", "consequence", "alternative"), None),
+    ast.While: (None, ("condition", "body"), None),
+    ast.Function: (None, ("body",), "parameters"),
+    ast.Call: (None, ("function",), "arguments"),
+}
+
+# Lo que el resolver y el evaluador agregan a los nodos no se guarda en la arena, los nodos reconstruidos empiezan sin eso
+_RUNTIME_ATTRIBUTES: Dict[Type[ast.ASTNode], Tuple[str, ...]] = {
+    ast.Identifier: ("depth", "slot", "cached"),
+    ast.Block: ("scope",),
+    ast.Integer: ("constant",),
+    ast.StringLiteral: ("constant",),
+}
+
+_KINDS: List[Type[ast.ASTNode]] = list(_SPECS)
+_KIND_CODES: Dict[Type[ast.ASTNode], int] = {kind: code for code, kind in enumerate(_KINDS)}
+_TOKEN_TYPES: Dict[int, TokenType] = {token_type.value: token_type for token_type in TokenType}
+
+# Índice que usamos para "no hay nodo" o "no hay lista"
+_NONE = -1
+
+
+# Guarda un programa completo en arreglos planos (tipo de nodo, token, valor, hijos) y un pool de literales sin repetidos, en lugar de un objeto por nodo
+class Arena:
+
+    def __init__(self) -> None:
+
+        self.kinds: array = array("B")
+        self.token_types: array = array("B")
+        self.literals: array = array("i")
+        self.lines: array = array("i")
+        self.columns: array = array("i")
+        self.values: array = array("i")
+        self.first_child: array = array("i")
+        self.list_sizes: array = array("i")
+        self.children: array = array("i")
+        self.pool: List[Any] = []
+        self._pool_index: Dict[Tuple[type, Any], int] = {}
+
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+
+    @property
+    def root(self) -> int:
+        return len(self.kinds) - 1
+
+
+    def kind(self, index: int) -> Type[ast.ASTNode]:
+        return _KINDS[self.kinds[index]]
+
+
+    def token(self, index: int) -> Token:
+
+        return Token(_TOKEN_TYPES[self.token_types[index]],
+                     self.pool[self.literals[index]],
+                     self.lines[index],
+                     self.columns[index])
+
+
+    def value(self, index: int) -> Any:
+
+        value = self.values[index]
+        return None if value == _NONE else self.pool[value]
+
+
+    # Los hijos fijos primero y después los de la lista, _NONE donde el nodo no tiene ese hijo
+    def child_indexes(self, index: int) -> List[int]:
+
+        _, fixed, _ = _SPECS[self.kind(index)]
+        first = self.first_child[index]
+        size = len(fixed) + max(self.list_sizes[index], 0)
+
+        return list(self.children[first:first + size])
+
+
+    def _intern(self, value: Any) -> int:
+
+        # Guardamos también el tipo para que 1, verdadero y 1.0 no terminen siendo el mismo literal
+        key = (type(value), value)
+
+        index = self._pool_index.get(key)
+
+        if index is None:
+            index = self._pool_index[key] = len(self.pool)
+            self.pool.append(value)
+
+        return index
+
+
+# Aplana el árbol en post-orden, así cada nodo aparece después de sus hijos y la raíz queda al final
+def to_arena(program: ast.Program) -> Arena:
+
+    arena = Arena()
+    indexes: Dict[int, int] = {}
+    stack: List[Tuple[ast.ASTNode, bool]] = [(program, False)]
+
+    # Recorremos con una pila para soportar árboles tan profundos como los que produce IterativeParser
+    while stack:
+
+        node, visited = stack.pop()
+        value_attribute, fixed, list_attribute = _SPECS[type(node)]
+        items: Optional[List[Any]] = getattr(node, list_attribute) if list_attribute else []
+        children: List[Optional[ast.ASTNode]] = [getattr(node, name) for name in fixed] + list(items or [])
+
+        if not visited:
+
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children) if child is not None)
+            continue
+
+        arena.kinds.append(_KIND_CODES[type(node)])
+
+        if isinstance(node, ast.Program):
+            arena.token_types.append(TokenType.EOF.value)
+            arena.literals.append(arena._intern(""))
+            arena.lines.append(0)
+            arena.columns.append(0)
+
+        else:
+            token: Token = getattr(node, "token")
+            arena.token_types.append(token.token_type.value)
+            arena.literals.append(arena._intern(token.literal))
+            arena.lines.append(token.line)
+            arena.columns.append(token.column)
+
+        value = getattr(node, value_attribute) if value_attribute else None
+        arena.values.append(_NONE if value is None else arena._intern(value))
+
+        arena.first_child.append(len(arena.children))
+        arena.list_sizes.append(_NONE if items is None else len(items))
+        arena.children.extend(_NONE if child is None else indexes[id(child)] for child in children)
+
+        indexes[id(node)] = len(arena.kinds) - 1
+
+    # El índice del pool solo sirve mientras construimos la arena
+    arena._pool_index.clear()
+
+    return arena
+
+
+# Reconstruye los objetos del AST, como los hijos siempre van antes que sus padres basta con un solo recorrido hacia adelante
+def from_arena(arena: Arena) -> ast.Program:
+
+    nodes: List[Any] = []
+
+    for index in range(len(arena)):
+
+        kind = arena.kind(index)
+        value_attribute, fixed, list_attribute = _SPECS[kind]
+        node = kind.__new__(kind)
+
+        if kind is not ast.Program:
+            setattr(node, "token", arena.token(index))
+
+        if value_attribute:
+            setattr(node, value_attribute, arena.value(index))
+
+        for name in _RUNTIME_ATTRIBUTES.get(kind, ()):
+            setattr(node, name, None)
+
+        children = [None if child == _NONE else nodes[child] for child in arena.child_indexes(index)]
+
+        for name, child in zip(fixed, children):
+            setattr(node, name, child)
+
+        if list_attribute:
+            size = arena.list_sizes[index]
+            setattr(node, list_attribute, None if size == _NONE else children[len(fixed):])
+
+        nodes.append(node)
+
+    return nodes[arena.root]
@@ -4,8 +4,12 @@ from abc import (
 )
 
 from typing import (
+    Any,
+    Dict,
     List,
-    Optional
+    NamedTuple,
+    Optional,
+    Tuple
 )
 
 from lpp.token import Token
@@ -13,6 +17,10 @@ from lpp.token import Token
 
 class ASTNode(ABC):
 
+    # Sin __dict__ cada nodo guarda sus atributos en espacios fijos, los programas grandes ocupan mucha menos memoria
+    __slots__ = ()
+
+
     @abstractmethod
     def token_literal(self) -> str:
         pass
@@ -25,6 +33,9 @@ class ASTNode(ABC):
 
 class Statement(ASTNode):
 
+    __slots__ = ("token",)
+
+
     def __init__(self, token: Token) -> None:
         self.token = token
 
@@ -35,6 +46,9 @@ class Statement(ASTNode):
 
 class Expression(ASTNode):
 
+    __slots__ = ("token",)
+
+
     def __init__(self, token: Token) -> None:
         self.token = token
 
@@ -45,6 +59,9 @@ class Expression(ASTNode):
 
 class Program(ASTNode):
 
+    __slots__ = ("statements",)
+
+
     def __init__(self, statements: List[Statement]) -> None:
         self.statements = statements
 
@@ -68,14 +85,26 @@ class Program(ASTNode):
         return "".join(out)
 
 
+# Dirección de las variables que ninguna función declara: se buscan en el ambiente global y luego en los builtins
+GLOBAL = -1
+
+
 class Identifier(Expression):
 
+    # depth y slot los llena el resolver: cuántas funciones hacia afuera se declaró la variable y su lugar en el marco de esa función
+    # cached es el caché de los builtins: (referencia débil al ambiente global, su versión, valor encontrado), en una tupla para que otro hilo nunca vea una mezcla de dos
+    __slots__ = ("value", "depth", "slot", "cached")
+
+
     def __init__(self,
         token: Token,
         value: str) -> None:
 
         super().__init__(token)
         self.value = value
+        self.depth: Optional[int] = None
+        self.slot: Optional[int] = None
+        self.cached: Optional[Tuple[Any, int, Any]] = None
 
 
     def __str__(self) -> str:
@@ -84,6 +113,9 @@ class Identifier(Expression):
 
 class LetStatement(Statement):
 
+    __slots__ = ("name", "value")
+
+
     def __init__(self,
         token: Token,
         name: Optional[Identifier] = None,
@@ -99,8 +131,32 @@ class LetStatement(Statement):
         return f"{self.token_literal()} {str(self.name)} = {str(self.value)};"
 
 
+# Cambia el valor de una variable que ya existe: nombre = valor;
+class AssignStatement(Statement):
+
+    __slots__ = ("name", "value")
+
+
+    def __init__(self,
+        token: Token,
+        name: Optional[Identifier] = None,
+        value: Optional[Expression] = None) -> None:
+
+        super().__init__(token)
+        self.name = name
+        self.value = value
+
+
+    def __str__(self) -> str:
+
+        return f"{str(self.name)} = {str(self.value)};"
+
+
 class ReturnStatement(Statement):
 
+    __slots__ = ("return_value",)
+
+
     def __init__(self,
         token: Token,
         return_value: Optional[Expression] = None) -> None:
@@ -116,6 +172,9 @@ class ReturnStatement(Statement):
 
 class ExpressionStatement(Statement):
 
+    __slots__ = ("expression",)
+
+
     def __init__(self, 
                 token: Token,
                 expression: Optional[Expression] = None) -> None:
@@ -130,12 +189,17 @@ class ExpressionStatement(Statement):
 
 class Integer(Expression):
 
+    # constant es el objeto de lpp que produce este literal, el evaluador lo crea la primera vez y lo reutiliza
+    __slots__ = ("value", "constant")
+
+
     def __init__(self, 
                 token: Token,
                 value: Optional[int] = None) -> None:
 
         super().__init__(token)
         self.value = value
+        self.constant: Any = None
 
 
     def __str__(self) -> str:
@@ -144,6 +208,9 @@ class Integer(Expression):
 
 class Prefix(Expression):
 
+    __slots__ = ("operator", "right")
+
+
     def __init__(self, 
                 token: Token,
                 operator: str,
@@ -160,6 +227,9 @@ class Prefix(Expression):
 
 class Infix(Expression):
 
+    __slots__ = ("left", "operator", "right")
+
+
     def __init__(self, 
                 token: Token,
                 left: Expression,
@@ -178,6 +248,9 @@ class Infix(Expression):
 
 class Boolean(Expression):
 
+    __slots__ = ("value",)
+
+
     def __init__(self, 
                 token: Token,
                 value: Optional[bool] = None) -> None:
@@ -190,14 +263,27 @@ class Boolean(Expression):
         return self.token_literal()
 
 
+# Las variables de una función: primero los parámetros y luego las que declara con variable
+class Scope(NamedTuple):
+
+    names: List[str]
+    slots: Dict[str, int]
+    arity: int
+
+
 class Block(Statement):
 
+    # scope solo lo tienen los cuerpos de funciones que ya pasaron por el resolver
+    __slots__ = ("statements", "scope")
+
+
     def __init__(self, 
                 token: Token,
                 statements: List[Statement]) -> None:
 
         super().__init__(token)
         self.statements = statements
+        self.scope: Optional[Scope] = None
 
 
     def __str__(self) -> str:
@@ -209,6 +295,9 @@ class Block(Statement):
 
 class If(Expression):
 
+    __slots__ = ("condition", "consequence", "alternative")
+
+
     def __init__(self,
                 token: Token,
                 condition: Optional[Expression] = None,
@@ -234,6 +323,9 @@ class If(Expression):
 
 class Function(Expression):
 
+    __slots__ = ("parameters", "body")
+
+
     def __init__(self,
                 token: Token,
                 parameters: List[Identifier] = [],
@@ -255,6 +347,9 @@ class Function(Expression):
 
 class  Call(Expression):
 
+    __slots__ = ("function", "arguments")
+
+
     def __init__(self,
                 token: Token,
                 function: Expression,
@@ -276,14 +371,37 @@ class  Call(Expression):
 
 class  StringLiteral(Expression):
 
+    __slots__ = ("value", "constant")
+
+
     def __init__(self,
                 token: Token,
                 value: str) -> None:
 
         super().__init__(token)
         self.value = value
+        self.constant: Any = None
+
+
+    def __str__(self) -> str:
+
+        return f'"{self.value}"'
+
+class While(Statement):
+
+    __slots__ = ("condition", "body")
+
+
+    def __init__(self,
+                token: Token,
+                condition: Optional[Expression] = None,
+                body: Optional[Block] = None) -> None:
+
+        super().__init__(token)
+        self.condition = condition
+        self.body = body
 
 
     def __str__(self) -> str:
 
-        return super().__str__()
\ No newline at end of file
+        return f"{self.token_literal()} {str(self.condition)} {str(self.body)}"
\ No newline at end of file
@@ -0,0 +1,200 @@
+import json
+
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from os import (
+    cpu_count,
+    makedirs,
+    path,
+    replace,
+    walk
+)
+
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional
+)
+
+import lpp.ast
+import lpp.iterative_parser
+import lpp.lexer
+import lpp.parser
+import lpp.token
+import lpp.token_buffer
+from lpp.cache import CACHE_DIRECTORY
+from lpp.iterative_parser import IterativeParser
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+SCRIPT_EXTENSION = ".lpp"
+RESULTS_FILENAME = "validacion.json"
+MAX_RESULTS = 100_000
+
+_UNREADABLE_FILE = "No se pudo leer el archivo: {}"
+_PARSER_FAILURE = "Error interno del parser: {}: {}"
+
+
+class FileReport(NamedTuple):
+
+    path: str
+    digest: str
+    errors: List[str]
+    cached: bool = False
+
+
+# Resultados que ya conocemos, por hash del contenido, los llena el inicializador de cada proceso
+_known_results: Dict[str, List[str]] = {}
+
+
+def collect_files(paths: List[str]) -> List[str]:
+
+    files: List[str] = []
+
+    for entry in paths:
+
+        if path.isdir(entry):
+
+            for directory, _, names in walk(entry):
+                files.extend(path.join(directory, name) for name in sorted(names) if name.endswith(SCRIPT_EXTENSION))
+
+        else:
+            files.append(entry)
+
+    return files
+
+
+# Si cambia cualquier módulo por el que pasa validate_file, los errores guardados dejan de valer, así que forman parte de la llave del cache
+def parser_fingerprint() -> str:
+
+    digest = sha256()
+
+    for module in (lpp.token, lpp.lexer, lpp.token_buffer, lpp.ast, lpp.parser, lpp.iterative_parser):
+
+        assert module.__file__ is not None
+
+        with open(module.__file__, "rb") as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+def validate_file(filename: str) -> FileReport:
+
+    try:
+
+        with open(filename, "rb") as file:
+            data = file.read()
+
+        source = data.decode("utf-8")
+
+    except (OSError, UnicodeDecodeError) as error:
+        return FileReport(filename, "", [_UNREADABLE_FILE.format(error)])
+
+    digest = sha256(data).hexdigest()
+
+    if digest in _known_results:
+        return FileReport(filename, digest, _known_results[digest], cached=True)
+
+    # Sin recursión un archivo con miles de paréntesis anidados no puede tumbar al proceso, y cualquier otra falla queda como error de ese archivo
+    try:
+        parser: Parser = IterativeParser(TokenBuffer(source))
+        parser.parse_program()
+
+    except Exception as error:
+        return FileReport(filename, digest, [_PARSER_FAILURE.format(type(error).__name__, error)])
+
+    return FileReport(filename, digest, parser.errors)
+
+
+def _load_known_results(known: Dict[str, List[str]]) -> None:
+
+    global _known_results
+    _known_results = known
+
+
+class ResultCache:
+
+    def __init__(self, filename: str) -> None:
+
+        self._filename: str = filename
+        self._fingerprint: str = parser_fingerprint()
+        self.results: Dict[str, List[str]] = {}
+
+        try:
+
+            with open(filename, encoding="utf-8") as file:
+                data = json.load(file)
+
+            if data.get("parser") == self._fingerprint:
+                self.results = data["results"]
+
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+
+    def save(self) -> None:
+
+        makedirs(path.dirname(path.abspath(self._filename)), exist_ok=True)
+        temporary = f"{self._filename}.tmp"
+
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({"parser": self._fingerprint, "results": self.results}, file)
+
+        replace(temporary, self._filename)
+
+
+def default_results_path() -> str:
+
+    return path.join(CACHE_DIRECTORY, RESULTS_FILENAME)
+
+
+# Lexea y parsea todos los archivos repartidos en varios procesos, los que no cambiaron desde la última vez se saltan
+def validate(paths: List[str],
+             processes: Optional[int] = None,
+             results_path: Optional[str] = None) -> List[FileReport]:
+
+    files = collect_files(paths)
+    cache = ResultCache(results_path or default_results_path())
+    processes = processes or cpu_count() or 1
+
+    if processes == 1 or len(files) < 2:
+
+        _load_known_results(cache.results)
+        reports = [validate_file(filename) for filename in files]
+
+    else:
+
+        # Mandamos los archivos en grupos para no pagar la comunicación entre procesos por cada archivo
+        chunksize = max(1, len(files) // (processes * 4))
+
+        with ProcessPoolExecutor(max_workers=processes,
+                                 initializer=_load_known_results,
+                                 initargs=(cache.results,)) as executor:
+            reports = list(executor.map(validate_file, files, chunksize=chunksize))
+
+    current = {report.digest: report.errors for report in reports if report.digest}
+
+    # Si el cache creció demasiado nos quedamos solo con los archivos de esta corrida
+    if len(cache.results) + len(current) > MAX_RESULTS:
+        cache.results = {}
+
+    cache.results.update(current)
+    cache.save()
+
+    return reports
+
+
+def print_reports(reports: List[FileReport]) -> int:
+
+    failed = [report for report in reports if report.errors]
+    cached = sum(1 for report in reports if report.cached)
+
+    for report in failed:
+        for error in report.errors:
+            print(f"{report.path}: {error}")
+
+    print(f"{len(reports)} archivos validados, {len(failed)} con errores, {cached} sin cambios")
+
+    return 1 if failed else 0
@@ -0,0 +1,125 @@
+from threading import (
+    local,
+    Lock
+)
+from time import monotonic
+
+from typing import (
+    Callable,
+    Optional
+)
+
+import lpp.ast as ast
+from lpp.object import (
+    Environment,
+    Error,
+    Object
+)
+
+_STEPS_EXHAUSTED = "Se agotaron los {} pasos permitidos"
+_TIME_EXHAUSTED = "Se agotó el tiempo de {} segundos"
+_RECURSION_LIMIT = "Se excedió la profundidad máxima de llamadas"
+_MEMORY_EXHAUSTED = "Se agotó la memoria"
+
+# Cuántas evaluaciones con presupuesto hay en curso en todos los hilos, mientras sea cero los motores no revisan nada más
+active: int = 0
+
+_local = local()
+_lock = Lock()
+
+
+class BudgetExhausted(Exception):
+
+    def __init__(self, message: str) -> None:
+
+        super().__init__(message)
+        self.message = message
+
+
+# Un paso es una llamada a una función de lpp o una vuelta de un ciclo, lo único que puede hacer que un programa no termine
+class Budget:
+
+    __slots__ = ("steps", "seconds", "used", "timed_out", "_deadline")
+
+
+    def __init__(self, steps: Optional[int] = None, seconds: Optional[float] = None) -> None:
+
+        self.steps = steps
+        self.seconds = seconds
+        self.used: int = 0
+        self.timed_out: bool = False
+
+        # El tiempo corre desde que se crea el presupuesto, un mismo presupuesto puede usarse para varias evaluaciones
+        self._deadline: Optional[float] = None if seconds is None else monotonic() + seconds
+
+
+    def charge(self) -> None:
+
+        self.used += 1
+
+        if self.steps is not None and self.used > self.steps:
+            raise BudgetExhausted(_STEPS_EXHAUSTED.format(self.steps))
+
+        # Un solo paso puede tardar mucho (un ciclo que arma textos enormes), así que el reloj se lee en cada uno
+        if self._deadline is not None and monotonic() > self._deadline:
+            self.timed_out = True
+            raise BudgetExhausted(_TIME_EXHAUSTED.format(self.seconds))
+
+
+# Sin límites no hay presupuesto, así los motores no pagan nada
+def new_budget(steps: Optional[int] = None, seconds: Optional[float] = None) -> Optional[Budget]:
+
+    if steps is None and seconds is None:
+        return None
+
+    return Budget(steps, seconds)
+
+
+def current() -> Optional[Budget]:
+
+    return getattr(_local, "budget", None)
+
+
+# Los motores solo la llaman cuando active no es cero, así sin presupuesto cada paso cuesta una sola comparación
+def charge() -> None:
+
+    budget = current()
+
+    if budget is not None:
+        budget.charge()
+
+
+# Evalúa con cualquier motor y convierte el presupuesto agotado en un Error de lpp
+def evaluate_with_budget(evaluate: Callable[[ast.ASTNode, Environment], Optional[Object]],
+                         node: ast.ASTNode,
+                         env: Environment,
+                         budget: Budget) -> Optional[Object]:
+
+    global active
+
+    previous = current()
+    _local.budget = budget
+
+    with _lock:
+        active += 1
+
+    try:
+        return evaluate(node, env)
+
+    except BudgetExhausted as exhausted:
+        return Error(exhausted.message)
+
+    # Los motores que usan la pila de Python pueden llegar a su límite antes de agotar los pasos, eso también termina en un Error
+    except RecursionError:
+        return Error(_RECURSION_LIMIT)
+
+    # Un programa que arma valores cada vez más grandes termina igual que uno que se queda sin pasos, sin tumbar al proceso
+    except MemoryError:
+        return Error(_MEMORY_EXHAUSTED)
+
+    finally:
+
+        _local.budget = previous
+
+        with _lock:
+            active -= 1
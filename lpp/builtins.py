@@ -25,7 +25,7 @@ def longitud(*args: Object) -> Object:
         return Integer(len(argument.value))
 
     else:
-        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].TYPE.name))
 
 
 BUILTINS: Dict[str, Builtin] = {
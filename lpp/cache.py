@@ -0,0 +1,306 @@
+import marshal
+
+from hashlib import sha256
+from os import (
+    listdir,
+    makedirs,
+    path,
+    remove,
+    replace,
+    stat,
+    utime
+)
+from sys import version_info
+
+from typing import (
+    Any,
+    cast,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+import lpp.ast as ast
+from lpp.parser import Parser
+from lpp.token import (
+    Token,
+    TokenType
+)
+from lpp.token_buffer import TokenBuffer
+
+
+# Cambia cada vez que cambia la forma en que serializamos el AST, así los caches viejos simplemente dejan de coincidir
+FORMAT_VERSION = 2
+
+MAGIC = b"LPPC"
+CACHE_DIRECTORY = "__lppcache__"
+CACHE_EXTENSION = ".lppc"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# marshal cambia de formato entre versiones de Python, por eso también forma parte de la versión del cache
+_HEADER = MAGIC + bytes([FORMAT_VERSION, version_info[0], version_info[1], marshal.version])
+_DIGEST_SIZE = 32
+
+_TOKEN_TYPES: Dict[int, TokenType] = {token_type.value: token_type for token_type in TokenType}
+
+_NODE_KINDS: List[Type[ast.ASTNode]] = [
+    ast.AssignStatement,
+    ast.Block,
+    ast.Boolean,
+    ast.Call,
+    ast.ExpressionStatement,
+    ast.Function,
+    ast.Identifier,
+    ast.If,
+    ast.Infix,
+    ast.Integer,
+    ast.LetStatement,
+    ast.Prefix,
+    ast.ReturnStatement,
+    ast.StringLiteral,
+    ast.While,
+]
+_KIND_CODES: Dict[Type[ast.ASTNode], int] = {kind: code for code, kind in enumerate(_NODE_KINDS)}
+
+
+def source_hash(source: str) -> bytes:
+
+    return sha256(source.encode("utf-8")).digest()
+
+
+# Convierte el programa en tuplas anidadas de enteros y strings, que marshal guarda de forma compacta y carga muy rápido
+def dump_program(program: ast.Program, source: str) -> bytes:
+
+    statements = tuple(_encode(statement) for statement in program.statements)
+
+    return _HEADER + source_hash(source) + marshal.dumps(statements)
+
+
+# Regresa None si los datos no son de esta versión o no corresponden a este código fuente
+def load_program(data: bytes, source: str) -> Optional[ast.Program]:
+
+    if data[:len(_HEADER)] != _HEADER:
+        return None
+
+    digest_end = len(_HEADER) + _DIGEST_SIZE
+
+    if data[len(_HEADER):digest_end] != source_hash(source):
+        return None
+
+    try:
+        statements = marshal.loads(data[digest_end:])
+
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    return ast.Program(statements=_decode_list(statements))
+
+
+class ParseCache:
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+
+        self._directory: str = directory
+        self._max_bytes: int = max_bytes
+
+
+    def load(self, source: str) -> Optional[ast.Program]:
+
+        filename = self._filename(source)
+
+        try:
+
+            with open(filename, "rb") as file:
+                data = file.read()
+
+        except OSError:
+            return None
+
+        program = load_program(data, source)
+
+        # Tocamos el archivo para que la limpieza borre primero los que llevan más tiempo sin usarse
+        if program is not None:
+
+            try:
+                utime(filename)
+
+            # Un cache que se puede leer pero no modificar sigue sirviendo
+            except OSError:
+                pass
+
+        return program
+
+
+    def store(self, source: str, program: ast.Program) -> None:
+
+        filename = self._filename(source)
+        temporary = f"{filename}.tmp"
+
+        makedirs(self._directory, exist_ok=True)
+
+        # Escribimos a un archivo temporal y lo movemos, así otro proceso nunca lee un cache a medio escribir
+        with open(temporary, "wb") as file:
+            file.write(dump_program(program, source))
+
+        replace(temporary, filename)
+
+        self._evict()
+
+
+    # Parsea el código fuente o lo carga del cache si ya lo habíamos parseado, solo los programas sin errores se guardan
+    def parse(self, source: str) -> Tuple[ast.Program, List[str]]:
+
+        program = self.load(source)
+
+        if program is not None:
+            return program, []
+
+        parser: Parser = Parser(TokenBuffer(source))
+        program = parser.parse_program()
+
+        if len(parser.errors) == 0:
+
+            try:
+                self.store(source, program)
+
+            # Igual que al correr un archivo, si no se puede escribir la próxima vez se parsea de nuevo
+            except OSError:
+                pass
+
+        return program, parser.errors
+
+
+    def _evict(self) -> None:
+
+        entries: List[Tuple[float, int, str]] = []
+
+        for name in listdir(self._directory):
+
+            if not name.endswith(CACHE_EXTENSION):
+                continue
+
+            filename = path.join(self._directory, name)
+
+            try:
+                info = stat(filename)
+
+            except OSError:
+                continue
+
+            entries.append((info.st_mtime, info.st_size, filename))
+
+        total = sum(size for _, size, _ in entries)
+
+        # Borramos los que llevan más tiempo sin usarse hasta quedar dentro del límite
+        for _, size, filename in sorted(entries):
+
+            if total <= self._max_bytes:
+                break
+
+            try:
+                remove(filename)
+
+            except OSError:
+                pass
+
+            total -= size
+
+
+    def _filename(self, source: str) -> str:
+
+        return path.join(self._directory, source_hash(source).hex() + CACHE_EXTENSION)
+
+
+# El cache de un script vive en __lppcache__ junto a él, igual que __pycache__
+def script_cache(script: str, max_bytes: int = DEFAULT_MAX_BYTES) -> ParseCache:
+
+    return ParseCache(path.join(path.dirname(path.abspath(script)), CACHE_DIRECTORY), max_bytes)
+
+
+def _encode_token(token: Token) -> Tuple[int, str, int, int]:
+
+    return (token.token_type.value, token.literal, token.line, token.column)
+
+
+def _encode(node: Optional[ast.ASTNode]) -> Any:
+
+    if node is None:
+        return None
+
+    kind = _KIND_CODES[type(node)]
+    token = _encode_token(cast(ast.Expression, node).token)
+
+    if isinstance(node, (ast.Identifier, ast.StringLiteral, ast.Integer, ast.Boolean)):
+        return (kind, token, node.value)
+
+    elif isinstance(node, (ast.LetStatement, ast.AssignStatement)):
+        return (kind, token, _encode(node.name), _encode(node.value))
+
+    elif isinstance(node, ast.ReturnStatement):
+        return (kind, token, _encode(node.return_value))
+
+    elif isinstance(node, ast.ExpressionStatement):
+        return (kind, token, _encode(node.expression))
+
+    elif isinstance(node, ast.Prefix):
+        return (kind, token, node.operator, _encode(node.right))
+
+    elif isinstance(node, ast.Infix):
+        return (kind, token, _encode(node.left), node.operator, _encode(node.right))
+
+    elif isinstance(node, ast.Block):
+        return (kind, token, tuple(_encode(statement) for statement in node.statements))
+
+    elif isinstance(node, ast.If):
+        return (kind, token, _encode(node.condition), _encode(node.consequence), _encode(node.alternative))
+
+    elif isinstance(node, ast.While):
+        return (kind, token, _encode(node.condition), _encode(node.body))
+
+    elif isinstance(node, ast.Function):
+        return (kind, token, tuple(_encode(parameter) for parameter in node.parameters), _encode(node.body))
+
+    elif isinstance(node, ast.Call):
+        arguments = None if node.arguments is None else tuple(_encode(argument) for argument in node.arguments)
+        return (kind, token, _encode(node.function), arguments)
+
+    raise TypeError(f"No se puede serializar {type(node).__name__}")
+
+
+def _decode(data: Any) -> Any:
+
+    if data is None:
+        return None
+
+    token_data = data[1]
+    token = Token(_TOKEN_TYPES[token_data[0]], token_data[1], token_data[2], token_data[3])
+
+    return _DECODERS[data[0]](data, token)
+
+
+def _decode_list(data: Any) -> Any:
+
+    return None if data is None else [_decode(item) for item in data]
+
+
+# Una función por tipo de nodo, en el mismo orden que _NODE_KINDS, para no recorrer una cadena de if/elif por cada nodo al cargar
+_DECODERS: List[Callable[[Any, Token], ast.ASTNode]] = [
+    lambda data, token: ast.AssignStatement(token, _decode(data[2]), _decode(data[3])),
+    lambda data, token: ast.Block(token, _decode_list(data[2])),
+    lambda data, token: ast.Boolean(token, data[2]),
+    lambda data, token: ast.Call(token, _decode(data[2]), _decode_list(data[3])),
+    lambda data, token: ast.ExpressionStatement(token, _decode(data[2])),
+    lambda data, token: ast.Function(token, _decode_list(data[2]), _decode(data[3])),
+    lambda data, token: ast.Identifier(token, data[2]),
+    lambda data, token: ast.If(token, _decode(data[2]), _decode(data[3]), _decode(data[4])),
+    lambda data, token: ast.Infix(token, _decode(data[2]), data[3], _decode(data[4])),
+    lambda data, token: ast.Integer(token, data[2]),
+    lambda data, token: ast.LetStatement(token, _decode(data[2]), _decode(data[3])),
+    lambda data, token: ast.Prefix(token, data[2], _decode(data[3])),
+    lambda data, token: ast.ReturnStatement(token, _decode(data[2])),
+    lambda data, token: ast.StringLiteral(token, data[2]),
+    lambda data, token: ast.While(token, _decode(data[2]), _decode(data[3])),
+]
@@ -0,0 +1,457 @@
+from operator import (
+    add,
+    eq,
+    floordiv,
+    ge,
+    gt,
+    le,
+    lt,
+    mul,
+    ne,
+    sub
+)
+
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    List,
+    Optional
+)
+
+import lpp.ast as ast
+import lpp.budget as budget
+from lpp.builtins import BUILTINS
+from lpp.evaluator import (
+    _apply_function,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _locate_error,
+    _new_error,
+    _UNKNOWN_IDENTIFIER,
+    FALSE,
+    NULL,
+    TRUE
+)
+from lpp.object import (
+    Environment,
+    Error,
+    Function,
+    Integer,
+    Object,
+    Return,
+    String,
+    to_integer_object
+)
+
+
+# Cada nodo se compila una sola vez a una función de Python que recibe el ambiente y regresa lo mismo que regresaría evaluate
+Code = Callable[[Environment], Optional[Object]]
+
+_ARITHMETIC_OPERATORS: Dict[str, Callable[[int, int], int]] = {
+    "+": add,
+    "-": sub,
+    "*": mul,
+    "/": floordiv,
+}
+
+_COMPARISON_OPERATORS: Dict[str, Callable[[int, int], bool]] = {
+    "<": lt,
+    ">": gt,
+    "<=": le,
+    ">=": ge,
+    "==": eq,
+    "===": eq,
+    "!=": ne,
+    "!==": ne,
+}
+
+
+# Una función de lpp que además de su cuerpo guarda el código ya compilado del cuerpo
+class CompiledFunction(Function):
+
+    __slots__ = ("code", "names")
+
+
+    def __init__(self,
+                 parameters: List[ast.Identifier],
+                 body: ast.Block,
+                 env: Environment,
+                 code: Code,
+                 names: List[str]) -> None:
+
+        super().__init__(parameters, body, env)
+        self.code = code
+        self.names = names
+
+
+def evaluate(node: ast.ASTNode, env: Environment, keep_return: bool = False) -> Optional[Object]:
+
+    if type(node) == ast.Program:
+        return _compile_program(cast(ast.Program, node), keep_return)(env)
+
+    return compile_node(node)(env)
+
+
+def compile_node(node: ast.ASTNode) -> Code:
+
+    node_type = type(node)
+
+    if node_type == ast.Program:
+        return _compile_program(cast(ast.Program, node))
+
+    elif node_type == ast.ExpressionStatement:
+
+        node = cast(ast.ExpressionStatement, node)
+
+        assert node.expression is not None
+        return compile_node(node.expression)
+
+    elif node_type == ast.Integer:
+
+        node = cast(ast.Integer, node)
+
+        assert node.value is not None
+
+        # Los enteros nunca se modifican, así que el mismo objeto sirve para todas las evaluaciones
+        integer = to_integer_object(node.value)
+        return lambda env: integer
+
+    elif node_type == ast.Boolean:
+
+        node = cast(ast.Boolean, node)
+
+        boolean = TRUE if node.value else FALSE
+        return lambda env: boolean
+
+    elif node_type == ast.StringLiteral:
+
+        node = cast(ast.StringLiteral, node)
+
+        string = String(node.value)
+        return lambda env: string
+
+    elif node_type == ast.Prefix:
+        return _compile_prefix(cast(ast.Prefix, node))
+
+    elif node_type == ast.Infix:
+        return _compile_infix(cast(ast.Infix, node))
+
+    elif node_type == ast.Block:
+        return _compile_block(cast(ast.Block, node))
+
+    elif node_type == ast.If:
+        return _compile_if(cast(ast.If, node))
+
+    elif node_type == ast.ReturnStatement:
+
+        node = cast(ast.ReturnStatement, node)
+
+        assert node.return_value is not None
+        value = compile_node(node.return_value)
+
+        return lambda env: Return(cast(Object, value(env)))
+
+    elif node_type == ast.LetStatement:
+        return _compile_let(cast(ast.LetStatement, node))
+
+    elif node_type == ast.AssignStatement:
+        return _compile_assign(cast(ast.AssignStatement, node))
+
+    elif node_type == ast.While:
+        return _compile_while(cast(ast.While, node))
+
+    elif node_type == ast.Identifier:
+        return _compile_identifier(cast(ast.Identifier, node))
+
+    elif node_type == ast.Function:
+        return _compile_function(cast(ast.Function, node))
+
+    elif node_type == ast.Call:
+        return _compile_call(cast(ast.Call, node))
+
+    return lambda env: None
+
+
+def _compile_program(program: ast.Program, keep_return: bool = False) -> Code:
+
+    codes = [compile_node(statement) for statement in program.statements]
+
+    def run_program(env: Environment) -> Optional[Object]:
+
+        result: Optional[Object] = None
+
+        for code in codes:
+
+            result = code(env)
+
+            if type(result) is Return:
+                return result if keep_return else cast(Return, result).value
+
+            elif type(result) is Error:
+                return result
+
+        return result
+
+    return run_program
+
+
+def _compile_block(block: ast.Block) -> Code:
+
+    codes = [compile_node(statement) for statement in block.statements]
+
+    # Un bloque de un solo statement regresa exactamente lo que regresa ese statement
+    if len(codes) == 1:
+        return codes[0]
+
+    def run_block(env: Environment) -> Optional[Object]:
+
+        result: Optional[Object] = None
+
+        for code in codes:
+
+            result = code(env)
+
+            if type(result) is Return or type(result) is Error:
+                return result
+
+        return result
+
+    return run_block
+
+
+def _compile_if(if_expression: ast.If) -> Code:
+
+    assert if_expression.condition is not None and if_expression.consequence is not None
+
+    condition = compile_node(if_expression.condition)
+    consequence = compile_node(if_expression.consequence)
+    alternative = compile_node(if_expression.alternative) if if_expression.alternative is not None else None
+
+    def run_if(env: Environment) -> Optional[Object]:
+
+        value = condition(env)
+
+        if value is not NULL and value is not FALSE:
+            return consequence(env)
+
+        elif alternative is not None:
+            return alternative(env)
+
+        return NULL
+
+    return run_if
+
+
+def _compile_let(let_statement: ast.LetStatement) -> Code:
+
+    assert let_statement.name is not None and let_statement.value is not None
+
+    name = let_statement.name.value
+    value = compile_node(let_statement.value)
+
+    def run_let(env: Environment) -> None:
+        env[name] = value(env)
+
+    return run_let
+
+
+def _compile_assign(assign_statement: ast.AssignStatement) -> Code:
+
+    assert assign_statement.name is not None and assign_statement.value is not None
+
+    identifier = assign_statement.name
+    name = identifier.value
+    value = compile_node(assign_statement.value)
+
+    def run_assign(env: Environment) -> Optional[Object]:
+
+        if not env.assign(name, value(env)):
+            return _locate_error(_new_error(_UNKNOWN_IDENTIFIER, [name]), identifier)
+
+        return None
+
+    return run_assign
+
+
+def _compile_while(while_statement: ast.While) -> Code:
+
+    assert while_statement.condition is not None and while_statement.body is not None
+
+    condition = compile_node(while_statement.condition)
+    body = _compile_block(while_statement.body)
+
+    def run_while(env: Environment) -> Optional[Object]:
+
+        while True:
+
+            if budget.active:
+                budget.charge()
+
+            value = condition(env)
+
+            if type(value) is Error:
+                return value
+
+            if value is NULL or value is FALSE:
+                return None
+
+            result = body(env)
+
+            if type(result) is Return or type(result) is Error:
+                return result
+
+    return run_while
+
+
+def _compile_identifier(identifier: ast.Identifier) -> Code:
+
+    name = identifier.value
+    builtin = BUILTINS.get(name)
+
+    # Recorremos la cadena de ambientes directamente, sin lanzar un KeyError por cada nivel como Environment.__getitem__
+    def load(env: Environment) -> Object:
+
+        scope: Optional[Environment] = env
+
+        while scope is not None:
+
+            store = scope._store
+
+            if name in store:
+                return store[name]
+
+            scope = scope._outer
+
+        if builtin is not None:
+            return builtin
+
+        return _locate_error(_new_error(_UNKNOWN_IDENTIFIER, [name]), identifier)
+
+    return load
+
+
+def _compile_prefix(prefix: ast.Prefix) -> Code:
+
+    assert prefix.right is not None
+
+    operator = prefix.operator
+    right = compile_node(prefix.right)
+
+    if operator == "!":
+
+        def run_bang(env: Environment) -> Object:
+
+            value = right(env)
+
+            return TRUE if value is FALSE or value is NULL else FALSE
+
+        return run_bang
+
+    def run_prefix(env: Environment) -> Object:
+
+        value = cast(Object, right(env))
+
+        if operator == "-" and type(value) is Integer:
+            return to_integer_object(-cast(Integer, value).value)
+
+        return _locate_error(_evaluate_prefix_expression(operator, value), prefix)
+
+    return run_prefix
+
+
+def _compile_infix(infix: ast.Infix) -> Code:
+
+    assert infix.left is not None and infix.right is not None
+
+    operator = infix.operator
+    left = compile_node(infix.left)
+    right = compile_node(infix.right)
+
+    # Cualquier combinación que no sea entero con entero se resuelve igual que en el evaluador, incluidos los errores
+    def fallback(left_value: Any, right_value: Any) -> Object:
+        return _locate_error(_evaluate_infix_expression(operator, left_value, right_value), infix)
+
+    if operator in _ARITHMETIC_OPERATORS:
+
+        arithmetic = _ARITHMETIC_OPERATORS[operator]
+
+        def run_arithmetic(env: Environment) -> Object:
+
+            left_value: Any = left(env)
+            right_value: Any = right(env)
+
+            if type(left_value) is Integer and type(right_value) is Integer:
+                return to_integer_object(arithmetic(left_value.value, right_value.value))
+
+            return fallback(left_value, right_value)
+
+        return run_arithmetic
+
+    elif operator in _COMPARISON_OPERATORS:
+
+        comparison = _COMPARISON_OPERATORS[operator]
+
+        def run_comparison(env: Environment) -> Object:
+
+            left_value: Any = left(env)
+            right_value: Any = right(env)
+
+            if type(left_value) is Integer and type(right_value) is Integer:
+                return TRUE if comparison(left_value.value, right_value.value) else FALSE
+
+            return fallback(left_value, right_value)
+
+        return run_comparison
+
+    return lambda env: fallback(left(env), right(env))
+
+
+def _compile_function(function: ast.Function) -> Code:
+
+    assert function.body is not None
+
+    parameters = function.parameters
+    body = function.body
+    names = [parameter.value for parameter in parameters]
+    code = _compile_block(body)
+
+    return lambda env: CompiledFunction(parameters, body, env, code, names)
+
+
+def _compile_call(call: ast.Call) -> Code:
+
+    assert call.arguments is not None
+
+    function = compile_node(call.function)
+    arguments = [compile_node(argument) for argument in call.arguments]
+
+    def run_call(env: Environment) -> Object:
+
+        fn: Any = function(env)
+        args: List[Any] = [argument(env) for argument in arguments]
+
+        if type(fn) is CompiledFunction and len(args) == len(fn.names):
+
+            if budget.active:
+                budget.charge()
+
+            scope = Environment(outer=fn.env)
+            scope._store.update(zip(fn.names, args))
+
+            result: Any = fn.code(scope)
+
+            if type(result) is Return:
+                return result.value
+
+        # Builtins, funciones creadas por el evaluador y llamadas con otro número de argumentos
+        else:
+            result = _apply_function(fn, args)
+
+        if type(result) is Error:
+            return _locate_error(result, call)
+
+        return result
+
+    return run_call
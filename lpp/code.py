@@ -0,0 +1,131 @@
+from enum import (
+    IntEnum,
+    unique
+)
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Tuple
+)
+
+import lpp.ast as ast
+from lpp.object import String
+
+
+@unique
+class OpCode(IntEnum):
+
+    CONSTANT = 0 # Mete al stack la constante número operand
+    POP = 1
+    TRUE = 2
+    FALSE = 3
+    NULL = 4
+    NONE = 5 # El valor de un bloque vacío o que termina en variable, igual que el None de evaluate
+    ADD = 6
+    SUB = 7
+    MUL = 8
+    DIV = 9
+    EQUAL = 10
+    NOT_EQUAL = 11
+    LESS_THAN = 12
+    GREATER_THAN = 13
+    LESS_EQUAL = 14
+    GREATER_EQUAL = 15
+    MINUS = 16
+    BANG = 17
+    JUMP = 18
+    JUMP_NOT_TRUTHY = 19 # Saca la condición del stack y salta si es falso o nulo
+    POP_UNLESS_ERROR = 20 # Si lo de hasta arriba es un error o un Return salta dejándolo en el stack, si no lo saca
+    GET_NAME = 21 # Busca en los ambientes el nombre guardado en la constante operand
+    SET_NAME = 22
+    CLOSURE = 23 # Crea una función con la plantilla de la constante operand y el ambiente actual
+    CALL = 24 # operand es el número de argumentos
+    RETURN_VALUE = 25 # Con operand 1 es el final de un cuerpo y desenvuelve un Return, igual que el evaluador
+    JUMP_IF_ERROR = 26 # Si lo de hasta arriba es un error salta dejándolo en el stack, si no, no hace nada
+    ASSIGN_NAME = 27 # Cambia la variable ya existente de la constante operand, deja None o un error si no existe
+    MAKE_RETURN = 28 # Envuelve lo de hasta arriba en un Return, para un regresa dentro de un si usado como expresión
+
+
+# Los operadores que usamos en los mensajes de error, los mismos que produce el evaluador
+OPERATORS: Dict[OpCode, str] = {
+    OpCode.ADD: "+",
+    OpCode.SUB: "-",
+    OpCode.MUL: "*",
+    OpCode.DIV: "/",
+    OpCode.EQUAL: "==",
+    OpCode.NOT_EQUAL: "!=",
+    OpCode.LESS_THAN: "<",
+    OpCode.GREATER_THAN: ">",
+    OpCode.LESS_EQUAL: "<=",
+    OpCode.GREATER_EQUAL: ">=",
+}
+
+_JUMPS = (OpCode.JUMP, OpCode.JUMP_NOT_TRUTHY, OpCode.POP_UNLESS_ERROR, OpCode.JUMP_IF_ERROR)
+_WITH_OPERAND = (OpCode.CONSTANT, OpCode.GET_NAME, OpCode.SET_NAME, OpCode.ASSIGN_NAME, OpCode.CLOSURE, OpCode.CALL, OpCode.RETURN_VALUE) + _JUMPS
+
+
+# Todas las instrucciones miden lo mismo: el opcode y un operando (0 si no usa), así la máquina virtual no tiene que decodificar nada
+INSTRUCTION_SIZE = 2
+
+
+class Bytecode(NamedTuple):
+
+    instructions: List[int]
+    constants: List[Any]
+    # Línea y columna de las instrucciones que pueden producir un error
+    positions: Dict[int, Tuple[int, int]]
+
+
+# Lo que el compilador sabe de una función literal, la máquina virtual le agrega el ambiente al crear la función
+class FunctionCode(NamedTuple):
+
+    parameters: List[ast.Identifier]
+    body: ast.Block
+    names: List[str]
+    bytecode: Bytecode
+
+
+def disassemble(bytecode: Bytecode, name: str = "programa") -> str:
+
+    out: List[str] = [f"{name}:"]
+    functions: List[Tuple[str, FunctionCode]] = []
+    instructions = bytecode.instructions
+
+    for ip in range(0, len(instructions), INSTRUCTION_SIZE):
+
+        op = OpCode(instructions[ip])
+        operand = instructions[ip + 1]
+        line = f"{ip:04d} {op.name}"
+
+        if op in _WITH_OPERAND:
+            line += f" {operand}"
+
+        if op in (OpCode.CONSTANT, OpCode.GET_NAME, OpCode.SET_NAME, OpCode.ASSIGN_NAME):
+            line += f" ({_describe(bytecode.constants[operand])})"
+
+        elif op == OpCode.CLOSURE:
+            function_name = f"funcion_{operand}"
+            functions.append((function_name, bytecode.constants[operand]))
+            line += f" ({function_name})"
+
+        out.append(line)
+
+    for function_name, function in functions:
+        out.append("")
+        out.append(disassemble(function.bytecode, f"{function_name}({', '.join(function.names)})"))
+
+    return "\n".join(out)
+
+
+def _describe(constant: Any) -> str:
+
+    if isinstance(constant, str):
+        return constant
+
+    elif isinstance(constant, String):
+        return f'"{constant.value}"'
+
+    return constant.inspect()
@@ -0,0 +1,331 @@
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import lpp.ast as ast
+from lpp.code import (
+    Bytecode,
+    FunctionCode,
+    OpCode
+)
+from lpp.object import (
+    Integer,
+    String
+)
+
+
+_INFIX_OPERATIONS: Dict[str, OpCode] = {
+    "+": OpCode.ADD,
+    "-": OpCode.SUB,
+    "*": OpCode.MUL,
+    "/": OpCode.DIV,
+    "==": OpCode.EQUAL,
+    "===": OpCode.EQUAL,
+    "!=": OpCode.NOT_EQUAL,
+    "!==": OpCode.NOT_EQUAL,
+    "<": OpCode.LESS_THAN,
+    ">": OpCode.GREATER_THAN,
+    "<=": OpCode.LESS_EQUAL,
+    ">=": OpCode.GREATER_EQUAL,
+}
+
+_PREFIX_OPERATIONS: Dict[str, OpCode] = {
+    "-": OpCode.MINUS,
+    "!": OpCode.BANG,
+}
+
+_UNKNOWN_NODE = "No se puede compilar {}"
+_UNKNOWN_OPERATOR = "No se puede compilar el operador {}"
+
+
+# Traduce un programa (o el cuerpo de una función) a bytecode. Las variables se siguen resolviendo por nombre en los ambientes de lpp para conservar exactamente el alcance del evaluador
+class Compiler:
+
+    def __init__(self) -> None:
+
+        self._instructions: List[int] = []
+        self._constants: List[Any] = []
+        self._constant_indexes: Dict[Tuple[type, Any], int] = {}
+        self._positions: Dict[int, Tuple[int, int]] = {}
+        # A dónde salta un statement que produjo un error o un Return, cada salto se resuelve cuando termina su bloque
+        self._error_exits: List[List[int]] = []
+        # Cuántos si usados como expresión contienen al código que estamos compilando
+        self._expression_ifs: int = 0
+
+
+    def compile_program(self, program: ast.Program) -> Bytecode:
+
+        self._compile_body(program.statements)
+
+        return self.bytecode()
+
+
+    def bytecode(self) -> Bytecode:
+
+        return Bytecode(self._instructions, self._constants, self._positions)
+
+
+    # El cuerpo de un programa o de una función: si un statement regresa un error o un Return, ese es el resultado
+    def _compile_body(self, statements: List[ast.Statement]) -> None:
+
+        self._error_exits.append([])
+
+        self._compile_statements(statements)
+
+        self._patch_jumps(self._error_exits.pop())
+        self._emit(OpCode.RETURN_VALUE, 1)
+
+
+    # Deja en el stack exactamente un valor, el del último statement
+    def _compile_statements(self, statements: List[ast.Statement]) -> None:
+
+        if len(statements) == 0:
+            self._emit(OpCode.NONE)
+            return
+
+        for idx, statement in enumerate(statements):
+
+            last = idx == len(statements) - 1
+
+            if type(statement) == ast.ExpressionStatement:
+
+                expression = cast(ast.ExpressionStatement, statement).expression
+                assert expression is not None
+
+                # Un si usado como statement deja que los errores de sus bloques salgan del bloque que lo contiene
+                if type(expression) == ast.If:
+                    self._compile_if(cast(ast.If, expression), propagate_errors=True)
+
+                else:
+                    self._compile_expression(expression)
+
+                if not last:
+                    self._error_exits[-1].append(self._emit(OpCode.POP_UNLESS_ERROR))
+
+            # Los ciclos y las reasignaciones también dejan un valor, nulo, None o el error que los terminó
+            elif type(statement) == ast.While or type(statement) == ast.AssignStatement:
+
+                if type(statement) == ast.While:
+                    self._compile_while(cast(ast.While, statement))
+
+                else:
+                    assign_statement = cast(ast.AssignStatement, statement)
+
+                    assert assign_statement.name is not None and assign_statement.value is not None
+
+                    self._compile_expression(assign_statement.value)
+                    self._emit(OpCode.ASSIGN_NAME, self._add_constant(assign_statement.name.value), assign_statement.name)
+
+                if not last:
+                    self._error_exits[-1].append(self._emit(OpCode.POP_UNLESS_ERROR))
+
+            elif type(statement) == ast.LetStatement:
+
+                let_statement = cast(ast.LetStatement, statement)
+
+                assert let_statement.name is not None and let_statement.value is not None
+
+                self._compile_expression(let_statement.value)
+                self._emit(OpCode.SET_NAME, self._add_constant(let_statement.name.value))
+
+                if last:
+                    self._emit(OpCode.NONE)
+
+            elif type(statement) == ast.ReturnStatement:
+
+                return_statement = cast(ast.ReturnStatement, statement)
+
+                assert return_statement.return_value is not None
+
+                self._compile_expression(return_statement.return_value)
+
+                # Dentro de un si usado como expresión el regresa no termina la función, el si vale un Return igual que en el evaluador
+                if self._expression_ifs > 0:
+                    self._emit(OpCode.MAKE_RETURN)
+                    self._error_exits[-1].append(self._emit(OpCode.JUMP))
+
+                else:
+                    self._emit(OpCode.RETURN_VALUE)
+
+                # Lo que sigue de un regresa nunca se ejecuta
+                return
+
+            else:
+                raise TypeError(_UNKNOWN_NODE.format(type(statement).__name__))
+
+
+    def _compile_expression(self, expression: ast.Expression) -> None:
+
+        node_type = type(expression)
+
+        if node_type == ast.Integer:
+
+            value = cast(ast.Integer, expression).value
+            assert value is not None
+
+            self._emit(OpCode.CONSTANT, self._add_constant(Integer(value)))
+
+        elif node_type == ast.StringLiteral:
+            self._emit(OpCode.CONSTANT, self._add_constant(String(cast(ast.StringLiteral, expression).value)))
+
+        elif node_type == ast.Boolean:
+            self._emit(OpCode.TRUE if cast(ast.Boolean, expression).value else OpCode.FALSE)
+
+        elif node_type == ast.Identifier:
+
+            identifier = cast(ast.Identifier, expression)
+            self._emit(OpCode.GET_NAME, self._add_constant(identifier.value), identifier)
+
+        elif node_type == ast.Prefix:
+
+            prefix = cast(ast.Prefix, expression)
+
+            assert prefix.right is not None
+
+            if prefix.operator not in _PREFIX_OPERATIONS:
+                raise ValueError(_UNKNOWN_OPERATOR.format(prefix.operator))
+
+            self._compile_expression(prefix.right)
+            self._emit(_PREFIX_OPERATIONS[prefix.operator], node=prefix)
+
+        elif node_type == ast.Infix:
+
+            infix = cast(ast.Infix, expression)
+
+            assert infix.left is not None and infix.right is not None
+
+            if infix.operator not in _INFIX_OPERATIONS:
+                raise ValueError(_UNKNOWN_OPERATOR.format(infix.operator))
+
+            self._compile_expression(infix.left)
+            self._compile_expression(infix.right)
+            self._emit(_INFIX_OPERATIONS[infix.operator], node=infix)
+
+        elif node_type == ast.If:
+            self._compile_if(cast(ast.If, expression), propagate_errors=False)
+
+        elif node_type == ast.Function:
+            self._compile_function(cast(ast.Function, expression))
+
+        elif node_type == ast.Call:
+
+            call = cast(ast.Call, expression)
+
+            assert call.arguments is not None
+
+            self._compile_expression(call.function)
+
+            for argument in call.arguments:
+                self._compile_expression(argument)
+
+            self._emit(OpCode.CALL, len(call.arguments), call)
+
+        else:
+            raise TypeError(_UNKNOWN_NODE.format(node_type.__name__))
+
+
+    def _compile_if(self, if_expression: ast.If, propagate_errors: bool) -> None:
+
+        assert if_expression.condition is not None and if_expression.consequence is not None
+
+        self._compile_expression(if_expression.condition)
+        jump_not_truthy = self._emit(OpCode.JUMP_NOT_TRUTHY)
+
+        # Usado como expresión, un error o un regresa dentro de sus bloques solo termina el si y se vuelve su valor
+        if not propagate_errors:
+            self._error_exits.append([])
+            self._expression_ifs += 1
+
+        self._compile_statements(if_expression.consequence.statements)
+        jump = self._emit(OpCode.JUMP)
+
+        self._patch_jumps([jump_not_truthy])
+
+        if if_expression.alternative is not None:
+            self._compile_statements(if_expression.alternative.statements)
+
+        else:
+            self._emit(OpCode.NULL)
+
+        self._patch_jumps([jump])
+
+        if not propagate_errors:
+            self._patch_jumps(self._error_exits.pop())
+            self._expression_ifs -= 1
+
+
+    # Un error en la condición o en el cuerpo sale del bloque que contiene al ciclo, igual que el de un statement
+    def _compile_while(self, while_statement: ast.While) -> None:
+
+        assert while_statement.condition is not None and while_statement.body is not None
+
+        start = len(self._instructions)
+
+        self._compile_expression(while_statement.condition)
+        self._error_exits[-1].append(self._emit(OpCode.JUMP_IF_ERROR))
+        jump_not_truthy = self._emit(OpCode.JUMP_NOT_TRUTHY)
+
+        self._compile_statements(while_statement.body.statements)
+        self._error_exits[-1].append(self._emit(OpCode.POP_UNLESS_ERROR))
+        self._emit(OpCode.JUMP, start)
+
+        self._patch_jumps([jump_not_truthy])
+        self._emit(OpCode.NONE)
+
+
+    def _compile_function(self, function: ast.Function) -> None:
+
+        assert function.body is not None
+
+        compiler = Compiler()
+        compiler._compile_body(function.body.statements)
+
+        names = [parameter.value for parameter in function.parameters]
+        template = FunctionCode(function.parameters, function.body, names, compiler.bytecode())
+
+        self._emit(OpCode.CLOSURE, self._add_constant(template))
+
+
+    def _emit(self, op: OpCode, operand: int = 0, node: Optional[ast.Expression] = None) -> int:
+
+        position = len(self._instructions)
+        self._instructions.extend((op.value, operand))
+
+        if node is not None:
+            self._positions[position] = (node.token.line, node.token.column)
+
+        return position
+
+
+    def _patch_jumps(self, jumps: List[int]) -> None:
+
+        for jump in jumps:
+            self._instructions[jump + 1] = len(self._instructions)
+
+
+    def _add_constant(self, value: Any) -> int:
+
+        # Las funciones no se comparan, los nombres y los literales sí se reutilizan
+        if isinstance(value, FunctionCode):
+            self._constants.append(value)
+            return len(self._constants) - 1
+
+        key = (type(value), value if isinstance(value, str) else value.value)
+        index = self._constant_indexes.get(key)
+
+        if index is None:
+            index = self._constant_indexes[key] = len(self._constants)
+            self._constants.append(value)
+
+        return index
+
+
+def compile_program(program: ast.Program) -> Bytecode:
+
+    return Compiler().compile_program(program)
+
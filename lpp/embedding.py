@@ -0,0 +1,175 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional
+)
+
+import lpp.ast as ast
+import lpp.closure_evaluator as closure_evaluator
+import lpp.evaluator as evaluator
+import lpp.exception_evaluator as exception_evaluator
+import lpp.transpiler as transpiler
+from lpp.budget import (
+    evaluate_with_budget,
+    new_budget
+)
+from lpp.compiler import compile_program
+from lpp.engines import (
+    DEFAULT_ENGINE,
+    ENGINES
+)
+from lpp.object import (
+    Environment,
+    Object,
+    String,
+    to_integer_object
+)
+from lpp.optimizer import optimize
+from lpp.parser import Parser
+from lpp.resolver import resolve
+from lpp.token_buffer import TokenBuffer
+from lpp.vm import VM
+
+# Lo que queda de un programa ya preparado por un motor: solo falta el ambiente
+Runner = Callable[[Environment], Optional[Object]]
+
+_UNSUPPORTED_BINDING = "No se puede convertir {} de tipo {} a un objeto de lpp"
+
+
+class ParseError(Exception):
+
+    def __init__(self, errors: List[str]) -> None:
+
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+# Un programa parseado y preparado una sola vez que se puede ejecutar muchas veces, también desde varios hilos a la vez
+class CompiledProgram:
+
+    def __init__(self, program: ast.Program, engine: str = DEFAULT_ENGINE) -> None:
+
+        self._program: ast.Program = program
+        self._engine: str = engine
+        self._runner: Runner = _prepare(program, engine)
+
+
+    @property
+    def program(self) -> ast.Program:
+        return self._program
+
+
+    @property
+    def engine(self) -> str:
+        return self._engine
+
+
+    # Cada ejecución tiene su propio ambiente con las variables que recibe, así ninguna ve lo que declaró otra
+    def run(self,
+            bindings: Optional[Mapping[str, Any]] = None,
+            steps: Optional[int] = None,
+            seconds: Optional[float] = None) -> Optional[Object]:
+
+        env: Environment = Environment()
+
+        for name, value in (bindings or {}).items():
+            env[name] = to_object(value)
+
+        budget = new_budget(steps, seconds)
+
+        if budget is None:
+            return self._runner(env)
+
+        return evaluate_with_budget(lambda program, env: self._runner(env), self._program, env, budget)
+
+
+def compile(source: str, engine: str = DEFAULT_ENGINE, optimized: bool = False) -> CompiledProgram:
+
+    parser: Parser = Parser(TokenBuffer(source))
+    program = parser.parse_program()
+
+    if len(parser.errors) > 0:
+        raise ParseError(parser.errors)
+
+    if optimized:
+        program = optimize(program)
+
+    return CompiledProgram(program, engine)
+
+
+# Los valores de Python que tienen un equivalente en lpp, los objetos de lpp pasan tal cual
+def to_object(value: Any) -> Object:
+
+    if isinstance(value, Object):
+        return value
+
+    # bool antes que int porque True también es un int
+    elif isinstance(value, bool):
+        return evaluator.TRUE if value else evaluator.FALSE
+
+    elif isinstance(value, int):
+        return to_integer_object(value)
+
+    elif isinstance(value, str):
+        return String(value)
+
+    elif value is None:
+        return evaluator.NULL
+
+    raise TypeError(_UNSUPPORTED_BINDING.format(repr(value), type(value).__name__))
+
+
+# El resolver corre una sola vez aquí y no en cada ejecución
+def _prepare_evaluator(program: ast.Program) -> Runner:
+
+    resolve(program)
+
+    return lambda env: evaluator._evaluate_program(program, env)
+
+
+def _prepare_exception_evaluator(program: ast.Program) -> Runner:
+
+    resolve(program)
+
+    return lambda env: exception_evaluator._evaluate_program(program, env)
+
+
+def _prepare_vm(program: ast.Program) -> Runner:
+
+    bytecode = compile_program(program)
+
+    return lambda env: VM(bytecode, env).run()
+
+
+def _prepare_transpiler(program: ast.Program) -> Runner:
+
+    try:
+        return transpiler.translate(program)
+
+    except transpiler._Unsupported:
+        return _prepare_evaluator(program)
+
+
+_PREPARERS: Dict[str, Callable[[ast.Program], Runner]] = {
+    "evaluador": _prepare_evaluator,
+    "closures": closure_evaluator.compile_node,
+    "vm": _prepare_vm,
+    "python": _prepare_transpiler,
+    "excepciones": _prepare_exception_evaluator,
+}
+
+
+def _prepare(program: ast.Program, engine: str) -> Runner:
+
+    preparer = _PREPARERS.get(engine)
+
+    if preparer is not None:
+        return preparer(program)
+
+    # Los motores que no tienen nada que preparar por separado reciben el programa en cada ejecución
+    evaluate = ENGINES[engine]
+
+    return lambda env: evaluate(program, env)
@@ -0,0 +1,35 @@
+from typing import (
+    Dict,
+    Optional,
+    Protocol
+)
+
+import lpp.closure_evaluator as closure_evaluator
+import lpp.evaluator as evaluator
+import lpp.exception_evaluator as exception_evaluator
+import lpp.stack_evaluator as stack_evaluator
+import lpp.transpiler as transpiler
+import lpp.vm as vm
+from lpp.ast import ASTNode
+from lpp.object import (
+    Environment,
+    Object
+)
+
+
+# Todos los motores reciben un programa y un ambiente y regresan lo mismo que evaluator.evaluate, también con keep_return
+class Engine(Protocol):
+
+    def __call__(self, node: ASTNode, env: Environment, *, keep_return: bool = False) -> Optional[Object]: ...
+
+
+ENGINES: Dict[str, Engine] = {
+    "evaluador": evaluator.evaluate,
+    "closures": closure_evaluator.evaluate,
+    "vm": vm.evaluate,
+    "python": transpiler.evaluate,
+    "pila": stack_evaluator.evaluate,
+    "excepciones": exception_evaluator.evaluate,
+}
+
+DEFAULT_ENGINE = "evaluador"
@@ -1,26 +1,34 @@
+from weakref import ref
+
 from typing import (
     Any,
     cast,
     List,
+    NamedTuple,
     Optional,
     Type
 )
 
 import lpp.ast as ast
+import lpp.budget as budget
 from lpp.builtins import BUILTINS
+from lpp.resolver import resolve
 
 from lpp.object import (
     Boolean,
     Builtin,
     Environment,
     Error,
+    Frame,
     Function,
     Integer,
     Null,
     Object,
     ObjectType,
     Return,
-    String
+    String,
+    to_integer_object,
+    UNSET
 )
 
 
@@ -30,15 +38,25 @@ FALSE = Boolean(False)
 NULL = Null()
 
 
+# Una llamada en posición de cola que todavía no se hace: _apply_function la ejecuta en su ciclo en lugar de anidar otra llamada
+class _TailCall(NamedTuple):
+
+    function: Function
+    args: List[Object]
+    call: ast.Call
+
+
 # Errores
 _NOT_A_FUNCTION = "No es una función: {}"
 _TYPE_MISMATCH = "Discrepancia de tipos: {} {} {}"
 _UNKNOWN_PREFIX_OPERATOR = "Operador desconocido: {}{}"
 _UNKNOWN_INFIX_OPERATOR = "Operador desconocido: {} {} {}"
 _UNKNOWN_IDENTIFIER = "Identificador no encontrado: {}"
+_WRONG_NUMBER_OF_ARGS = "Número incorrecto de argumentos: se recibieron {}, se requieren {}"
 
 
-def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
+# Con keep_return un regresa que llega al nivel superior del programa sale envuelto en su Return, así quien lo llama sabe que el programa terminó
+def evaluate(node: ast.ASTNode, env: Environment, keep_return: bool = False) -> Optional[Object]:
 
     node_type: Type = type(node)
 
@@ -46,7 +64,8 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         node = cast(ast.Program, node)
 
-        return _evaluate_program(node, env)
+        # Resolver el programa es un solo recorrido y ahorra buscar cada variable por nombre
+        return _evaluate_program(resolve(node), env, keep_return)
 
     elif node_type == ast.ExpressionStatement:
 
@@ -60,10 +79,8 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         
         node = cast(ast.Integer, node)
 
-        assert node.value is not None
-
         # Este Integer NO es el mismo que el ast.Integer, este Integer es la representación en objeto de el nodo ast.Integer que estemos evaluando
-        return Integer(node.value)
+        return _literal_integer(node)
 
     elif node_type == ast.Boolean:
 
@@ -83,7 +100,13 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         assert right is not None
 
-        return _evaluate_prefix_expression(node.operator, right)
+        result = _evaluate_prefix_expression(node.operator, right)
+
+        # Solo los errores necesitan su posición, el resto de los valores sale sin otra llamada
+        if type(result) is Error:
+            return _locate_error(result, node)
+
+        return result
 
     elif node_type == ast.Infix:
 
@@ -96,7 +119,12 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         assert right is not None and left is not None
 
-        return _evaluate_infix_expression(node.operator, left, right)
+        result = _evaluate_infix_expression(node.operator, left, right)
+
+        if type(result) is Error:
+            return _locate_error(result, node)
+
+        return result
 
     elif node_type == ast.Block:
 
@@ -126,13 +154,41 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         assert node.value is not None
         value = evaluate(node.value, env)
         assert node.name is not None
-        env[node.name.value] = value
+
+        if type(env) is Frame and node.name.slot is not None and node.name.slot >= 0:
+            cast(Frame, env)._values[node.name.slot] = value
+
+        else:
+            env[node.name.value] = value
+
+    elif node_type == ast.AssignStatement:
+
+        node = cast(ast.AssignStatement, node)
+
+        assert node.name is not None and node.value is not None
+        value = evaluate(node.value, env)
+        assert value is not None
+
+        # Solo se pueden cambiar variables que ya existen, para crear una se usa variable
+        if not _assign_variable(node.name, value, env):
+            return _locate_error(_new_error(_UNKNOWN_IDENTIFIER, [node.name.value]), node.name)
+
+    elif node_type == ast.While:
+
+        node = cast(ast.While, node)
+
+        return _evaluate_while_statement(node, env)
 
     elif node_type == ast.Identifier:
 
         node = cast(ast.Identifier, node)
 
-        return _evaluate_identifier(node, env)
+        result = _evaluate_identifier(node, env)
+
+        if type(result) is Error:
+            return _locate_error(result, node)
+
+        return result
 
     elif node_type == ast.Function:
 
@@ -156,28 +212,52 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         assert function is not None
 
-        return _apply_function(function, args)
+        result = _apply_function(function, args)
+
+        if type(result) is Error:
+            return _locate_error(result, node)
+
+        return result
 
     elif node_type == ast.StringLiteral:
 
         node = cast(ast.StringLiteral, node)
 
-        return String(node.value)
+        return _literal_string(node)
 
     return None
 
 
 def _apply_function(fn: Object, args: List[Object]) -> Object:
 
-    if type(fn) == Function:
-        
-        fn = cast(Function, fn)
+    # isinstance para aceptar también las funciones que crea closure_evaluator
+    if isinstance(fn, Function):
+
+        call: Optional[ast.Call] = None
+
+        # Trampolín: cada llamada en posición de cola reemplaza a la función actual, así la pila de Python no crece
+        while True:
+
+            if budget.active:
+                budget.charge()
+
+            if len(args) < len(fn.parameters):
+                evaluated = _arity_error(fn, args)
+                break
+
+            extended_environment = _extend_function_environment(fn, args)
+            evaluated = _evaluate_function_block(fn.body, extended_environment, tail=True)
+
+            if type(evaluated) is not _TailCall:
+                break
+
+            fn, args, call = evaluated
 
-        extended_environment = _extend_function_environment(fn, args)
-        evaluated = evaluate(fn.body, extended_environment)
-        
         assert evaluated is not None
-        return _unwrap_return_value(evaluated)
+        result = _unwrap_return_value(evaluated)
+
+        # Sin trampolín el error se habría ubicado en la llamada de cola más interna
+        return result if call is None else _locate_error(result, call)
 
     elif type(fn) == Builtin:
 
@@ -185,16 +265,28 @@ def _apply_function(fn: Object, args: List[Object]) -> Object:
         return fn.fn(*args)
 
     else:
-        return _new_error(_NOT_A_FUNCTION, [fn.type().name])
+        return _new_error(_NOT_A_FUNCTION, [fn.TYPE.name])
+
+
+# Los argumentos de más se ignoran, pero si faltan la función no tiene con qué llenar sus parámetros
+def _arity_error(fn: Function, args: List[Object]) -> Error:
+
+    return _new_error(_WRONG_NUMBER_OF_ARGS, [len(args), len(fn.parameters)])
 
 
 def _extend_function_environment(fn: Function, args: List[Object]) -> Environment:
 
+    scope = fn.body.scope
+
+    # Los cuerpos que ya pasaron por el resolver guardan sus variables en una lista, los argumentos de más se ignoran
+    if scope is not None and len(args) >= scope.arity:
+        return Frame(scope, args[:scope.arity] + [UNSET] * (len(scope.names) - scope.arity), fn.env)
+
     env = Environment(outer=fn.env)
 
     # Este for crea las variables a partir de los parámetros dentro de la función, aquí estamos creando un ambiente cuyo ambiente padre es el que recibimos por parámetro, los ambientes padre se evaluan gracias al try...except que está dentro de la clase Environment en objeect.py
     for idx, param in enumerate(fn.parameters):
-        env[param.value] = args[idx - 1]
+        env[param.value] = args[idx]
 
     return env
 
@@ -209,7 +301,7 @@ def _unwrap_return_value(obj: Object) -> Object:
     return obj
 
 
-def _evaluate_program(program: ast.Program, env : Environment) -> Optional[Object]:
+def _evaluate_program(program: ast.Program, env : Environment, keep_return: bool = False) -> Optional[Object]:
 
     result: Optional[Object] = None
 
@@ -218,8 +310,7 @@ def _evaluate_program(program: ast.Program, env : Environment) -> Optional[Objec
         result = evaluate(statement, env)
 
         if type(result) == Return:
-            result = cast(Return, result)
-            return result.value
+            return result if keep_return else cast(Return, result).value
 
         elif type(result) == Error:
             return result
@@ -243,13 +334,108 @@ def _evaluate_expression(expressions: List[ast.Expression], env: Environment) ->
 
 def _evaluate_identifier(node: ast.Identifier, env: Environment) -> Object:
 
-    try:
-        return env[node.value]
+    depth = node.depth
+    slot = node.slot
+    scope: Any = env
+
+    if slot is not None:
+
+        # Subimos depth marcos; si un ambiente no es el que vio el resolver (lo creó otro motor) buscamos por nombre
+        while depth and type(scope) is Frame:
+            scope = scope._outer
+            depth -= 1
+
+        if depth:
+            scope = env
+
+        elif slot == ast.GLOBAL:
+
+            if type(scope) is Environment:
+                return _evaluate_global_identifier(node, scope)
+
+            scope = env
+
+        elif type(scope) is Frame:
+
+            value = scope._values[slot]
+
+            if value is not UNSET:
+                return value
+
+            # Una variable que todavía no se declara en esta función se busca en las de afuera
+            scope = scope._outer
+
+        else:
+            scope = env
+
+    value = scope.lookup(node.value)
+
+    if value is UNSET:
+        return _evaluate_builtin(node)
+
+    return value
+
+
+# Los builtins se guardan en el identificador mientras la versión del ambiente global no cambie. Las globales no:
+# una función guardada apunta a su ambiente y el árbol lo mantendría vivo, y al ambiente solo se le guarda una referencia débil
+def _evaluate_global_identifier(node: ast.Identifier, env: Environment) -> Object:
+
+    cached = node.cached
+
+    if cached is not None and cached[1] == env._version and cached[0]() is env:
+        return cached[2]
+
+    value = env._store.get(node.value, UNSET)
+
+    if value is not UNSET:
+        return value
+
+    # Lo que está en ambientes de afuera puede cambiar sin que cambie esta versión, eso no se guarda
+    if env._outer is not None:
+
+        value = env._outer.lookup(node.value)
+
+        return _evaluate_builtin(node) if value is UNSET else value
+
+    value = BUILTINS.get(node.value)
+
+    # Los errores no se guardan, cada uno recibe su propia posición
+    if value is None:
+        return _new_error(_UNKNOWN_IDENTIFIER, [node.value])
+
+    node.cached = (ref(env), env._version, value)
+
+    return value
+
+
+# Como _evaluate_identifier: los marcos se cambian por su lugar y lo demás se busca por nombre
+def _assign_variable(node: ast.Identifier, value: Object, env: Environment) -> bool:
+
+    depth = node.depth
+    slot = node.slot
+    scope: Any = env
+
+    if slot is not None and slot >= 0:
+
+        while depth and type(scope) is Frame:
+            scope = scope._outer
+            depth -= 1
+
+        if not depth and type(scope) is Frame and scope._values[slot] is not UNSET:
+            scope._values[slot] = value
+            return True
+
+    return env.assign(node.value, value)
+
+
+def _evaluate_builtin(node: ast.Identifier) -> Object:
 
-    except KeyError:
+    builtin = BUILTINS.get(node.value)
 
-        return BUILTINS.get(node.value,
-                             _new_error(_UNKNOWN_IDENTIFIER, [node.value]))
+    if builtin is None:
+        return _new_error(_UNKNOWN_IDENTIFIER, [node.value])
+
+    return builtin
 
 
 def _evaluate_bang_operator_expression(right: Object) -> Object:
@@ -276,12 +462,88 @@ def _evaluate_block_statement(block: ast.Block, env: Environment) -> Optional[Ob
         result = evaluate(statement, env)
 
         if result is not None and \
-            (result.type() == ObjectType.RETURN or result.type() == ObjectType.ERROR):
+            (result.TYPE is ObjectType.RETURN or result.TYPE is ObjectType.ERROR):
             return result
 
     return result
 
 
+# Como _evaluate_block_statement, pero las llamadas en posición de cola regresan un _TailCall: las de un regresa y, si tail, la última expresión
+def _evaluate_function_block(block: ast.Block, env: Environment, tail: bool) -> Any:
+
+    result: Any = None
+    statements = block.statements
+
+    for idx, statement in enumerate(statements):
+
+        last = tail and idx == len(statements) - 1
+        statement_type = type(statement)
+        expression: Any = None
+
+        if statement_type == ast.ExpressionStatement:
+            expression = cast(ast.ExpressionStatement, statement).expression
+
+        if statement_type == ast.ReturnStatement \
+            and type(cast(ast.ReturnStatement, statement).return_value) == ast.Call:
+
+            result = _tail_call(cast(ast.Call, cast(ast.ReturnStatement, statement).return_value), env, returned=True)
+
+        elif last and type(expression) == ast.Call:
+            result = _tail_call(cast(ast.Call, expression), env, returned=False)
+
+        # Los regresa dentro de un si siempre están en posición de cola, la última expresión de sus bloques solo si el si es lo último
+        elif type(expression) == ast.If:
+            result = _evaluate_tail_if_expression(cast(ast.If, expression), env, last)
+
+        else:
+            result = evaluate(statement, env)
+
+        if result is not None and \
+            (type(result) is _TailCall or result.TYPE is ObjectType.RETURN or result.TYPE is ObjectType.ERROR):
+            return result
+
+    return result
+
+
+def _evaluate_tail_if_expression(if_expression: ast.If, env: Environment, tail: bool) -> Any:
+
+    assert if_expression.condition is not None
+
+    condition = evaluate(if_expression.condition, env)
+
+    assert condition is not None
+
+    if _is_truthy(condition):
+
+        assert if_expression.consequence is not None
+        return _evaluate_function_block(if_expression.consequence, env, tail)
+
+    elif if_expression.alternative is not None:
+        return _evaluate_function_block(if_expression.alternative, env, tail)
+
+    else:
+        return NULL
+
+
+def _tail_call(call: ast.Call, env: Environment, returned: bool) -> Any:
+
+    function = evaluate(call.function, env)
+
+    assert call.arguments is not None
+
+    args = _evaluate_expression(call.arguments, env)
+
+    assert function is not None
+
+    if isinstance(function, Function):
+        return _TailCall(function, args, call)
+
+    # Los builtins no usan la pila de lpp, se llaman en el momento
+    value = _locate_error(_apply_function(function, args), call)
+
+    return Return(value) if returned else value
+
+
 def _evaluate_if_expression(if_expression: ast.If, env : Environment) -> Optional[Object]:
 
     assert if_expression.condition is not None
@@ -302,6 +564,35 @@ def _evaluate_if_expression(if_expression: ast.If, env : Environment) -> Optiona
         return NULL
 
 
+# El cuerpo se evalúa en el mismo ambiente en cada vuelta, sin llamadas ni ambientes nuevos
+def _evaluate_while_statement(while_statement: ast.While, env: Environment) -> Optional[Object]:
+
+    assert while_statement.condition is not None and while_statement.body is not None
+
+    while True:
+
+        if budget.active:
+            budget.charge()
+
+        condition = evaluate(while_statement.condition, env)
+
+        assert condition is not None
+
+        # Un error en la condición termina el ciclo, si no se repetiría para siempre
+        if type(condition) is Error:
+            return condition
+
+        # mientras es un statement, igual que variable no tiene valor
+        if not _is_truthy(condition):
+            return None
+
+        result = _evaluate_block_statement(while_statement.body, env)
+
+        if result is not None and \
+            (result.TYPE is ObjectType.RETURN or result.TYPE is ObjectType.ERROR):
+            return result
+
+
 def _is_truthy(obj: Object) -> bool:
 
     if obj is NULL or obj is FALSE:
@@ -315,13 +606,16 @@ def _evaluate_infix_expression(operator: str,
                                 left: Object,
                                 right: Object) -> Object:
 
-    if left.type() == ObjectType.INTEGER \
-        and right.type() == ObjectType.INTEGER:
+    left_type = left.TYPE
+    right_type = right.TYPE
+
+    if left_type is ObjectType.INTEGER \
+        and right_type is ObjectType.INTEGER:
 
         return _evaluate_integer_infix_expression(operator, left, right)
 
-    if left.type() == ObjectType.STRING \
-        and right.type() == ObjectType.STRING:
+    if left_type is ObjectType.STRING \
+        and right_type is ObjectType.STRING:
 
         return _evaluate_string_infix_expression(operator, left, right)
     
@@ -331,15 +625,15 @@ def _evaluate_infix_expression(operator: str,
     elif operator == "!=" or operator == "!==":
         return _to_boolean_object(left is not right)
 
-    elif left.type() != right.type():
-        return _new_error(_TYPE_MISMATCH, [left.type().name,
+    elif left_type is not right_type:
+        return _new_error(_TYPE_MISMATCH, [left_type.name,
                                             operator,
-                                            right.type().name])
+                                            right_type.name])
 
     else:
-        return _new_error(_UNKNOWN_INFIX_OPERATOR, [left.type().name,
+        return _new_error(_UNKNOWN_INFIX_OPERATOR, [left_type.name,
                                                     operator,
-                                                    right.type().name])
+                                                    right_type.name])
 
 
 def _evaluate_string_infix_expression(operator: str,
@@ -359,9 +653,9 @@ def _evaluate_string_infix_expression(operator: str,
         return _to_boolean_object(left_value != right_value)
 
     else:
-        return _new_error(_UNKNOWN_INFIX_OPERATOR, [left.type().name,
+        return _new_error(_UNKNOWN_INFIX_OPERATOR, [left.TYPE.name,
                                                     operator,
-                                                    right.type().name])
+                                                    right.TYPE.name])
 
 
 def _evaluate_integer_infix_expression(operator: str,
@@ -372,16 +666,16 @@ def _evaluate_integer_infix_expression(operator: str,
     right_value: int = cast(Integer, right).value
 
     if operator == "+":
-        return Integer(left_value + right_value)
+        return to_integer_object(left_value + right_value)
 
     elif operator == "-":
-        return Integer(left_value - right_value)
+        return to_integer_object(left_value - right_value)
 
     elif operator == "*":
-        return Integer(left_value * right_value)
+        return to_integer_object(left_value * right_value)
 
     elif operator == "/":
-        return Integer(left_value // right_value)
+        return to_integer_object(left_value // right_value)
 
     elif operator == "<":
         return _to_boolean_object(left_value < right_value)
@@ -402,19 +696,19 @@ def _evaluate_integer_infix_expression(operator: str,
         return _to_boolean_object(left_value != right_value)
 
     else:
-        return _new_error(_UNKNOWN_INFIX_OPERATOR, [left.type().name,
+        return _new_error(_UNKNOWN_INFIX_OPERATOR, [left.TYPE.name,
                                                     operator,
-                                                    right.type().name])
+                                                    right.TYPE.name])
 
     
 def _evaluate_minus_operator_expression(right: Object) -> Object:
 
     if type(right) != Integer:
-        return _new_error(_UNKNOWN_PREFIX_OPERATOR, ["-", right.type().name])
+        return _new_error(_UNKNOWN_PREFIX_OPERATOR, ["-", right.TYPE.name])
 
     right = cast(Integer, right)
 
-    return Integer(-right.value)
+    return to_integer_object(-right.value)
 
 
 def _evaluate_prefix_expression(operator: str, right: Object) -> Object:
@@ -426,7 +720,44 @@ def _evaluate_prefix_expression(operator: str, right: Object) -> Object:
         return _evaluate_minus_operator_expression(right)
 
     else:
-        return _new_error(_UNKNOWN_PREFIX_OPERATOR, [operator, right.type().name])
+        return _new_error(_UNKNOWN_PREFIX_OPERATOR, [operator, right.TYPE.name])
+
+
+# Los literales guardan el objeto que producen, visitarlos otra vez no crea nada
+def _literal_integer(node: ast.Integer) -> Integer:
+
+    constant = node.constant
+
+    if constant is None:
+
+        assert node.value is not None
+        constant = node.constant = to_integer_object(node.value)
+
+    return constant
+
+
+def _literal_string(node: ast.StringLiteral) -> String:
+
+    constant = node.constant
+
+    if constant is None:
+        constant = node.constant = String(node.value)
+
+    return constant
+
+
+def _locate_error(obj: Object, node: ast.Expression) -> Object:
+
+    # La primera vez que un error pasa por un nodo que sabe de qué línea salió, guardamos esa posición
+    if type(obj) == Error:
+
+        error = cast(Error, obj)
+
+        if error.line == 0 and node.token.line > 0:
+            error.line = node.token.line
+            error.column = node.token.column
+
+    return obj
 
 
 def _new_error(message: str, args: List[Any]) -> Error:
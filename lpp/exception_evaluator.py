@@ -0,0 +1,328 @@
+from typing import (
+    Any,
+    cast,
+    List,
+    Optional
+)
+
+import lpp.ast as ast
+import lpp.budget as budget
+import lpp.evaluator as evaluator
+from lpp.evaluator import (
+    _apply_function,
+    _arity_error,
+    _assign_variable,
+    _evaluate_identifier,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _extend_function_environment,
+    _literal_integer,
+    _literal_string,
+    _locate_error,
+    _new_error,
+    _TailCall,
+    _UNKNOWN_IDENTIFIER,
+    FALSE,
+    NULL,
+    TRUE
+)
+from lpp.object import (
+    Environment,
+    Error,
+    Frame,
+    Function,
+    Object,
+    Return
+)
+from lpp.resolver import resolve
+
+
+# Un regresa: sale hasta la llamada (o el programa) que lo contiene sin pasar por la revisión de cada statement
+class _Return(Exception):
+
+    def __init__(self, value: Any) -> None:
+
+        self.value = value
+
+
+# Un statement cuyo valor fue un error termina todos los bloques hasta la llamada o el programa
+class _Failure(Exception):
+
+    def __init__(self, error: Error) -> None:
+
+        self.error = error
+
+
+# La misma firma y los mismos resultados que evaluator.evaluate, pero regresa y los errores de los statements viajan como excepciones
+def evaluate(node: ast.ASTNode, env: Environment, keep_return: bool = False) -> Optional[Object]:
+
+    if type(node) == ast.Program:
+        return _evaluate_program(resolve(cast(ast.Program, node)), env, keep_return)
+
+    elif isinstance(node, ast.Expression):
+        return _evaluate_expression(node, env)
+
+    return evaluator.evaluate(node, env)
+
+
+def _evaluate_program(program: ast.Program, env: Environment, keep_return: bool = False) -> Optional[Object]:
+
+    try:
+        return _run_statements(program.statements, env, function_body=False, tail=False)
+
+    except _Return as returned:
+        return Return(returned.value) if keep_return else returned.value
+
+    except _Failure as failure:
+        return failure.error
+
+
+# Dentro del cuerpo de una función (function_body) las llamadas de un regresa, y de la última expresión si tail, regresan un _TailCall
+def _run_statements(statements: List[ast.Statement],
+                    env: Environment,
+                    function_body: bool,
+                    tail: bool) -> Any:
+
+    result: Any = None
+    last_index = len(statements) - 1
+
+    for idx, statement in enumerate(statements):
+
+        statement_type = type(statement)
+
+        if statement_type == ast.ExpressionStatement:
+
+            expression = cast(ast.ExpressionStatement, statement).expression
+            expression_type = type(expression)
+
+            if expression_type == ast.If:
+                result = _run_if_statement(cast(ast.If, expression), env, function_body, tail and idx == last_index)
+                continue
+
+            elif expression_type == ast.Call and function_body and tail and idx == last_index:
+                result = _tail_call(cast(ast.Call, expression), env)
+
+            else:
+                result = _evaluate_expression(cast(ast.Expression, expression), env)
+
+            # Solo un valor Error o un Return guardado en una variable terminan el bloque, como en _evaluate_block_statement
+            result_type = type(result)
+
+            if result_type is Error:
+                raise _Failure(result)
+
+            elif result_type is Return:
+                raise _Return(result.value)
+
+        elif statement_type == ast.LetStatement:
+
+            let_statement = cast(ast.LetStatement, statement)
+
+            assert let_statement.name is not None and let_statement.value is not None
+
+            value = _evaluate_expression(let_statement.value, env)
+            slot = let_statement.name.slot
+
+            if type(env) is Frame and slot is not None and slot >= 0:
+                cast(Frame, env)._values[slot] = value
+
+            else:
+                env[let_statement.name.value] = value
+
+            result = None
+
+        elif statement_type == ast.AssignStatement:
+
+            assign_statement = cast(ast.AssignStatement, statement)
+
+            assert assign_statement.name is not None and assign_statement.value is not None
+
+            if not _assign_variable(assign_statement.name, _evaluate_expression(assign_statement.value, env), env):
+                error = _locate_error(_new_error(_UNKNOWN_IDENTIFIER, [assign_statement.name.value]), assign_statement.name)
+                raise _Failure(cast(Error, error))
+
+            result = None
+
+        elif statement_type == ast.While:
+            result = _run_while_statement(cast(ast.While, statement), env)
+
+        elif statement_type == ast.ReturnStatement:
+
+            return_value = cast(ast.ReturnStatement, statement).return_value
+
+            assert return_value is not None
+
+            if function_body and type(return_value) == ast.Call:
+                raise _Return(_tail_call(cast(ast.Call, return_value), env))
+
+            raise _Return(_evaluate_expression(return_value, env))
+
+        else:
+            result = evaluator.evaluate(statement, env)
+
+    return result
+
+
+# Un si usado como statement: lo que pase dentro de sus bloques sale directo al bloque que lo contiene
+def _run_if_statement(if_expression: ast.If, env: Environment, function_body: bool, tail: bool) -> Any:
+
+    assert if_expression.condition is not None and if_expression.consequence is not None
+
+    condition = _evaluate_expression(if_expression.condition, env)
+
+    if condition is not FALSE and condition is not NULL:
+        return _run_statements(if_expression.consequence.statements, env, function_body, tail)
+
+    elif if_expression.alternative is not None:
+        return _run_statements(if_expression.alternative.statements, env, function_body, tail)
+
+    return NULL
+
+
+# Como en el evaluador, los regresa del cuerpo de un ciclo no son llamadas de cola
+def _run_while_statement(while_statement: ast.While, env: Environment) -> Any:
+
+    assert while_statement.condition is not None and while_statement.body is not None
+
+    condition_node = while_statement.condition
+    statements = while_statement.body.statements
+
+    while True:
+
+        if budget.active:
+            budget.charge()
+
+        condition = _evaluate_expression(condition_node, env)
+
+        if condition is FALSE or condition is NULL:
+            return None
+
+        if type(condition) is Error:
+            raise _Failure(condition)
+
+        _run_statements(statements, env, function_body=False, tail=False)
+
+
+def _evaluate_expression(expression: ast.Expression, env: Environment) -> Any:
+
+    expression_type = type(expression)
+
+    if expression_type == ast.Identifier:
+        return _locate_error(_evaluate_identifier(cast(ast.Identifier, expression), env), expression)
+
+    elif expression_type == ast.Integer:
+        return _literal_integer(cast(ast.Integer, expression))
+
+    elif expression_type == ast.Infix:
+
+        infix = cast(ast.Infix, expression)
+
+        assert infix.left is not None and infix.right is not None
+
+        left = _evaluate_expression(infix.left, env)
+        right = _evaluate_expression(infix.right, env)
+
+        return _locate_error(_evaluate_infix_expression(infix.operator, left, right), infix)
+
+    elif expression_type == ast.Call:
+
+        call = cast(ast.Call, expression)
+        function, args = _function_and_arguments(call, env)
+
+        return _locate_error(_apply(function, args), call)
+
+    elif expression_type == ast.If:
+        return _evaluate_if_expression(cast(ast.If, expression), env)
+
+    elif expression_type == ast.Boolean:
+        return TRUE if cast(ast.Boolean, expression).value else FALSE
+
+    elif expression_type == ast.StringLiteral:
+        return _literal_string(cast(ast.StringLiteral, expression))
+
+    elif expression_type == ast.Prefix:
+
+        prefix = cast(ast.Prefix, expression)
+
+        assert prefix.right is not None
+
+        return _locate_error(_evaluate_prefix_expression(prefix.operator, _evaluate_expression(prefix.right, env)), prefix)
+
+    elif expression_type == ast.Function:
+
+        function = cast(ast.Function, expression)
+
+        assert function.body is not None
+
+        return Function(function.parameters, function.body, env)
+
+    return None
+
+
+# Un si usado como valor: un regresa o un error dentro de sus bloques se vuelven su valor, igual que en el evaluador
+def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Any:
+
+    try:
+        return _run_if_statement(if_expression, env, function_body=False, tail=False)
+
+    except _Return as returned:
+        return Return(returned.value)
+
+    except _Failure as failure:
+        return failure.error
+
+
+def _function_and_arguments(call: ast.Call, env: Environment) -> Any:
+
+    assert call.arguments is not None
+
+    function = _evaluate_expression(call.function, env)
+    args: List[Object] = [_evaluate_expression(argument, env) for argument in call.arguments]
+
+    return function, args
+
+
+def _apply(fn: Any, args: List[Object]) -> Any:
+
+    if not isinstance(fn, Function):
+        return _apply_function(fn, args)
+
+    call: Optional[ast.Call] = None
+
+    # El mismo trampolín que el evaluador para las llamadas de cola
+    while True:
+
+        if budget.active:
+            budget.charge()
+
+        if len(args) < len(fn.parameters):
+            result = _arity_error(fn, args)
+            break
+
+        try:
+            result = _run_statements(fn.body.statements, _extend_function_environment(fn, args), function_body=True, tail=True)
+
+        except _Return as returned:
+            result = returned.value
+
+        except _Failure as failure:
+            result = failure.error
+
+        if type(result) is not _TailCall:
+            break
+
+        fn, args, call = result
+
+    assert result is not None
+
+    return result if call is None else _locate_error(result, call)
+
+
+def _tail_call(call: ast.Call, env: Environment) -> Any:
+
+    function, args = _function_and_arguments(call, env)
+
+    if isinstance(function, Function):
+        return _TailCall(function, args, call)
+
+    return _locate_error(_apply_function(function, args), call)
@@ -0,0 +1,270 @@
+from array import array
+from bisect import (
+    bisect_left,
+    bisect_right
+)
+from collections import deque
+from re import finditer
+
+from typing import (
+    Any,
+    cast,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple
+)
+
+import lpp.ast as ast
+from lpp.parser import Parser
+from lpp.token import (
+    Token,
+    TokenType
+)
+from lpp.token_buffer import scan_token
+
+
+# Lo que produjo una llamada a Parser.parse_next_statement: desde dónde hasta dónde llegaron sus tokens, la línea y columna donde empezaba
+# cuando se parseó (las posiciones de sus tokens son relativas a ese punto), el statement (None si no se pudo parsear) y sus errores
+class Slot(NamedTuple):
+
+    start: int
+    end: int
+    line: int
+    column: int
+    statement: Optional[ast.Statement]
+    errors: List[str]
+
+
+# Lexer que empieza en cualquier offset del código fuente y recuerda dónde empezó y terminó cada uno de los últimos tokens que entregó
+class _OffsetLexer:
+
+    def __init__(self, source: str, position: int, line_starts: array) -> None:
+
+        self._source: str = source
+        self._position: int = position
+        self._line_starts: array = line_starts
+        self.spans: Deque[Tuple[int, int]] = deque(maxlen=3)
+
+
+    def next_token(self) -> Token:
+
+        token_type, start, end, self._position = scan_token(self._source, self._position)
+
+        self.spans.append((start, self._position))
+
+        line = bisect_right(self._line_starts, start)
+        column = start - self._line_starts[line - 1] + 1
+        literal = self._source[start + 1 if token_type == TokenType.STRING else start:end]
+
+        return Token(token_type, literal, line, column)
+
+
+# Mantiene el programa parseado de un código fuente que se va editando, cada edición vuelve a lexear y parsear solo los statements de nivel superior que tocó
+# Los statements reutilizados no se recorren ni se modifican: sus tokens conservan la posición que tenían al parsearse y located_program las corrige
+class IncrementalParser:
+
+    def __init__(self, source: str) -> None:
+
+        self._source: str = source
+        self._line_starts: array = array("q", [0]) + _newlines(source, 0)
+        self._slots: List[Slot] = []
+        self.reparsed: int = 0
+
+        self._slots, _ = self._parse_from(0, [], 0)
+        self.reparsed = len(self._slots)
+
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+
+    @property
+    def program(self) -> ast.Program:
+        return ast.Program(statements=[slot.statement for slot in self._slots if slot.statement is not None])
+
+
+    @property
+    def errors(self) -> List[str]:
+        return [error for slot in self._slots for error in slot.errors]
+
+
+    # El programa con la línea y columna actuales en cada token, solo se copian los statements que se movieron desde que se parsearon
+    def located_program(self) -> ast.Program:
+
+        statements: List[ast.Statement] = []
+
+        for slot in self._slots:
+
+            if slot.statement is None:
+                continue
+
+            line, column = self._position(slot.start)
+
+            if line == slot.line and column == slot.column:
+                statements.append(slot.statement)
+
+            else:
+                statements.append(cast(ast.Statement, _located(slot.statement, line - slot.line, slot.line, column - slot.column)))
+
+        return ast.Program(statements=statements)
+
+
+    # Reemplaza source[start:end] por text y regresa el programa actualizado
+    def edit(self, start: int, end: int, text: str) -> ast.Program:
+
+        old_end_line, old_end_column = self._position(end)
+
+        delta = len(text) - (end - start)
+        self._source = self._source[:start] + text + self._source[end:]
+        self._update_line_starts(start, end, text)
+
+        new_end_line, new_end_column = self._position(end + delta)
+
+        # Empezamos a parsear un statement antes del que contiene la edición, porque dónde terminó ese statement depende del primer token del siguiente
+        first = max(bisect_left([slot.start for slot in self._slots], start) - 2, 0)
+        restart = self._slots[first].start if first > 0 else 0
+
+        # Los statements que están completamente después de la edición son candidatos a reutilizarse
+        candidates = [slot for slot in self._slots[first:] if slot.start >= end]
+        moved = new_end_line != old_end_line or new_end_column != old_end_column
+
+        reparsed, reused = self._parse_from(restart, candidates, end + delta, delta, moved)
+
+        self._slots = self._slots[:first] + reparsed + reused
+        self.reparsed = len(reparsed)
+
+        return self.program
+
+
+    def _parse_from(self,
+                    position: int,
+                    candidates: List[Slot],
+                    resync: int,
+                    delta: int = 0,
+                    moved: bool = False) -> Tuple[List[Slot], List[Slot]]:
+
+        lexer = _OffsetLexer(self._source, position, self._line_starts)
+        parser = Parser(lexer)
+        reparsed: List[Slot] = []
+        candidate_starts = {slot.start + delta: idx for idx, slot in enumerate(candidates)}
+
+        while not parser.finished:
+
+            # El parser ya leyó el token actual y el siguiente, el actual es el primero de este statement
+            start = lexer.spans[-2][0]
+
+            if start >= resync and start in candidate_starts:
+
+                reused = candidates[candidate_starts[start]:]
+
+                # Un statement con errores guarda sus posiciones dentro de los mensajes, si las posiciones cambiaron mejor lo volvemos a parsear
+                if not moved or not any(slot.errors for slot in reused):
+                    return reparsed, [slot._replace(start=slot.start + delta, end=slot.end + delta) for slot in reused]
+
+            errors = len(parser.errors)
+            line, column = self._position(start)
+            statement = parser.parse_next_statement()
+
+            reparsed.append(Slot(start, lexer.spans[-3][1], line, column, statement, parser.errors[errors:]))
+
+        return reparsed, []
+
+
+    def _position(self, offset: int) -> Tuple[int, int]:
+
+        line = bisect_right(self._line_starts, offset)
+        return line, offset - self._line_starts[line - 1] + 1
+
+
+    def _update_line_starts(self, start: int, end: int, text: str) -> None:
+
+        delta = len(text) - (end - start)
+
+        # Las líneas que empezaban dentro del texto reemplazado desaparecen, las del texto nuevo se agregan y las de después se recorren
+        first = bisect_right(self._line_starts, start)
+        last = bisect_right(self._line_starts, end)
+
+        tail = array("q", (line_start + delta for line_start in self._line_starts[last:]))
+
+        self._line_starts = self._line_starts[:first] + _newlines(text, start) + tail
+
+
+# Los offsets donde empieza una línea nueva dentro de text, que a su vez empieza en offset
+def _newlines(text: str, offset: int) -> array:
+
+    return array("q", (offset + found.end() for found in finditer("\n", text)))
+
+
+# Una copia del subárbol con las posiciones recorridas, solo los tokens de la primera línea del statement cambian de columna
+def _located(node: Any, line_delta: int, first_line: int, column_delta: int) -> Any:
+
+    node_type = type(node)
+    located = object.__new__(node_type)
+
+    for name in _slot_names(node_type):
+        setattr(located, name, getattr(node, name))
+
+    token = node.token
+    column = token.column + column_delta if token.line == first_line else token.column
+    located.token = Token(token.token_type, token.literal, token.line + line_delta, column)
+
+    def child(value: Any) -> Any:
+        return None if value is None else _located(value, line_delta, first_line, column_delta)
+
+    if node_type == ast.LetStatement or node_type == ast.AssignStatement:
+        located.name = child(node.name)
+        located.value = child(node.value)
+
+    elif node_type == ast.ReturnStatement:
+        located.return_value = child(node.return_value)
+
+    elif node_type == ast.ExpressionStatement:
+        located.expression = child(node.expression)
+
+    elif node_type == ast.Prefix:
+        located.right = child(node.right)
+
+    elif node_type == ast.Infix:
+        located.left = child(node.left)
+        located.right = child(node.right)
+
+    elif node_type == ast.Block:
+        located.statements = [child(statement) for statement in node.statements]
+
+    elif node_type == ast.If:
+        located.condition = child(node.condition)
+        located.consequence = child(node.consequence)
+        located.alternative = child(node.alternative)
+
+    elif node_type == ast.While:
+        located.condition = child(node.condition)
+        located.body = child(node.body)
+
+    elif node_type == ast.Function:
+        located.parameters = [child(parameter) for parameter in node.parameters]
+        located.body = child(node.body)
+
+    elif node_type == ast.Call:
+        located.function = child(node.function)
+        located.arguments = None if node.arguments is None else [child(argument) for argument in node.arguments]
+
+    return located
+
+
+_SLOT_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+# Los atributos de un nodo, incluidos los que declaran sus clases base
+def _slot_names(node_type: type) -> Tuple[str, ...]:
+
+    names = _SLOT_NAMES.get(node_type)
+
+    if names is None:
+        names = tuple(name for cls in node_type.__mro__ for name in getattr(cls, "__slots__", ()))
+        _SLOT_NAMES[node_type] = names
+
+    return names
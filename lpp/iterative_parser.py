@@ -0,0 +1,393 @@
+from typing import (
+    Any,
+    cast,
+    Generator,
+    List,
+    Optional,
+    Tuple
+)
+
+from lpp.ast import (
+    AssignStatement,
+    Block,
+    Call,
+    Expression,
+    ExpressionStatement,
+    Function,
+    If,
+    Infix,
+    LetStatement,
+    Prefix,
+    ReturnStatement,
+    Statement,
+    While
+)
+from lpp.parser import (
+    Parser,
+    Precedence,
+    PRECEDENCES
+)
+from lpp.token import TokenType
+
+# Cada regla de la gramática es un generador: en lugar de llamar a otra regla, hace yield del generador de esa regla y recibe su resultado de vuelta
+Task = Generator["Task", Any, Any]
+
+# Lo que queda pendiente en la pila de operadores cuando empezamos a parsear una subexpresión
+_PREFIX = 0
+_INFIX = 1
+_GROUP = 2
+_CALL = 3
+
+Pending = Tuple[int, Optional[Expression], Precedence, List[Expression]]
+
+_LITERALS = (TokenType.IDENT, TokenType.INT, TokenType.TRUE, TokenType.FALSE, TokenType.STRING)
+
+
+# Produce exactamente los mismos árboles que Parser, pero sin recursión en Python: los operadores y paréntesis viven en una pila de operadores y los bloques anidados en una pila de generadores
+class IterativeParser(Parser):
+
+    def _parse_statement(self) -> Optional[Statement]:
+
+        return self._run(self._statement())
+
+
+    def _run(self, task: Task) -> Any:
+
+        tasks: List[Task] = [task]
+        value: Any = None
+
+        while tasks:
+
+            try:
+                request = tasks[-1].send(value)
+
+            except StopIteration as done:
+                tasks.pop()
+                value = done.value
+                continue
+
+            tasks.append(request)
+            value = None
+
+        return value
+
+
+    def _statement(self) -> Task:
+
+        assert self._current_token is not None
+
+        if self._current_token.token_type == TokenType.LET:
+            return (yield self._let_statement())
+
+        elif self._current_token.token_type == TokenType.RETURN:
+            return (yield self._return_statement())
+
+        elif self._current_token.token_type == TokenType.WHILE:
+            return (yield self._while_statement())
+
+        elif self._current_token.token_type == TokenType.IDENT \
+                and self._peek_token is not None and self._peek_token.token_type == TokenType.ASSIGN:
+            return (yield self._assign_statement())
+
+        return (yield self._expression_statement())
+
+
+    def _let_statement(self) -> Task:
+
+        assert self._current_token is not None
+
+        let_statement = LetStatement(token=self._current_token)
+
+        if not self._expected_token(TokenType.IDENT):
+            return None
+
+        let_statement.name = self._parse_identifier()
+
+        if not self._expected_token(TokenType.ASSIGN):
+            return None
+
+        self._advance_tokens()
+
+        let_statement.value = yield self._expression(Precedence.LOWEST)
+
+        self._skip_semicolon()
+
+        return let_statement
+
+
+    def _assign_statement(self) -> Task:
+
+        assert self._current_token is not None
+
+        assign_statement = AssignStatement(token=self._current_token,
+                                            name=self._parse_identifier())
+
+        self._advance_tokens()
+        self._advance_tokens()
+
+        assign_statement.value = yield self._expression(Precedence.LOWEST)
+
+        self._skip_semicolon()
+
+        return assign_statement
+
+
+    def _return_statement(self) -> Task:
+
+        assert self._current_token is not None
+
+        return_statement = ReturnStatement(token=self._current_token)
+        self._advance_tokens()
+
+        return_statement.return_value = yield self._expression(Precedence.LOWEST)
+
+        self._skip_semicolon()
+
+        return return_statement
+
+
+    def _expression_statement(self) -> Task:
+
+        assert self._current_token is not None
+
+        expression_statement = ExpressionStatement(token=self._current_token)
+        expression_statement.expression = yield self._expression(Precedence.LOWEST)
+
+        self._skip_semicolon()
+
+        return expression_statement
+
+
+    def _block(self) -> Task:
+
+        assert self._current_token is not None
+
+        block_statement = Block(token=self._current_token,
+                                statements=[])
+
+        self._advance_tokens()
+
+        while not self._current_token.token_type == TokenType.RBRACE \
+                and not self._current_token.token_type == TokenType.EOF:
+
+            statement = yield self._statement()
+
+            if statement:
+                block_statement.statements.append(statement)
+
+            self._advance_tokens()
+
+        return block_statement
+
+
+    def _if(self) -> Task:
+
+        assert self._current_token is not None
+
+        if_expression = If(token=self._current_token)
+
+        if not self._expected_token(TokenType.LPAREN):
+            return None
+
+        self._advance_tokens()
+
+        if_expression.condition = yield self._expression(Precedence.LOWEST)
+
+        if not self._expected_token(TokenType.RPAREN):
+            return None
+
+        if not self._expected_token(TokenType.LBRACE):
+            return None
+
+        if_expression.consequence = yield self._block()
+
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.ELSE:
+
+            self._advance_tokens()
+
+            if not self._expected_token(TokenType.LBRACE):
+                return None
+
+            if_expression.alternative = yield self._block()
+
+        return if_expression
+
+
+    def _while_statement(self) -> Task:
+
+        assert self._current_token is not None
+
+        while_statement = While(token=self._current_token)
+
+        if not self._expected_token(TokenType.LPAREN):
+            return None
+
+        self._advance_tokens()
+
+        while_statement.condition = yield self._expression(Precedence.LOWEST)
+
+        if not self._expected_token(TokenType.RPAREN):
+            return None
+
+        if not self._expected_token(TokenType.LBRACE):
+            return None
+
+        while_statement.body = yield self._block()
+
+        return while_statement
+
+
+    def _function(self) -> Task:
+
+        assert self._current_token is not None
+
+        function = Function(token=self._current_token)
+
+        if not self._expected_token(TokenType.LPAREN):
+            return None
+
+        function.parameters = self._parse_function_parameters()
+
+        if not self._expected_token(TokenType.LBRACE):
+            return None
+
+        function.body = yield self._block()
+
+        return function
+
+
+    # Cada entrada de pending es una llamada a _parse_expression del Parser recursivo que quedó esperando su subexpresión derecha
+    def _expression(self, precedence: Precedence) -> Task:
+
+        pending: List[Pending] = []
+        operand: Optional[Expression] = None
+
+        while True:
+
+            assert self._current_token is not None and self._peek_token is not None
+
+            # Posición de prefijo: el token actual empieza una subexpresión
+            token_type = self._current_token.token_type
+            finished = True
+
+            if token_type in _LITERALS:
+
+                if token_type == TokenType.IDENT:
+                    operand = self._parse_identifier()
+
+                elif token_type == TokenType.INT:
+                    operand = self._parse_integer()
+
+                elif token_type == TokenType.STRING:
+                    operand = self._parse_string_literal()
+
+                else:
+                    operand = self._parse_boolean()
+
+                finished = False
+
+            elif token_type == TokenType.MINUS or token_type == TokenType.NEGATION:
+
+                prefix = Prefix(token=self._current_token,
+                                operator=self._current_token.literal)
+                pending.append((_PREFIX, prefix, Precedence.PREFIX, []))
+                self._advance_tokens()
+                continue
+
+            elif token_type == TokenType.LPAREN:
+
+                pending.append((_GROUP, None, Precedence.LOWEST, []))
+                self._advance_tokens()
+                continue
+
+            elif token_type == TokenType.IF:
+                operand = yield self._if()
+                finished = False
+
+            elif token_type == TokenType.FUNCTION:
+                operand = yield self._function()
+                finished = False
+
+            else:
+                message = f"No se encontró ninguna función para parsear {self._current_token.literal}"
+                self._add_error(message, self._current_token)
+                operand = None
+
+            # Posición de sufijo: tenemos un operando completo y decidimos si el siguiente operador se lo lleva o si cerramos subexpresiones pendientes
+            while True:
+
+                current_precedence = pending[-1][2] if pending else precedence
+
+                if not finished and operand is not None \
+                        and not self._peek_token.token_type == TokenType.SEMICOLON \
+                        and current_precedence < self._peek_precedence():
+
+                    self._advance_tokens()
+
+                    if self._current_token.token_type == TokenType.LPAREN:
+
+                        call = Call(self._current_token, operand)
+
+                        if self._peek_token.token_type == TokenType.RPAREN:
+                            self._advance_tokens()
+                            call.arguments = []
+                            operand = call
+                            continue
+
+                        pending.append((_CALL, call, Precedence.LOWEST, []))
+                        self._advance_tokens()
+                        break
+
+                    infix = Infix(token=self._current_token,
+                                  operator=self._current_token.literal,
+                                  left=operand)
+                    pending.append((_INFIX, infix, self._current_precedence(), []))
+                    self._advance_tokens()
+                    break
+
+                # La subexpresión de hasta arriba terminó con el valor de operand
+                if not pending:
+                    return operand
+
+                kind, node, _, arguments = pending.pop()
+                finished = False
+
+                if kind == _PREFIX:
+                    prefix = cast(Prefix, node)
+                    prefix.right = operand
+                    operand = prefix
+
+                elif kind == _INFIX:
+                    infix = cast(Infix, node)
+                    infix.right = operand
+                    operand = infix
+
+                elif kind == _GROUP:
+
+                    if not self._expected_token(TokenType.RPAREN):
+                        operand = None
+
+                else:
+                    call = cast(Call, node)
+
+                    if operand:
+                        arguments.append(operand)
+
+                    if self._peek_token.token_type == TokenType.COMMA:
+
+                        self._advance_tokens()
+                        self._advance_tokens()
+                        pending.append((_CALL, call, Precedence.LOWEST, arguments))
+                        break
+
+                    call.arguments = arguments if self._expected_token(TokenType.RPAREN) else None
+                    operand = call
+
+
+    def _skip_semicolon(self) -> None:
+
+        assert self._peek_token is not None
+
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
@@ -1,12 +1,33 @@
-from re import match
+from re import (
+    compile as compile_regex,
+    DOTALL,
+    match,
+    Match,
+    Pattern,
+    VERBOSE
+)
+
+from typing import (
+    Dict,
+    Optional
+)
+
+from typing_extensions import Protocol
 
 from lpp.token import (
+    KEYWORDS,
     Token,
     TokenType,
     lookup_token_type
 )
 
 
+# Cualquier objeto que nos vaya entregando tokens uno por uno puede alimentar al parser
+class TokenSource(Protocol):
+
+    def next_token(self) -> Token: ...
+
+
 class Lexer:
 
     def __init__(self, source: str) -> None:
@@ -221,4 +242,92 @@ class Lexer:
     def _skip_whitespace(self) -> None:
 
         while match(r"^\s$", self._character):
-            self._read_character()
\ No newline at end of file
+            self._read_character()
+
+
+_LETTERS = "a-záéíóúA-ZÁÉÍÓÚñÑ_"
+
+# Un único patrón precompilado que reconoce cualquier token del lenguaje, el grupo que hizo match nos dice qué tipo de token es
+TOKEN_PATTERN: Pattern = compile_regex(rf"""
+    \s*
+    (?:
+        (?P<identifier>[{_LETTERS}][{_LETTERS}\d]*)
+      | (?P<number>\d+)
+      | (?P<string>"[^"]*"?|'[^']*'?)
+      | (?P<operator>===|==|!==|!=|<=|>=|[-=+*/<>!(){{}},;])
+      | (?P<eof>\Z)
+      | (?P<illegal>.)
+    )
+""", VERBOSE | DOTALL)
+
+OPERATORS: Dict[str, TokenType] = {
+    "=": TokenType.ASSIGN,
+    "==": TokenType.EQ,
+    "===": TokenType.SIMILAR,
+    "!": TokenType.NEGATION,
+    "!=": TokenType.NOT_EQ,
+    "!==": TokenType.DIFF,
+    "<": TokenType.LT,
+    "<=": TokenType.LE,
+    ">": TokenType.GT,
+    ">=": TokenType.GE,
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.MULTIPLICATION,
+    "/": TokenType.DIVISION,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "{": TokenType.LBRACE,
+    "}": TokenType.RBRACE,
+    ",": TokenType.COMMA,
+    ";": TokenType.SEMICOLON,
+}
+
+
+def string_literal(lexeme: str) -> str:
+
+    # Quitamos la comilla de apertura y, si el string se cerró, también la de cierre
+    if len(lexeme) > 1 and lexeme[-1] == lexeme[0]:
+        return lexeme[1:-1]
+
+    return lexeme[1:]
+
+
+# Produce exactamente los mismos tokens que Lexer, pero en lugar de revisar caracter por caracter con una cadena de if/elif, hace un solo match por token
+class RegexLexer:
+
+    def __init__(self, source: str) -> None:
+
+        self._source: str = source
+        self._position: int = 0
+
+
+    def next_token(self) -> Token:
+
+        found: Optional[Match] = TOKEN_PATTERN.match(self._source, self._position)
+
+        assert found is not None
+
+        self._position = found.end()
+        kind = found.lastgroup
+
+        assert kind is not None
+
+        lexeme = found.group(kind)
+
+        if kind == "operator":
+            return Token(OPERATORS[lexeme], lexeme)
+
+        elif kind == "identifier":
+            return Token(KEYWORDS.get(lexeme, TokenType.IDENT), lexeme)
+
+        elif kind == "number":
+            return Token(TokenType.INT, lexeme)
+
+        elif kind == "string":
+            return Token(TokenType.STRING, string_literal(lexeme))
+
+        elif kind == "eof":
+            return Token(TokenType.EOF, "")
+
+        return Token(TokenType.ILLEGAL, lexeme)
\ No newline at end of file
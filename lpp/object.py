@@ -9,13 +9,15 @@ from enum import (
 )
 
 from typing import (
+    Any,
     Dict,
     List
 )
 
 from lpp.ast import (
     Block,
-    Identifier
+    Identifier,
+    Scope
 )
 
 from typing_extensions import Protocol
@@ -35,9 +37,15 @@ class ObjectType(Enum):
 
 class Object(ABC):
 
-    @abstractmethod
+    # Sin __dict__ cada objeto ocupa menos memoria y sus atributos se leen más rápido
+    __slots__ = ()
+
+    # El tipo de cada clase como atributo, el evaluador lo lee sin llamar a type()
+    TYPE: ObjectType
+
+
     def type(self) -> ObjectType:
-        pass
+        return self.TYPE
 
 
     @abstractmethod
@@ -47,36 +55,64 @@ class Object(ABC):
 
 class Integer(Object):
 
+    __slots__ = ("value",)
+
+    TYPE = ObjectType.INTEGER
+
+
     def __init__(self, value: int) -> None:
         self.value = value
 
-    
-    def type(self) -> ObjectType:
-        return ObjectType.INTEGER
-
 
     def inspect(self) -> str:
         return str(self.value)
 
 
+# Los enteros de este rango se crean una sola vez y se reutilizan, igual que hace CPython de -5 a 256
+SMALL_INTEGER_MIN = -5
+SMALL_INTEGER_MAX = 256
+
+_small_integers: List[Integer] = [Integer(value) for value in range(SMALL_INTEGER_MIN, SMALL_INTEGER_MAX + 1)]
+
+
+def configure_small_integers(minimum: int, maximum: int) -> None:
+
+    global SMALL_INTEGER_MIN, SMALL_INTEGER_MAX, _small_integers
+
+    SMALL_INTEGER_MIN = minimum
+    SMALL_INTEGER_MAX = maximum
+    _small_integers = [Integer(value) for value in range(minimum, maximum + 1)]
+
+
+# Los Integer nunca se modifican, así que el mismo objeto sirve para todos los lugares donde aparece un entero chico
+def to_integer_object(value: int) -> Integer:
+
+    if SMALL_INTEGER_MIN <= value <= SMALL_INTEGER_MAX:
+        return _small_integers[value - SMALL_INTEGER_MIN]
+
+    return Integer(value)
+
+
 class Boolean(Object):
 
+    __slots__ = ("value",)
+
+    TYPE = ObjectType.BOOLEAN
+
+
     def __init__(self, value: bool) -> None:
         self.value = value
 
-    
-    def type(self) -> ObjectType:
-        return ObjectType.BOOLEAN
-
 
     def inspect(self) -> str:
         return "verdadero" if self.value else "falso"
 
 
 class Null(Object):
-    
-    def type(self) -> ObjectType:
-        return ObjectType.NULL
+
+    __slots__ = ()
+
+    TYPE = ObjectType.NULL
 
 
     def inspect(self) -> str:
@@ -85,13 +121,14 @@ class Null(Object):
 
 class Return(Object):
 
+    __slots__ = ("value",)
+
+    TYPE = ObjectType.RETURN
+
+
     def __init__(self, value: Object) -> None:
         self.value = value
 
-    
-    def type(self) -> ObjectType:
-        return ObjectType.RETURN
-
 
     def inspect(self) -> str:
         return self.value.inspect()
@@ -99,15 +136,22 @@ class Return(Object):
 
 class Error(Object):
 
-    def __init__(self, message: str) -> None:
-        self.message = message
+    __slots__ = ("message", "line", "column")
+
+    TYPE = ObjectType.ERROR
 
-    
-    def type(self) -> ObjectType:
-        return ObjectType.ERROR
+
+    def __init__(self, message: str, line: int = 0, column: int = 0) -> None:
+        self.message = message
+        self.line = line
+        self.column = column
 
 
     def inspect(self) -> str:
+
+        if self.line > 0:
+            return f"Error: {self.message} (línea {self.line}, columna {self.column})"
+
         return f"Error: {self.message}"
 
 
@@ -116,6 +160,8 @@ class Environment(Dict):
     def __init__(self, outer = None):
         self._store = dict()
         self._outer = outer
+        # Cambia cada vez que se asigna o se borra una variable, los cachés de los identificadores lo comparan
+        self._version = 0
 
     
     def __getitem__(self, key):
@@ -132,14 +178,95 @@ class Environment(Dict):
 
     def __setitem__(self, key, value):
         self._store[key] = value
+        self._version += 1
 
 
     def __delitem__(self, key):
         del self._store[key]
+        self._version += 1
+
+
+    # Como __getitem__ pero sin lanzar KeyError, regresa UNSET si ningún ambiente tiene la variable
+    def lookup(self, key: str) -> Any:
+
+        value = self._store.get(key, UNSET)
+
+        if value is UNSET and self._outer is not None:
+            return self._outer.lookup(key)
+
+        return value
+
+
+    # Cambia la variable en el ambiente más cercano que la tenga, regresa False si ninguno la tiene
+    def assign(self, key: str, value: Any) -> bool:
+
+        if key in self._store:
+            self[key] = value
+            return True
+
+        return self._outer is not None and self._outer.assign(key, value)
+
+
+# El valor de una variable que todavía no se declara, distinto de None porque una variable puede guardar None
+UNSET: Any = object()
+
+
+# El ambiente de una llamada a función: sus variables viven en una lista y el resolver ya sabe el lugar de cada una
+class Frame(Environment):
+
+    def __init__(self, scope: Scope, values: List[Any], outer: Environment) -> None:
+        self._scope = scope
+        self._values = values
+        self._outer = outer
+
+
+    def __getitem__(self, key):
+
+        value = self.lookup(key)
+
+        if value is UNSET:
+            raise KeyError(key)
+
+        return value
+
+
+    def __setitem__(self, key, value):
+        self._values[self._scope.slots[key]] = value
+
+
+    def __delitem__(self, key):
+        self._values[self._scope.slots[key]] = UNSET
+
+
+    def lookup(self, key: str) -> Any:
+
+        slot = self._scope.slots.get(key)
+        value = UNSET if slot is None else self._values[slot]
+
+        if value is UNSET and self._outer is not None:
+            return self._outer.lookup(key)
+
+        return value
+
+
+    def assign(self, key: str, value: Any) -> bool:
+
+        slot = self._scope.slots.get(key)
+
+        if slot is not None and self._values[slot] is not UNSET:
+            self._values[slot] = value
+            return True
+
+        return self._outer is not None and self._outer.assign(key, value)
 
 
 class Function(Object):
 
+    __slots__ = ("parameters", "body", "env")
+
+    TYPE = ObjectType.FUNCTION
+
+
     def __init__(self, 
                 parameters: List[Identifier],
                 body: Block,
@@ -149,10 +276,6 @@ class Function(Object):
         self.body = body
         self.env = env
 
-    
-    def type(self) -> ObjectType:
-        return ObjectType.FUNCTION
-
 
     def inspect(self) -> str:
         params: str = ", ".join([str(param) for param in self.parameters])
@@ -161,14 +284,15 @@ class Function(Object):
 
 class String(Object):
 
+    __slots__ = ("value",)
+
+    TYPE = ObjectType.STRING
+
+
     def __init__(self, value: str) -> None:
 
         self.value = value
 
-    
-    def type(self) -> ObjectType:
-        return ObjectType.STRING
-
 
     def inspect(self) -> str:
         return self.value
@@ -182,14 +306,15 @@ class BuiltinFunction(Protocol):
 
 class Builtin(Object):
 
+    __slots__ = ("fn",)
+
+    TYPE = ObjectType.BUILTIN
+
+
     def __init__(self, fn: BuiltinFunction) -> None:
 
         self.fn = fn
 
-    
-    def type(self) -> ObjectType:
-        return ObjectType.BUILTIN
-
 
     def inspect(self) -> str:
         return "builtin function"
\ No newline at end of file
@@ -0,0 +1,264 @@
+from typing import (
+    cast,
+    List,
+    Optional
+)
+
+import lpp.ast as ast
+from lpp.evaluator import evaluate
+from lpp.object import (
+    Boolean,
+    Environment,
+    Integer,
+    String
+)
+from lpp.token import (
+    Token,
+    TokenType
+)
+
+
+_LITERALS = (ast.Integer, ast.Boolean, ast.StringLiteral)
+
+# Estos operadores siempre regresan un Boolean, nunca un error, sin importar el tipo de sus operandos
+_BOOLEAN_OPERATORS = ("==", "!=", "===", "!==")
+
+
+# Pasada opcional entre Parser.parse_program y evaluate: modifica el programa en su lugar y lo regresa
+def optimize(program: ast.Program) -> ast.Program:
+
+    program.statements = _optimize_statements(program.statements)
+
+    return program
+
+
+def _optimize_statements(statements: List[ast.Statement]) -> List[ast.Statement]:
+
+    result: List[ast.Statement] = []
+
+    for statement in statements:
+
+        optimized = _optimize_statement(statement)
+
+        # Un si con condición constante que es un statement por sí solo se reemplaza por las instrucciones de la rama que sí se ejecuta
+        if type(optimized) == ast.ExpressionStatement \
+                and type(optimized.expression) == ast.Block:
+
+            result.extend(cast(ast.Block, optimized.expression).statements)
+
+        else:
+            result.append(optimized)
+
+    return result
+
+
+def _optimize_statement(statement: ast.Statement) -> ast.Statement:
+
+    if type(statement) == ast.LetStatement:
+        statement = cast(ast.LetStatement, statement)
+        statement.value = _optimize_expression(statement.value)
+
+    elif type(statement) == ast.AssignStatement:
+        statement = cast(ast.AssignStatement, statement)
+        statement.value = _optimize_expression(statement.value)
+
+    elif type(statement) == ast.ReturnStatement:
+        statement = cast(ast.ReturnStatement, statement)
+        statement.return_value = _optimize_expression(statement.return_value)
+
+    elif type(statement) == ast.While:
+
+        while_statement = cast(ast.While, statement)
+        while_statement.condition = _optimize_expression(while_statement.condition)
+
+        if while_statement.body is not None:
+            while_statement.body = _optimize_block(while_statement.body)
+
+    elif type(statement) == ast.ExpressionStatement:
+
+        expression_statement = cast(ast.ExpressionStatement, statement)
+
+        if type(expression_statement.expression) == ast.If:
+            expression_statement.expression = _optimize_if_statement(cast(ast.If, expression_statement.expression))
+
+        else:
+            expression_statement.expression = _optimize_expression(expression_statement.expression)
+
+    return statement
+
+
+def _optimize_block(block: ast.Block) -> ast.Block:
+
+    block.statements = _optimize_statements(block.statements)
+
+    # Lo que viene después de un regresa nunca se ejecuta
+    for idx, statement in enumerate(block.statements):
+
+        if type(statement) == ast.ReturnStatement:
+            del block.statements[idx + 1:]
+            break
+
+    return block
+
+
+def _optimize_expression(expression: Optional[ast.Expression]) -> Optional[ast.Expression]:
+
+    if expression is None:
+        return None
+
+    node_type = type(expression)
+
+    if node_type == ast.Prefix:
+        return _optimize_prefix(cast(ast.Prefix, expression))
+
+    elif node_type == ast.Infix:
+        return _optimize_infix(cast(ast.Infix, expression))
+
+    elif node_type == ast.If:
+        return _optimize_if(cast(ast.If, expression))
+
+    elif node_type == ast.Function:
+
+        function = cast(ast.Function, expression)
+
+        if function.body is not None:
+            function.body = _optimize_block(function.body)
+
+    elif node_type == ast.Call:
+
+        call = cast(ast.Call, expression)
+        function_expression = _optimize_expression(call.function)
+
+        assert function_expression is not None
+        call.function = function_expression
+
+        if call.arguments is not None:
+            call.arguments = [cast(ast.Expression, _optimize_expression(argument)) for argument in call.arguments]
+
+    return expression
+
+
+def _optimize_prefix(prefix: ast.Prefix) -> ast.Expression:
+
+    prefix.right = _optimize_expression(prefix.right)
+
+    if type(prefix.right) in _LITERALS:
+        return _fold(prefix)
+
+    # !!b es b solo si b ya es un Boolean, si no !! lo convertiría en uno
+    if prefix.operator == "!" and type(prefix.right) == ast.Prefix:
+
+        inner = cast(ast.Prefix, prefix.right)
+
+        if inner.operator == "!" and inner.right is not None and _is_boolean(inner.right):
+            return inner.right
+
+    return prefix
+
+
+def _optimize_infix(infix: ast.Infix) -> ast.Expression:
+
+    left = _optimize_expression(infix.left)
+
+    assert left is not None
+    infix.left = left
+    infix.right = _optimize_expression(infix.right)
+
+    if type(infix.left) in _LITERALS and type(infix.right) in _LITERALS:
+        return _fold(infix)
+
+    return infix
+
+
+def _optimize_if(if_expression: ast.If) -> ast.Expression:
+
+    if_expression.condition = _optimize_expression(if_expression.condition)
+
+    if if_expression.consequence is not None:
+        if_expression.consequence = _optimize_block(if_expression.consequence)
+
+    if if_expression.alternative is not None:
+        if_expression.alternative = _optimize_block(if_expression.alternative)
+
+    if type(if_expression.condition) not in _LITERALS or if_expression.consequence is None:
+        return if_expression
+
+    assert if_expression.condition is not None
+
+    # La rama que nunca se ejecuta se descarta, el si se queda para conservar el valor que regresa como expresión
+    if _is_truthy_literal(if_expression.condition):
+        if_expression.alternative = None
+
+    else:
+        if_expression.consequence = ast.Block(if_expression.consequence.token, [])
+
+    return if_expression
+
+
+# Como statement, un si con condición constante se puede reemplazar por el bloque que sí se ejecuta (que luego se inserta en el bloque que lo contiene)
+def _optimize_if_statement(if_expression: ast.If) -> ast.Expression:
+
+    optimized = _optimize_if(if_expression)
+
+    if type(optimized) != ast.If or type(if_expression.condition) not in _LITERALS:
+        return optimized
+
+    assert if_expression.condition is not None
+    branch = if_expression.consequence if _is_truthy_literal(if_expression.condition) else if_expression.alternative
+
+    # Un bloque vacío regresa None y un si sin rama regresa nulo, en esos casos el si se queda
+    if branch is None or len(branch.statements) == 0:
+        return optimized
+
+    return branch # type: ignore
+
+
+# Evalúa una expresión cuyos operandos son literales y la reemplaza por el literal del resultado, los errores se dejan para que ocurran al ejecutar
+def _fold(expression: ast.Expression) -> ast.Expression:
+
+    try:
+        result = evaluate(expression, Environment())
+
+    except ZeroDivisionError:
+        return expression
+
+    token = expression.token
+
+    if type(result) == Integer:
+        value = cast(Integer, result).value
+        return ast.Integer(Token(TokenType.INT, str(value), token.line, token.column), value)
+
+    elif type(result) == String:
+        text = cast(String, result).value
+        return ast.StringLiteral(Token(TokenType.STRING, text, token.line, token.column), text)
+
+    elif type(result) == Boolean:
+        truth = cast(Boolean, result).value
+        token_type, literal = (TokenType.TRUE, "verdadero") if truth else (TokenType.FALSE, "falso")
+        return ast.Boolean(Token(token_type, literal, token.line, token.column), truth)
+
+    return expression
+
+
+def _is_truthy_literal(literal: ast.Expression) -> bool:
+
+    # Igual que _is_truthy del evaluador: solo falso es falso, 0 y "" son verdaderos
+    return not (type(literal) == ast.Boolean and not cast(ast.Boolean, literal).value)
+
+
+# Expresiones que siempre producen un Boolean
+def _is_boolean(expression: ast.Expression) -> bool:
+
+    if type(expression) == ast.Boolean:
+        return True
+
+    elif type(expression) == ast.Prefix:
+        prefix = cast(ast.Prefix, expression)
+        return prefix.operator == "!" and prefix.right is not None
+
+    elif type(expression) == ast.Infix:
+        infix = cast(ast.Infix, expression)
+        return infix.operator in _BOOLEAN_OPERATORS and infix.left is not None and infix.right is not None
+
+    return False
+
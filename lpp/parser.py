@@ -8,6 +8,7 @@ from typing import (
 )
 
 from lpp.ast import (
+    AssignStatement,
     Block,
     Boolean,
     Call,
@@ -23,9 +24,10 @@ from lpp.ast import (
     Program,
     ReturnStatement,
     Statement,
-    StringLiteral
+    StringLiteral,
+    While
 )
-from lpp.lexer import Lexer
+from lpp.lexer import TokenSource
 from lpp.token import (
     Token,
     TokenType
@@ -68,7 +70,7 @@ PRECEDENCES: Dict[TokenType, Precedence] = {
 
 class Parser:
 
-    def __init__(self, lexer: Lexer) -> None:
+    def __init__(self, lexer: TokenSource) -> None:
 
         self._lexer = lexer
         self._current_token: Optional[Token] = None
@@ -88,23 +90,45 @@ class Parser:
         return self._errors
 
 
+    @property
+    def finished(self) -> bool:
+
+        assert self._current_token is not None
+        return self._current_token.token_type == TokenType.EOF
+
+
     def parse_program(self) -> Program:
         
         program: Program = Program(statements=[])
-        assert self._current_token is not None
 
-        while self._current_token.token_type != TokenType.EOF:
+        while not self.finished:
 
-            statement = self._parse_statement()
+            statement = self.parse_next_statement()
             
             if statement is not None:
                 program.statements.append(statement)
 
-            self._advance_tokens()
-
         return program
 
 
+    # Parsea un solo statement de nivel superior y deja al parser listo para el siguiente
+    def parse_next_statement(self) -> Optional[Statement]:
+
+        statement = self._parse_statement()
+        self._advance_tokens()
+
+        return statement
+
+
+    def _add_error(self, message: str, token: Token) -> None:
+
+        # Si el token sabe de dónde salió, le decimos al usuario en qué parte del código está el error
+        if token.line > 0:
+            message += f" (línea {token.line}, columna {token.column})"
+
+        self._errors.append(message)
+
+
     def _advance_tokens(self) -> None:
 
         self._current_token = self._peek_token
@@ -141,7 +165,28 @@ class Parser:
         error = f"Se esperaba que el siguiente token fuera {token_type} " + \
                 f"pero se obtuvo {self._peek_token.token_type}"
 
-        self._errors.append(error)
+        self._add_error(error, self._peek_token)
+
+
+    def _parse_assign_statement(self) -> AssignStatement:
+
+        assert self._current_token is not None
+
+        assign_statement = AssignStatement(token=self._current_token,
+                                            name=self._parse_identifier())
+
+        # Estamos en el nombre, nos saltamos el "=" para quedar en el valor
+        self._advance_tokens()
+        self._advance_tokens()
+
+        assign_statement.value = self._parse_expression(Precedence.LOWEST)
+
+        assert self._peek_token is not None
+
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
+
+        return assign_statement
 
 
     def _parse_block(self) -> Block:
@@ -224,7 +269,7 @@ class Parser:
 
         except KeyError:
             message = f"No se encontró ninguna función para parsear {self._current_token.literal}"
-            self._errors.append(message)
+            self._add_error(message, self._current_token)
             return None
 
         left_expression = prefix_parse_fn()
@@ -234,13 +279,15 @@ class Parser:
         while not self._peek_token.token_type == TokenType.SEMICOLON and \
                 precedence < self._peek_precedence():
 
+            # Si el lado izquierdo no se pudo parsear, el error ya quedó registrado y no hay nada a qué aplicarle el operador
+            if left_expression is None:
+                return None
+
             try:
                 infix_parse_fn = self._infix_parse_fns[self._peek_token.token_type]
 
                 self._advance_tokens()
 
-                assert left_expression is not None
-
                 left_expression = infix_parse_fn(left_expression)
 
             except KeyError:
@@ -406,7 +453,7 @@ class Parser:
             message = f"No se ha podido parsear {self._current_token.literal} " + \
                         "como entero."
             
-            self._errors.append(message)
+            self._add_error(message, self._current_token)
 
             return None
 
@@ -480,6 +527,14 @@ class Parser:
         elif self._current_token.token_type == TokenType.RETURN:
             return self._parse_return_statement()
 
+        elif self._current_token.token_type == TokenType.WHILE:
+            return self._parse_while_statement()
+
+        # Un identificador seguido de = es una reasignación, no una expresión
+        elif self._current_token.token_type == TokenType.IDENT \
+                and self._peek_token is not None and self._peek_token.token_type == TokenType.ASSIGN:
+            return self._parse_assign_statement()
+
         else:
             return self._parse_expression_statement()
 
@@ -492,6 +547,30 @@ class Parser:
                             value=self._current_token.literal)
 
 
+    def _parse_while_statement(self) -> Optional[While]:
+
+        assert self._current_token is not None
+
+        while_statement = While(token=self._current_token)
+
+        if not self._expected_token(TokenType.LPAREN):
+            return None
+
+        self._advance_tokens()
+
+        while_statement.condition = self._parse_expression(Precedence.LOWEST)
+
+        if not self._expected_token(TokenType.RPAREN):
+            return None
+
+        if not self._expected_token(TokenType.LBRACE):
+            return None
+
+        while_statement.body = self._parse_block()
+
+        return while_statement
+
+
     def _peek_precedence(self) -> Precedence:
 
         assert self._peek_token is not None
@@ -2,19 +2,33 @@ import readline
 
 from re import match
 
-from typing import List
+from typing import (
+    List,
+    Optional
+)
 
 from os import system, name 
 
 from lpp.ast import Program
-from lpp.evaluator import evaluate
-from lpp.lexer import Lexer
+from lpp.budget import (
+    Budget,
+    evaluate_with_budget,
+    new_budget
+)
+from lpp.code import disassemble
+from lpp.compiler import compile_program
+from lpp.engines import (
+    DEFAULT_ENGINE,
+    ENGINES
+)
 from lpp.object import Environment
+from lpp.optimizer import optimize
 from lpp.parser import Parser
 from lpp.token import (
     Token,
     TokenType
 )
+from lpp.token_buffer import TokenBuffer
 
 EOF_TOKEN: Token = Token(TokenType.EOF, "")
 ENGLISH_WORDS = ("clear", "clear()", "exit", "exit()", "history", "history()", "exit", "exit()")
@@ -36,19 +50,34 @@ def _print_parse_errors(errors: List[str]):
         print(error)
 
 
-def execute_program(scanned):
+# Solo se evalúa la línea nueva, el ambiente de la sesión conserva lo que definieron las anteriores
+def execute_program(source: str,
+                    env: Environment,
+                    optimized: bool = False,
+                    engine: str = DEFAULT_ENGINE,
+                    disassembled: bool = False,
+                    budget: Optional[Budget] = None):
     
-    lexer: Lexer = Lexer(" ".join(scanned))
-    parser: Parser = Parser(lexer)
+    # Los tokens de TokenBuffer traen línea y columna, así los errores de parseo y de ejecución dicen dónde ocurrieron
+    parser: Parser = Parser(TokenBuffer(source))
 
     program: Program = parser.parse_program()
-    env: Environment = Environment()
 
     if len(parser.errors) > 0:
         _print_parse_errors(parser.errors)
         return 0
 
-    evaluated = evaluate(program, env)
+    if optimized:
+        program = optimize(program)
+
+    if disassembled:
+        print(disassemble(compile_program(program)))
+
+    if budget is None:
+        evaluated = ENGINES[engine](program, env)
+
+    else:
+        evaluated = evaluate_with_budget(ENGINES[engine], program, env, budget)
 
     if evaluated is not None:
 
@@ -57,9 +86,15 @@ def execute_program(scanned):
     return 1
 
 
-def start_repl():
+# Con pasos o segundos cada línea recibe su propio presupuesto
+def start_repl(optimized: bool = False,
+               engine: str = DEFAULT_ENGINE,
+               disassembled: bool = False,
+               steps: Optional[int] = None,
+               seconds: Optional[float] = None):
 
     scanned: List[str] = []
+    env: Environment = Environment()
     
     # Walrus operator, asigna a la vez que compara
     while (source := input(">> ")) != "salir()":
@@ -89,7 +124,7 @@ def start_repl():
                     source_obtained = scanned[command_position - 1]
 
                     scanned.append(source_obtained)
-                    execute_program(scanned)
+                    execute_program(source_obtained, env, optimized, engine, disassembled, new_budget(steps, seconds))
             
             except ValueError:
                 print(f"La opción {command} no es un número.")
@@ -98,4 +133,4 @@ def start_repl():
             
             if source != "":
                 scanned.append(source)
-                execute_program(scanned)
\ No newline at end of file
+                execute_program(source, env, optimized, engine, disassembled, new_budget(steps, seconds))
\ No newline at end of file
@@ -0,0 +1,225 @@
+from typing import (
+    cast,
+    Dict,
+    List,
+    Optional
+)
+
+import lpp.ast as ast
+
+
+# Le pone a cada identificador la función donde se declaró su variable (depth) y el lugar que ocupa en su marco (slot)
+class Resolver:
+
+    def __init__(self) -> None:
+
+        # Las funciones que encierran al nodo que estamos visitando, la más interna al final
+        self._scopes: List[ast.Scope] = []
+
+
+    def resolve_program(self, program: ast.Program) -> ast.Program:
+
+        for statement in program.statements:
+            self._resolve(statement)
+
+        return program
+
+
+    def _resolve(self, node: Optional[ast.ASTNode]) -> None:
+
+        node_type = type(node)
+
+        if node_type == ast.ExpressionStatement:
+            self._resolve(cast(ast.ExpressionStatement, node).expression)
+
+        elif node_type == ast.LetStatement:
+
+            let_statement = cast(ast.LetStatement, node)
+
+            assert let_statement.name is not None
+
+            self._resolve(let_statement.value)
+            self._resolve_identifier(let_statement.name)
+
+        elif node_type == ast.AssignStatement:
+
+            assign_statement = cast(ast.AssignStatement, node)
+
+            assert assign_statement.name is not None
+
+            self._resolve(assign_statement.value)
+            self._resolve_identifier(assign_statement.name)
+
+        elif node_type == ast.ReturnStatement:
+            self._resolve(cast(ast.ReturnStatement, node).return_value)
+
+        elif node_type == ast.While:
+
+            while_statement = cast(ast.While, node)
+
+            self._resolve(while_statement.condition)
+            self._resolve(while_statement.body)
+
+        elif node_type == ast.Block:
+
+            for statement in cast(ast.Block, node).statements:
+                self._resolve(statement)
+
+        elif node_type == ast.Identifier:
+            self._resolve_identifier(cast(ast.Identifier, node))
+
+        elif node_type == ast.Prefix:
+            self._resolve(cast(ast.Prefix, node).right)
+
+        elif node_type == ast.Infix:
+
+            infix = cast(ast.Infix, node)
+
+            self._resolve(infix.left)
+            self._resolve(infix.right)
+
+        elif node_type == ast.If:
+
+            if_expression = cast(ast.If, node)
+
+            self._resolve(if_expression.condition)
+            self._resolve(if_expression.consequence)
+            self._resolve(if_expression.alternative)
+
+        elif node_type == ast.Call:
+
+            call = cast(ast.Call, node)
+
+            assert call.arguments is not None
+
+            self._resolve(call.function)
+
+            for argument in call.arguments:
+                self._resolve(argument)
+
+        elif node_type == ast.Function:
+            self._resolve_function(cast(ast.Function, node))
+
+
+    def _resolve_function(self, function: ast.Function) -> None:
+
+        assert function.body is not None
+
+        names: List[str] = [parameter.value for parameter in function.parameters]
+        # Con parámetros repetidos gana el último, igual que en el evaluador
+        slots: Dict[str, int] = {name: slot for slot, name in enumerate(names)}
+
+        # Una variable existe en toda la función aunque se lea antes de declararla, hasta que se asigna su lugar vale UNSET
+        for name in _declared_names(function.body.statements):
+
+            if name not in slots:
+                slots[name] = len(names)
+                names.append(name)
+
+        scope = ast.Scope(names, slots, len(function.parameters))
+        function.body.scope = scope
+
+        self._scopes.append(scope)
+
+        for parameter in function.parameters:
+            self._resolve_identifier(parameter)
+
+        self._resolve(function.body)
+
+        self._scopes.pop()
+
+
+    def _resolve_identifier(self, identifier: ast.Identifier) -> None:
+
+        for depth, scope in enumerate(reversed(self._scopes)):
+
+            slot = scope.slots.get(identifier.value)
+
+            if slot is not None:
+                identifier.depth = depth
+                identifier.slot = slot
+                return
+
+        # Ninguna función la declara: está en el ambiente global o es un builtin
+        identifier.depth = len(self._scopes)
+        identifier.slot = ast.GLOBAL
+
+
+def resolve(program: ast.Program) -> ast.Program:
+
+    return Resolver().resolve_program(program)
+
+
+# Los nombres que declara un cuerpo con variable, incluidos los bloques de sus si y mientras pero no las funciones que contiene
+def _declared_names(statements: List[ast.Statement]) -> List[str]:
+
+    names: List[str] = []
+
+    for statement in statements:
+        _collect_declared_names(statement, names)
+
+    return names
+
+
+def _collect_declared_names(node: Optional[ast.ASTNode], names: List[str]) -> None:
+
+    node_type = type(node)
+
+    if node_type == ast.LetStatement:
+
+        let_statement = cast(ast.LetStatement, node)
+
+        assert let_statement.name is not None
+
+        names.append(let_statement.name.value)
+        _collect_declared_names(let_statement.value, names)
+
+    elif node_type == ast.ExpressionStatement:
+        _collect_declared_names(cast(ast.ExpressionStatement, node).expression, names)
+
+    elif node_type == ast.AssignStatement:
+        _collect_declared_names(cast(ast.AssignStatement, node).value, names)
+
+    elif node_type == ast.ReturnStatement:
+        _collect_declared_names(cast(ast.ReturnStatement, node).return_value, names)
+
+    elif node_type == ast.While:
+
+        while_statement = cast(ast.While, node)
+
+        _collect_declared_names(while_statement.condition, names)
+        _collect_declared_names(while_statement.body, names)
+
+    elif node_type == ast.Block:
+
+        for statement in cast(ast.Block, node).statements:
+            _collect_declared_names(statement, names)
+
+    elif node_type == ast.If:
+
+        if_expression = cast(ast.If, node)
+
+        _collect_declared_names(if_expression.condition, names)
+        _collect_declared_names(if_expression.consequence, names)
+        _collect_declared_names(if_expression.alternative, names)
+
+    elif node_type == ast.Prefix:
+        _collect_declared_names(cast(ast.Prefix, node).right, names)
+
+    elif node_type == ast.Infix:
+
+        infix = cast(ast.Infix, node)
+
+        _collect_declared_names(infix.left, names)
+        _collect_declared_names(infix.right, names)
+
+    elif node_type == ast.Call:
+
+        call = cast(ast.Call, node)
+
+        assert call.arguments is not None
+
+        _collect_declared_names(call.function, names)
+
+        for argument in call.arguments:
+            _collect_declared_names(argument, names)
@@ -0,0 +1,225 @@
+import sys
+
+from functools import partial
+
+from typing import (
+    cast,
+    List,
+    Optional
+)
+
+import lpp.ast as ast
+from lpp.budget import (
+    Budget,
+    evaluate_with_budget
+)
+from lpp.cache import script_cache
+from lpp.code import disassemble
+from lpp.compiler import compile_program
+from lpp.engines import (
+    DEFAULT_ENGINE,
+    Engine,
+    ENGINES
+)
+from lpp.object import (
+    Environment,
+    Error,
+    Return
+)
+from lpp.optimizer import optimize
+from lpp.parser import Parser
+from lpp.stream_lexer import (
+    open_lexer,
+    Stream,
+    StreamLexer
+)
+from lpp.token_buffer import TokenBuffer
+
+# Los códigos de sysexits.h para datos de entrada inválidos y para un error del programa
+EXIT_PARSE_ERROR = 65
+EXIT_RUNTIME_ERROR = 70
+
+_UNREADABLE_FILE = "No se pudo leer el archivo: {}"
+
+
+# Con cached, un script que no cambió desde la última vez se carga de su __lppcache__ en lugar de lexearlo y parsearlo de nuevo
+def run_file(path: str,
+             optimized: bool = False,
+             engine: str = DEFAULT_ENGINE,
+             disassembled: bool = False,
+             budget: Optional[Budget] = None,
+             cached: bool = False) -> int:
+
+    try:
+
+        if cached:
+            return _run_cached_file(path, optimized, engine, disassembled, budget)
+
+        with open_lexer(path) as lexer:
+            return run_statements(Parser(lexer), optimized, engine, disassembled, budget)
+
+    except (OSError, UnicodeDecodeError) as error:
+        print(_UNREADABLE_FILE.format(error), file=sys.stderr)
+        return EXIT_PARSE_ERROR
+
+
+# Lee de la entrada estándar sin su buffer, así cada pedazo que llega por el pipe se procesa en cuanto está disponible
+def run_stdin(optimized: bool = False,
+              engine: str = DEFAULT_ENGINE,
+              disassembled: bool = False,
+              budget: Optional[Budget] = None) -> int:
+
+    stream: Stream = sys.stdin.buffer.raw # type: ignore
+
+    return run_stream(stream, optimized, engine, disassembled, budget)
+
+
+def run_stream(stream: Stream,
+               optimized: bool = False,
+               engine: str = DEFAULT_ENGINE,
+               disassembled: bool = False,
+               budget: Optional[Budget] = None) -> int:
+
+    return run_statements(Parser(StreamLexer(stream)), optimized, engine, disassembled, budget)
+
+
+# Evalúa cada statement de nivel superior en cuanto se termina de parsear, sin esperar al resto del programa
+# Un mismo presupuesto cubre todos los statements, así los pasos y el tiempo son los del script completo
+# Si recibe parsed, ahí quedan los statements que se parsearon, completos solo si el programa llegó hasta el final
+def run_statements(parser: Parser,
+                   optimized: bool = False,
+                   engine: str = DEFAULT_ENGINE,
+                   disassembled: bool = False,
+                   budget: Optional[Budget] = None,
+                   parsed: Optional[List[ast.Statement]] = None) -> int:
+
+    env: Environment = Environment()
+    evaluate = ENGINES[engine]
+
+    while not parser.finished:
+
+        statement = parser.parse_next_statement()
+
+        if parser.errors:
+            return _report_parse_errors(parser)
+
+        if statement is None:
+            continue
+
+        if parsed is not None:
+            parsed.append(statement)
+
+        exit_code = _run_statement(statement, env, evaluate, optimized, disassembled, budget)
+
+        if exit_code is not None:
+            return exit_code
+
+    return 0
+
+
+# Igual que run_statements, pero con un programa que ya está parseado completo
+def run_program(program: ast.Program,
+                optimized: bool = False,
+                engine: str = DEFAULT_ENGINE,
+                disassembled: bool = False,
+                budget: Optional[Budget] = None) -> int:
+
+    env: Environment = Environment()
+    evaluate = ENGINES[engine]
+
+    for statement in program.statements:
+
+        exit_code = _run_statement(statement, env, evaluate, optimized, disassembled, budget)
+
+        if exit_code is not None:
+            return exit_code
+
+    return 0
+
+
+# Regresa el código de salida si el programa termina con este statement, None si hay que seguir
+def _run_statement(statement: ast.Statement,
+                   env: Environment,
+                   evaluate: Engine,
+                   optimized: bool,
+                   disassembled: bool,
+                   budget: Optional[Budget]) -> Optional[int]:
+
+    program = ast.Program(statements=[statement])
+
+    if optimized:
+        program = optimize(program)
+
+    if disassembled:
+        print(disassemble(compile_program(program)))
+
+    # Con keep_return el motor entrega envuelto el Return de un regresa que llegó al nivel superior, ahí termina el programa
+    if budget is None:
+        evaluated = evaluate(program, env, keep_return=True)
+
+    else:
+        evaluated = evaluate_with_budget(partial(evaluate, keep_return=True), program, env, budget)
+
+    returned = type(evaluated) is Return
+
+    if returned:
+        evaluated = cast(Return, evaluated).value
+
+    if type(evaluated) is Error:
+        print(evaluated.inspect(), file=sys.stderr)
+        return EXIT_RUNTIME_ERROR
+
+    if evaluated is not None:
+        print(evaluated.inspect(), flush=True)
+
+    if returned:
+        return 0
+
+    return None
+
+
+# Para calcular el hash hay que leer el archivo completo, así que aquí no se lee por pedazos
+def _run_cached_file(path: str,
+                     optimized: bool,
+                     engine: str,
+                     disassembled: bool,
+                     budget: Optional[Budget]) -> int:
+
+    with open(path, encoding="utf-8") as file:
+        source = file.read()
+
+    cache = script_cache(path)
+    program = cache.load(source)
+
+    if program is not None:
+        return run_program(program, optimized, engine, disassembled, budget)
+
+    parser = Parser(TokenBuffer(source))
+    parsed: List[ast.Statement] = []
+    exit_code = run_statements(parser, optimized, engine, disassembled, budget, parsed)
+
+    # Solo guardamos los programas que se parsearon completos y sin errores
+    if parser.finished and not parser.errors:
+
+        try:
+            cache.store(source, ast.Program(statements=parsed))
+
+        # Un directorio en el que no se puede escribir solo significa que la próxima vez se parsea de nuevo
+        except OSError:
+            pass
+
+    return exit_code
+
+
+# Lo que ya se ejecutó no se puede deshacer, pero seguimos parseando para reportar todos los errores de una vez
+def _report_parse_errors(parser: Parser) -> int:
+
+    while not parser.finished:
+        parser.parse_next_statement()
+
+    errors: List[str] = parser.errors
+
+    for error in errors:
+        print(error, file=sys.stderr)
+
+    return EXIT_PARSE_ERROR
@@ -0,0 +1,425 @@
+import json
+import socketserver
+
+from math import isfinite
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from os import (
+    cpu_count,
+    path,
+    remove,
+    stat
+)
+from queue import Queue
+from socket import (
+    AF_UNIX,
+    socket,
+    SOCK_STREAM
+)
+from stat import S_ISSOCK
+from struct import Struct
+
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    NamedTuple,
+    Optional
+)
+
+from lpp.budget import (
+    evaluate_with_budget,
+    new_budget
+)
+from lpp.engines import (
+    DEFAULT_ENGINE,
+    ENGINES
+)
+from lpp.object import (
+    Environment,
+    Error
+)
+from lpp.optimizer import optimize
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+import lpp.stack_evaluator as stack_evaluator
+
+DEFAULT_TIMEOUT = 10.0
+# El presupuesto de tiempo detiene a los programas dentro del proceso, solo si ni así responde lo matamos después de esto
+KILL_GRACE = 1.0
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# Lo que puede regresar el servidor en "estado"
+OK = "ok"
+PARSE_ERROR = "sintaxis"
+RUNTIME_ERROR = "ejecucion"
+TIMEOUT = "tiempo"
+INVALID_REQUEST = "peticion"
+
+# Cada mensaje es su tamaño en 4 bytes big endian seguido del JSON en UTF-8
+_LENGTH = Struct(">I")
+
+_INTERNAL_ERROR = "Error interno del intérprete: {}"
+_INVALID_MESSAGE = "Mensaje inválido: {}"
+_MESSAGE_TOO_LARGE = "El mensaje de {} bytes excede el máximo de {}"
+_TRUNCATED_MESSAGE = "La conexión se cerró a mitad de un mensaje"
+_TIMEOUT = "El programa excedió el tiempo máximo de {} segundos"
+_WORKER_DIED = "El proceso que ejecutaba el programa terminó inesperadamente"
+_INVALID_FIELD = "El campo {} no es válido"
+
+# Un programa que pasa por todo lo que usan los motores, para que la primera petición real no pague la carga de nada
+_WARM_UP = """
+    variable suma = funcion(x, y) { x + y };
+    variable i = 0;
+    mientras (i < 2) { i = suma(i, 1); }
+    si (longitud("ab") == i) { regresa "listo"; }
+"""
+
+
+# Lo que el servidor manda a un proceso trabajador, seconds también es el presupuesto de tiempo dentro del proceso
+class Job(NamedTuple):
+
+    source: str
+    engine: str = DEFAULT_ENGINE
+    optimized: bool = False
+    steps: Optional[int] = None
+    seconds: float = DEFAULT_TIMEOUT
+
+
+def send_message(connection: socket, message: Dict[str, Any]) -> None:
+
+    data = json.dumps(message, ensure_ascii=False).encode("utf-8")
+
+    connection.sendall(_LENGTH.pack(len(data)) + data)
+
+
+# Regresa None si la conexión se cerró limpiamente antes de un nuevo mensaje
+def receive_message(connection: socket) -> Optional[Dict[str, Any]]:
+
+    header = _receive_exactly(connection, _LENGTH.size)
+
+    if not header:
+        return None
+
+    if len(header) < _LENGTH.size:
+        raise ValueError(_TRUNCATED_MESSAGE)
+
+    size = _LENGTH.unpack(header)[0]
+
+    if size > MAX_MESSAGE_BYTES:
+        raise ValueError(_MESSAGE_TOO_LARGE.format(size, MAX_MESSAGE_BYTES))
+
+    data = _receive_exactly(connection, size)
+
+    if len(data) < size:
+        raise ValueError(_TRUNCATED_MESSAGE)
+
+    message = json.loads(data.decode("utf-8"))
+
+    if not isinstance(message, dict):
+        raise ValueError(_INVALID_MESSAGE.format(type(message).__name__))
+
+    return message
+
+
+def _receive_exactly(connection: socket, size: int) -> bytes:
+
+    chunks: List[bytes] = []
+    remaining = size
+
+    while remaining > 0:
+
+        chunk = connection.recv(remaining)
+
+        if not chunk:
+            break
+
+        chunks.append(chunk)
+        remaining -= len(chunk)
+
+    return b"".join(chunks)
+
+
+def _response(status: str, result: Optional[str] = None, errors: Optional[List[str]] = None) -> Dict[str, Any]:
+
+    return {"estado": status, "resultado": result, "errores": errors or []}
+
+
+# Lo que hace un proceso trabajador con cada programa, cada uno corre en un ambiente nuevo
+def run_job(job: Job) -> Dict[str, Any]:
+
+    parser: Parser = Parser(TokenBuffer(job.source))
+    program = parser.parse_program()
+
+    if len(parser.errors) > 0:
+        return _response(PARSE_ERROR, errors=parser.errors)
+
+    if job.optimized:
+        program = optimize(program)
+
+    budget = new_budget(job.steps, job.seconds)
+
+    if budget is None:
+        evaluated = ENGINES[job.engine](program, Environment())
+
+    else:
+        evaluated = evaluate_with_budget(ENGINES[job.engine], program, Environment(), budget)
+
+    if type(evaluated) is Error:
+        status = TIMEOUT if budget is not None and budget.timed_out else RUNTIME_ERROR
+        return _response(status, errors=[cast(Error, evaluated).inspect()])
+
+    return _response(OK, None if evaluated is None else evaluated.inspect())
+
+
+def _work(connection: Connection, max_call_depth: int) -> None:
+
+    stack_evaluator.MAX_CALL_DEPTH = max_call_depth
+
+    for engine in ENGINES:
+        run_job(Job(_WARM_UP, engine))
+
+    while True:
+
+        try:
+            job = connection.recv()
+
+        except EOFError:
+            return
+
+        try:
+            response = run_job(job)
+
+        # Un RecursionError del evaluador, por ejemplo, no debe tumbar al proceso
+        except Exception as error:
+            response = _response(RUNTIME_ERROR, errors=[_INTERNAL_ERROR.format(error)])
+
+        connection.send(response)
+
+
+class _Worker:
+
+    def __init__(self, context: BaseContext) -> None:
+
+        self._connection, child = context.Pipe()
+        self._process = context.Process(target=_work, args=(child, stack_evaluator.MAX_CALL_DEPTH), daemon=True) # type: ignore
+        self._process.start()
+
+        child.close()
+
+
+    # None si el programa no terminó a tiempo
+    def run(self, job: Job, timeout: float) -> Optional[Dict[str, Any]]:
+
+        try:
+
+            self._connection.send(job)
+
+            if not self._connection.poll(timeout):
+                return None
+
+            return self._connection.recv()
+
+        except (EOFError, OSError):
+            return _response(RUNTIME_ERROR, errors=[_WORKER_DIED])
+
+
+    def stop(self) -> None:
+
+        self._process.kill()
+        self._process.join()
+        self._connection.close()
+
+
+    @property
+    def alive(self) -> bool:
+        return self._process.is_alive()
+
+
+# Procesos que ya importaron y calentaron el intérprete, cada uno ejecuta un programa a la vez
+class WorkerPool:
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+
+        # Con forkserver cada proceso nuevo parte de uno que ya tiene lpp importado, y no se hace fork de un proceso con hilos
+        self._context: BaseContext = get_context("forkserver")
+        self._context.set_forkserver_preload(["lpp.server"])
+
+        self._size: int = workers or cpu_count() or 1
+        self._idle: "Queue[_Worker]" = Queue()
+
+        for _ in range(self._size):
+            self._idle.put(_Worker(self._context))
+
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+    # Espera a que haya un proceso libre, si el programa no responde a tiempo matamos el proceso y ponemos uno nuevo en su lugar
+    def run(self, job: Job) -> Dict[str, Any]:
+
+        worker = self._idle.get()
+
+        try:
+
+            response = worker.run(job, job.seconds + KILL_GRACE)
+
+            if response is None or not worker.alive:
+                worker.stop()
+                worker = _Worker(self._context)
+
+            if response is None:
+                response = _response(TIMEOUT, errors=[_TIMEOUT.format(job.seconds)])
+
+            return response
+
+        # Si algo falla a medio camino el proceso puede seguir ocupado con el programa, así no puede volver a los libres
+        except Exception:
+
+            worker.stop()
+            worker = _Worker(self._context)
+
+            raise
+
+        finally:
+            self._idle.put(worker)
+
+
+    def close(self) -> None:
+
+        for _ in range(self._size):
+            self._idle.get().stop()
+
+
+class _Handler(socketserver.BaseRequestHandler):
+
+    # Una conexión puede mandar varios programas, uno después de otro
+    def handle(self) -> None:
+
+        server = cast(Server, self.server)
+
+        while True:
+
+            try:
+                request = receive_message(self.request)
+
+            except ValueError as error:
+                send_message(self.request, _response(INVALID_REQUEST, errors=[str(error)]))
+                return
+
+            # El cliente se fue sin cerrar bien la conexión
+            except OSError:
+                return
+
+            if request is None:
+                return
+
+            send_message(self.request, server.execute(request))
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+
+    daemon_threads = True
+
+
+    def __init__(self,
+                 socket_path: str,
+                 workers: Optional[int] = None,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 engine: str = DEFAULT_ENGINE,
+                 optimized: bool = False,
+                 steps: Optional[int] = None) -> None:
+
+        self.job_timeout: float = timeout
+        self.engine: str = engine
+        self.optimized: bool = optimized
+        self.steps: Optional[int] = steps
+        self.pool: WorkerPool = WorkerPool(workers)
+
+        # Un socket que quedó de una ejecución anterior impediría hacer bind, cualquier otro archivo lo dejamos en paz
+        if path.exists(socket_path) and S_ISSOCK(stat(socket_path).st_mode):
+            remove(socket_path)
+
+        super().__init__(socket_path, _Handler)
+
+
+    # Una petición es {"programa": str, "motor": str, "optimizar": bool, "tiempo": float, "pasos": int}, solo el programa es obligatorio y lo demás toma los valores del servidor
+    def execute(self, request: Dict[str, Any]) -> Dict[str, Any]:
+
+        source = request.get("programa")
+        engine = request.get("motor", self.engine)
+        optimized = request.get("optimizar", self.optimized)
+        timeout = request.get("tiempo", self.job_timeout)
+        steps = request.get("pasos", self.steps)
+
+        if not isinstance(source, str):
+            return _response(INVALID_REQUEST, errors=[_INVALID_FIELD.format("programa")])
+
+        if engine not in ENGINES:
+            return _response(INVALID_REQUEST, errors=[_INVALID_FIELD.format("motor")])
+
+        if not isinstance(optimized, bool):
+            return _response(INVALID_REQUEST, errors=[_INVALID_FIELD.format("optimizar")])
+
+        # json acepta NaN e Infinity, con ellos el proceso nunca terminaría a tiempo
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not isfinite(timeout) or timeout <= 0:
+            return _response(INVALID_REQUEST, errors=[_INVALID_FIELD.format("tiempo")])
+
+        if steps is not None and (isinstance(steps, bool) or not isinstance(steps, int) or steps <= 0):
+            return _response(INVALID_REQUEST, errors=[_INVALID_FIELD.format("pasos")])
+
+        # Quien manda el programa puede pedir menos tiempo o pasos, pero no más de lo que permite el servidor
+        if self.steps is not None:
+            steps = self.steps if steps is None else min(steps, self.steps)
+
+        return self.pool.run(Job(source, engine, optimized, steps, min(timeout, self.job_timeout)))
+
+
+    def server_close(self) -> None:
+
+        super().server_close()
+        self.pool.close()
+
+        if path.exists(self.server_address): # type: ignore
+            remove(self.server_address) # type: ignore
+
+
+# El cliente: manda un programa y espera la respuesta
+def submit(socket_path: str, source: str, **options: Any) -> Dict[str, Any]:
+
+    with socket(AF_UNIX, SOCK_STREAM) as connection:
+
+        connection.connect(socket_path)
+        send_message(connection, {"programa": source, **options})
+
+        response = receive_message(connection)
+
+    assert response is not None
+    return response
+
+
+def serve(socket_path: str,
+          workers: Optional[int] = None,
+          timeout: float = DEFAULT_TIMEOUT,
+          engine: str = DEFAULT_ENGINE,
+          optimized: bool = False,
+          steps: Optional[int] = None) -> int:
+
+    server = Server(socket_path, workers, timeout, engine, optimized, steps)
+
+    print(f"Escuchando en {socket_path} con {server.pool.size} procesos")
+
+    try:
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        server.server_close()
+
+    return 0
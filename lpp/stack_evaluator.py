@@ -0,0 +1,445 @@
+from typing import (
+    Any,
+    cast,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+import lpp.ast as ast
+import lpp.budget as budget
+from lpp.evaluator import (
+    _arity_error,
+    _assign_variable,
+    _evaluate_identifier,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _extend_function_environment,
+    _is_truthy,
+    _literal_integer,
+    _literal_string,
+    _locate_error,
+    _NOT_A_FUNCTION,
+    _new_error,
+    _TailCall,
+    _UNKNOWN_IDENTIFIER,
+    _unwrap_return_value,
+    FALSE,
+    NULL,
+    TRUE
+)
+from lpp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Frame,
+    Function,
+    Object,
+    ObjectType,
+    Return
+)
+from lpp.resolver import resolve
+
+
+# Cuántas llamadas de lpp pueden estar activas a la vez, las llamadas de cola no cuentan
+MAX_CALL_DEPTH = 100_000
+
+_STACK_OVERFLOW = "desbordamiento de pila"
+
+# Un paso de la evaluación pide el valor de otro nodo o de otro paso (una llamada, un bloque) y lo recibe con send
+Request = Union[Tuple[ast.ASTNode, Environment], Generator[Any, Any, Any]]
+Step = Generator[Request, Any, Any]
+
+
+# La llamada que pasó del límite, termina toda la evaluación
+class _StackOverflow(Exception):
+
+    def __init__(self, call: ast.Call) -> None:
+
+        super().__init__(_STACK_OVERFLOW)
+        self.call = call
+
+
+# Evalúa igual que evaluator.evaluate, pero lo que queda pendiente de cada nodo vive en una lista en lugar de en la pila de Python
+class StackEvaluator:
+
+    def __init__(self, max_depth: int, keep_return: bool = False) -> None:
+
+        self._max_depth: int = max_depth
+        self._keep_return: bool = keep_return
+        self._depth: int = 0
+
+
+    def run(self, node: ast.ASTNode, env: Environment) -> Optional[Object]:
+
+        stack: List[Step] = [self._evaluate(node, env)]
+        value: Any = None
+
+        while True:
+
+            try:
+                request = stack[-1].send(value)
+
+            except StopIteration as finished:
+
+                stack.pop()
+                value = finished.value
+
+                if not stack:
+                    return value
+
+                continue
+
+            except _StackOverflow as overflow:
+                return _locate_error(_new_error(_STACK_OVERFLOW, []), overflow.call)
+
+            if type(request) is not tuple:
+                stack.append(cast(Step, request))
+                value = None
+                continue
+
+            node, env = cast(Tuple[ast.ASTNode, Environment], request)
+            node_type = type(node)
+
+            # Las hojas se evalúan aquí mismo, sin crear un paso
+            if node_type == ast.Integer:
+                value = _literal_integer(cast(ast.Integer, node))
+
+            elif node_type == ast.Identifier:
+                value = _locate_error(_evaluate_identifier(cast(ast.Identifier, node), env), cast(ast.Identifier, node))
+
+            elif node_type == ast.Boolean:
+                value = TRUE if cast(ast.Boolean, node).value else FALSE
+
+            elif node_type == ast.StringLiteral:
+                value = _literal_string(cast(ast.StringLiteral, node))
+
+            elif node_type == ast.Function:
+
+                function = cast(ast.Function, node)
+
+                assert function.body is not None
+
+                value = Function(function.parameters, function.body, env)
+
+            else:
+                stack.append(self._evaluate(node, env))
+                value = None
+
+
+    def _evaluate(self, node: ast.ASTNode, env: Environment) -> Step:
+
+        node_type = type(node)
+
+        if node_type == ast.Program:
+            return (yield self._program(resolve(cast(ast.Program, node)), env))
+
+        elif node_type == ast.ExpressionStatement:
+
+            expression = cast(ast.ExpressionStatement, node).expression
+
+            assert expression is not None
+
+            return (yield (expression, env))
+
+        elif node_type == ast.Prefix:
+
+            prefix = cast(ast.Prefix, node)
+
+            assert prefix.right is not None
+
+            right = yield (prefix.right, env)
+
+            assert right is not None
+
+            return _locate_error(_evaluate_prefix_expression(prefix.operator, right), prefix)
+
+        elif node_type == ast.Infix:
+
+            infix = cast(ast.Infix, node)
+
+            assert infix.left is not None and infix.right is not None
+
+            left = yield (infix.left, env)
+            right = yield (infix.right, env)
+
+            assert left is not None and right is not None
+
+            return _locate_error(_evaluate_infix_expression(infix.operator, left, right), infix)
+
+        elif node_type == ast.Block:
+            return (yield self._block(cast(ast.Block, node), env))
+
+        elif node_type == ast.If:
+            return (yield self._if(cast(ast.If, node), env))
+
+        elif node_type == ast.ReturnStatement:
+
+            return_statement = cast(ast.ReturnStatement, node)
+
+            assert return_statement.return_value is not None
+
+            value = yield (return_statement.return_value, env)
+
+            assert value is not None
+
+            return Return(value)
+
+        elif node_type == ast.LetStatement:
+
+            let_statement = cast(ast.LetStatement, node)
+
+            assert let_statement.value is not None and let_statement.name is not None
+
+            value = yield (let_statement.value, env)
+            slot = let_statement.name.slot
+
+            if type(env) is Frame and slot is not None and slot >= 0:
+                cast(Frame, env)._values[slot] = value
+
+            else:
+                env[let_statement.name.value] = value
+
+            return None
+
+        elif node_type == ast.AssignStatement:
+
+            assign_statement = cast(ast.AssignStatement, node)
+
+            assert assign_statement.value is not None and assign_statement.name is not None
+
+            value = yield (assign_statement.value, env)
+
+            if not _assign_variable(assign_statement.name, value, env):
+                return _locate_error(_new_error(_UNKNOWN_IDENTIFIER, [assign_statement.name.value]), assign_statement.name)
+
+            return None
+
+        elif node_type == ast.While:
+            return (yield self._while(cast(ast.While, node), env))
+
+        elif node_type == ast.Call:
+
+            call = cast(ast.Call, node)
+            function, args = yield self._function_and_arguments(call, env)
+
+            return _locate_error((yield self._apply(function, args, call)), call)
+
+        # Las hojas normalmente las resuelve run, aquí solo llegan cuando son el nodo inicial
+        elif node_type in (ast.Integer, ast.Identifier, ast.Boolean, ast.StringLiteral, ast.Function):
+            return (yield (node, env))
+
+        return None
+
+
+    def _program(self, program: ast.Program, env: Environment) -> Step:
+
+        result: Optional[Object] = None
+
+        for statement in program.statements:
+
+            result = yield (statement, env)
+
+            if type(result) == Return:
+                return result if self._keep_return else cast(Return, result).value
+
+            elif type(result) == Error:
+                return result
+
+        return result
+
+
+    def _block(self, block: ast.Block, env: Environment) -> Step:
+
+        result: Optional[Object] = None
+
+        for statement in block.statements:
+
+            result = yield (statement, env)
+
+            if result is not None and \
+                (result.TYPE is ObjectType.RETURN or result.TYPE is ObjectType.ERROR):
+                return result
+
+        return result
+
+
+    def _if(self, if_expression: ast.If, env: Environment) -> Step:
+
+        assert if_expression.condition is not None
+
+        condition = yield (if_expression.condition, env)
+
+        assert condition is not None
+
+        if _is_truthy(condition):
+
+            assert if_expression.consequence is not None
+            return (yield (if_expression.consequence, env))
+
+        elif if_expression.alternative is not None:
+            return (yield (if_expression.alternative, env))
+
+        return NULL
+
+
+    def _while(self, while_statement: ast.While, env: Environment) -> Step:
+
+        assert while_statement.condition is not None and while_statement.body is not None
+
+        while True:
+
+            if budget.active:
+                budget.charge()
+
+            condition = yield (while_statement.condition, env)
+
+            assert condition is not None
+
+            if type(condition) is Error:
+                return condition
+
+            if not _is_truthy(condition):
+                return None
+
+            result = yield self._block(while_statement.body, env)
+
+            if result is not None and \
+                (result.TYPE is ObjectType.RETURN or result.TYPE is ObjectType.ERROR):
+                return result
+
+
+    def _function_and_arguments(self, call: ast.Call, env: Environment) -> Step:
+
+        assert call.arguments is not None
+
+        function = yield (call.function, env)
+        args: List[Object] = []
+
+        for argument in call.arguments:
+
+            value = yield (argument, env)
+
+            assert value is not None
+            args.append(value)
+
+        assert function is not None
+
+        return function, args
+
+
+    def _apply(self, fn: Object, args: List[Object], call: ast.Call) -> Step:
+
+        if isinstance(fn, Function):
+
+            if self._depth >= self._max_depth:
+                raise _StackOverflow(call)
+
+            self._depth += 1
+            tail_call: Optional[ast.Call] = None
+
+            # Igual que en el evaluador, las llamadas de cola reemplazan a la función actual sin apilar otra
+            while True:
+
+                if budget.active:
+                    budget.charge()
+
+                if len(args) < len(fn.parameters):
+                    evaluated = _arity_error(fn, args)
+                    break
+
+                evaluated = yield self._function_block(fn.body, _extend_function_environment(fn, args), tail=True)
+
+                if type(evaluated) is not _TailCall:
+                    break
+
+                fn, args, tail_call = evaluated
+
+            self._depth -= 1
+
+            assert evaluated is not None
+            result = _unwrap_return_value(evaluated)
+
+            return result if tail_call is None else _locate_error(result, tail_call)
+
+        elif type(fn) == Builtin:
+            return cast(Builtin, fn).fn(*args)
+
+        return _new_error(_NOT_A_FUNCTION, [fn.TYPE.name])
+
+
+    def _function_block(self, block: ast.Block, env: Environment, tail: bool) -> Step:
+
+        result: Any = None
+        statements = block.statements
+
+        for idx, statement in enumerate(statements):
+
+            last = tail and idx == len(statements) - 1
+            statement_type = type(statement)
+            expression: Any = None
+
+            if statement_type == ast.ExpressionStatement:
+                expression = cast(ast.ExpressionStatement, statement).expression
+
+            if statement_type == ast.ReturnStatement \
+                and type(cast(ast.ReturnStatement, statement).return_value) == ast.Call:
+
+                result = yield self._tail_call(cast(ast.Call, cast(ast.ReturnStatement, statement).return_value), env, returned=True)
+
+            elif last and type(expression) == ast.Call:
+                result = yield self._tail_call(cast(ast.Call, expression), env, returned=False)
+
+            elif type(expression) == ast.If:
+                result = yield self._tail_if(cast(ast.If, expression), env, last)
+
+            else:
+                result = yield (statement, env)
+
+            if result is not None and \
+                (type(result) is _TailCall or result.TYPE is ObjectType.RETURN or result.TYPE is ObjectType.ERROR):
+                return result
+
+        return result
+
+
+    def _tail_if(self, if_expression: ast.If, env: Environment, tail: bool) -> Step:
+
+        assert if_expression.condition is not None
+
+        condition = yield (if_expression.condition, env)
+
+        assert condition is not None
+
+        if _is_truthy(condition):
+
+            assert if_expression.consequence is not None
+            return (yield self._function_block(if_expression.consequence, env, tail))
+
+        elif if_expression.alternative is not None:
+            return (yield self._function_block(if_expression.alternative, env, tail))
+
+        return NULL
+
+
+    def _tail_call(self, call: ast.Call, env: Environment, returned: bool) -> Step:
+
+        function, args = yield self._function_and_arguments(call, env)
+
+        if isinstance(function, Function):
+            return _TailCall(function, args, call)
+
+        value = _locate_error((yield self._apply(function, args, call)), call)
+
+        return Return(value) if returned else value
+
+
+# La misma firma que evaluator.evaluate; max_depth es el número de llamadas anidadas antes de regresar un error
+def evaluate(node: ast.ASTNode,
+             env: Environment,
+             max_depth: Optional[int] = None,
+             keep_return: bool = False) -> Optional[Object]:
+
+    return StackEvaluator(MAX_CALL_DEPTH if max_depth is None else max_depth, keep_return).run(node, env)
@@ -0,0 +1,119 @@
+from codecs import getincrementaldecoder
+from contextlib import contextmanager
+from mmap import (
+    ACCESS_READ,
+    mmap
+)
+
+from typing import (
+    IO,
+    Iterator,
+    Union
+)
+
+from lpp.token import (
+    Token,
+    TokenType
+)
+from lpp.token_buffer import scan_token
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+Stream = Union[IO[str], IO[bytes], mmap]
+
+
+# Lee el programa por pedazos de tamaño fijo en lugar de pedirlo completo como un string, así la memoria no crece con el tamaño del archivo
+class StreamLexer:
+
+    def __init__(self, stream: Stream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+
+        self._stream = stream
+        self._chunk_size: int = chunk_size
+        self._decoder = getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._position: int = 0
+        self._exhausted: bool = False
+
+        # Para calcular líneas y columnas: offset absoluto de _buffer[0], hasta dónde ya contamos saltos de línea y dónde empieza la línea actual
+        self._offset: int = 0
+        self._scanned: int = 0
+        self._line: int = 1
+        self._line_start: int = 0
+
+
+    def next_token(self) -> Token:
+
+        while True:
+
+            token_type, start, end, position = scan_token(self._buffer, self._position)
+
+            # Si el token llega hasta el final del buffer puede que siga en el siguiente pedazo (un identificador, un string, un "=="...), así que leemos más y volvemos a intentar
+            if position < len(self._buffer) or self._exhausted:
+                break
+
+            self._read_chunk()
+
+        literal = self._buffer[start + 1 if token_type == TokenType.STRING else start:end]
+        self._position = position
+
+        self._count_lines(start)
+        line = self._line
+        column = self._offset + start - self._line_start + 1
+
+        if self._position >= self._chunk_size:
+            self._discard_consumed()
+
+        return Token(token_type, literal, line, column)
+
+
+    def _count_lines(self, until: int) -> None:
+
+        newlines = self._buffer.count("\n", self._scanned, until)
+
+        if newlines:
+            self._line += newlines
+            self._line_start = self._offset + self._buffer.rfind("\n", self._scanned, until) + 1
+
+        self._scanned = until
+
+
+    # Tiramos lo que ya se convirtió en tokens para que el buffer nunca crezca más allá de un par de pedazos
+    def _discard_consumed(self) -> None:
+
+        self._count_lines(self._position)
+
+        self._buffer = self._buffer[self._position:]
+        self._offset += self._position
+        self._position = 0
+        self._scanned = 0
+
+
+    def _read_chunk(self) -> None:
+
+        data = self._stream.read(self._chunk_size)
+
+        if not data:
+            self._exhausted = True
+
+        if isinstance(data, bytes):
+            # El decodificador incremental guarda los bytes de un caracter UTF-8 que quedó partido entre dos pedazos
+            data = self._decoder.decode(data, final=self._exhausted)
+
+        self._buffer += data
+
+
+@contextmanager
+def open_lexer(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[StreamLexer]:
+
+    with open(path, "rb") as file:
+
+        try:
+            mapped = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        # No se puede hacer mmap de un archivo vacío, en ese caso leemos el archivo directamente
+        except ValueError:
+            yield StreamLexer(file, chunk_size)
+            return
+
+        with mapped:
+            yield StreamLexer(mapped, chunk_size)
@@ -44,29 +44,34 @@ class TokenType(Enum):
     SIMILAR = auto() # Triple igualdad (===)
     STRING = auto()
     TRUE = auto()
+    WHILE = auto() # Ciclo while
 
 
 class Token(NamedTuple):
 
     token_type: TokenType
     literal: str
+    line: int = 0 # 0 cuando no sabemos de dónde salió el token
+    column: int = 0
 
     def __str__(self) -> str:
             return f"Type {self.token_type}, Literal: {self.literal}"
 
 
+# Una variable keywords que es un diccionario que tiene como llaves strings y como valores TokenType, se construye una sola vez
+KEYWORDS: Dict[str, TokenType] = {
+    "falso": TokenType.FALSE,
+    "funcion": TokenType.FUNCTION,
+    "mientras": TokenType.WHILE,
+    "regresa": TokenType.RETURN,
+    "si": TokenType.IF,
+    "si_no": TokenType.ELSE,
+    "variable": TokenType.LET,
+    "verdadero": TokenType.TRUE,
+}
+
+
 def lookup_token_type(literal: str) -> TokenType:
-    
-    # Una variable keyword que es un diccionario que tiene como llaves strngs y como valores TokenType
-    keywords: Dict[str, TokenType] = {
-        "falso": TokenType.FALSE,
-        "funcion": TokenType.FUNCTION,
-        "regresa": TokenType.RETURN,
-        "si": TokenType.IF,
-        "si_no": TokenType.ELSE,
-        "variable": TokenType.LET,
-        "verdadero": TokenType.TRUE,
-    }
 
     # Miramos si es una palabra reservada de nuestro lenguaje, si no lo es, entonces es un identificador (un nombre de variable p.ej)
-    return keywords.get(literal, TokenType.IDENT)
\ No newline at end of file
+    return KEYWORDS.get(literal, TokenType.IDENT)
\ No newline at end of file
@@ -0,0 +1,185 @@
+from array import array
+from bisect import bisect_right
+from re import finditer
+
+from typing import (
+    Dict,
+    Optional,
+    Tuple
+)
+
+from lpp.lexer import (
+    KEYWORDS,
+    OPERATORS,
+    TOKEN_PATTERN
+)
+from lpp.token import (
+    Token,
+    TokenType
+)
+
+
+# Para guardar el tipo de token en un solo byte usamos su valor numérico y lo traducimos de regreso con este diccionario
+_TOKEN_TYPES: Dict[int, TokenType] = {token_type.value: token_type for token_type in TokenType}
+_STRING: int = TokenType.STRING.value
+
+
+# Guarda los tokens en columnas paralelas (tipo, inicio, fin) en lugar de una tupla por token, los literales se cortan del código fuente solo cuando alguien los pide
+class TokenBuffer:
+
+    def __init__(self, source: str) -> None:
+
+        self._source: str = source
+        self._types: array = array("B")
+        self._starts: array = array("q")
+        self._ends: array = array("q")
+        self._line_starts: Optional[array] = None
+        self._cursor: int = 0
+        self._cursor_line: int = 0
+
+        self._tokenize()
+
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+
+    def token_type(self, index: int) -> TokenType:
+        return _TOKEN_TYPES[self._types[index]]
+
+
+    def start(self, index: int) -> int:
+        return self._starts[index]
+
+
+    def end(self, index: int) -> int:
+        return self._ends[index]
+
+
+    def literal(self, index: int) -> str:
+
+        start = self._starts[index]
+
+        # El inicio de un string apunta a su comilla de apertura, el literal empieza un caracter después
+        if self._types[index] == _STRING:
+            start += 1
+
+        return self._source[start:self._ends[index]]
+
+
+    def position(self, index: int) -> Tuple[int, int]:
+
+        return self.offset_position(self._starts[index])
+
+
+    # Traduce un offset del código fuente a (línea, columna), ambas empiezan en 1
+    def offset_position(self, offset: int) -> Tuple[int, int]:
+
+        line_starts = self._get_line_starts()
+        line = bisect_right(line_starts, offset)
+
+        return line, offset - line_starts[line - 1] + 1
+
+
+    def token(self, index: int) -> Token:
+
+        line, column = self.position(index)
+
+        return Token(self.token_type(index), self.literal(index), line, column)
+
+
+    def next_token(self) -> Token:
+
+        index = self._cursor
+
+        # Después del EOF seguimos regresando EOF, igual que el Lexer
+        if index < len(self._types) - 1:
+            self._cursor += 1
+
+        # Como el parser pide los tokens en orden, avanzamos la línea actual en lugar de buscarla cada vez
+        line_starts = self._get_line_starts()
+        start = self._starts[index]
+        line = self._cursor_line
+
+        while line < len(line_starts) and line_starts[line] <= start:
+            line += 1
+
+        self._cursor_line = line
+        code = self._types[index]
+
+        return Token(_TOKEN_TYPES[code],
+                     self._source[start + 1 if code == _STRING else start:self._ends[index]],
+                     line,
+                     start - line_starts[line - 1] + 1)
+
+
+    def _get_line_starts(self) -> array:
+
+        # Solo calculamos dónde empieza cada línea la primera vez que alguien pregunta por una posición
+        if self._line_starts is None:
+            self._line_starts = array("q", [0])
+            self._line_starts.extend(found.end() for found in finditer("\n", self._source))
+
+        return self._line_starts
+
+
+    def _tokenize(self) -> None:
+
+        source = self._source
+        types = self._types
+        starts = self._starts
+        ends = self._ends
+        position = 0
+
+        while True:
+
+            token_type, start, end, position = scan_token(source, position)
+
+            types.append(token_type.value)
+            starts.append(start)
+            ends.append(end)
+
+            if token_type == TokenType.EOF:
+                break
+
+
+# Reconoce el token que empieza en position y regresa (tipo, inicio, fin del literal, dónde empieza el siguiente token), todos los lexers que trabajan con offsets lo comparten
+# El inicio de un string apunta a su comilla de apertura y el fin de su literal queda antes de la comilla de cierre, si la tiene
+def scan_token(source: str, position: int) -> Tuple[TokenType, int, int, int]:
+
+    found = TOKEN_PATTERN.match(source, position)
+
+    assert found is not None
+
+    kind = found.lastgroup
+
+    assert kind is not None
+
+    start, end = found.span(kind)
+
+    if kind == "operator":
+        return OPERATORS[found.group(kind)], start, end, end
+
+    elif kind == "identifier":
+        return KEYWORDS.get(found.group(kind), TokenType.IDENT), start, end, end
+
+    elif kind == "number":
+        return TokenType.INT, start, end, end
+
+    elif kind == "string":
+
+        # Si el string se cerró, el literal termina antes de la comilla de cierre
+        if end - start > 1 and source[end - 1] == source[start]:
+            return TokenType.STRING, start, end - 1, end
+
+        return TokenType.STRING, start, end, end
+
+    elif kind == "eof":
+        return TokenType.EOF, start, end, end
+
+    return TokenType.ILLEGAL, start, end, end
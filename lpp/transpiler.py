@@ -0,0 +1,771 @@
+from types import CodeType
+
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+
+import lpp.ast as ast
+import lpp.budget as budget
+import lpp.evaluator as evaluator
+from lpp.builtins import BUILTINS
+from lpp.evaluator import (
+    _apply_function,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _new_error,
+    _UNKNOWN_IDENTIFIER,
+    FALSE,
+    NULL,
+    TRUE
+)
+from lpp.object import (
+    Environment,
+    Error,
+    Function,
+    Integer,
+    Object,
+    Return,
+    String,
+    to_integer_object
+)
+
+
+# Cuántos programas traducidos guardamos ya compilados, el REPL vuelve a ejecutar los mismos una y otra vez
+MAX_CACHED = 256
+
+_ARITHMETIC_OPERATORS: Dict[str, str] = {
+    "+": "+",
+    "-": "-",
+    "*": "*",
+    "/": "//",
+}
+
+_COMPARISON_OPERATORS: Dict[str, str] = {
+    "<": "<",
+    ">": ">",
+    "<=": "<=",
+    ">=": ">=",
+    "==": "==",
+    "===": "==",
+    "!=": "!=",
+    "!==": "!=",
+}
+
+_INDENT = "    "
+
+# El código compilado de cada traducción, la llave es el código fuente de Python que generamos
+_cache: Dict[str, CodeType] = {}
+
+
+# Una función de lpp cuyo cuerpo se tradujo a una función de Python
+class TranspiledFunction(Function):
+
+    __slots__ = ("python", "arity")
+
+
+    def __init__(self,
+                 parameters: List[ast.Identifier],
+                 body: ast.Block,
+                 env: Environment,
+                 python: Callable[..., Object]) -> None:
+
+        self.parameters = parameters
+        self.body = body
+        self.env = env
+        self.python = python
+        self.arity = len(parameters)
+
+
+# La traducción encontró algo que no sabe traducir en el modo en que estaba
+class _Unsupported(Exception):
+    pass
+
+
+# Una variable local de lpp a la que todavía no se le asigna nada, leerla busca en los ambientes de afuera igual que el evaluador
+class _Unset:
+    pass
+
+
+_UNSET = _Unset()
+
+
+def evaluate(node: ast.ASTNode, env: Environment, keep_return: bool = False) -> Optional[Object]:
+
+    if type(node) != ast.Program:
+        return evaluator.evaluate(node, env)
+
+    try:
+        program = translate(cast(ast.Program, node), keep_return)
+
+    # Si algo no se puede traducir ejecutamos el árbol tal cual
+    except _Unsupported:
+        return evaluator.evaluate(node, env, keep_return)
+
+    return program(env)
+
+
+# Regresa una función de Python que recibe el ambiente global y hace lo mismo que evaluate sobre el programa
+def translate(program: ast.Program, keep_return: bool = False) -> Callable[[Environment], Optional[Object]]:
+
+    module = _Module()
+
+    try:
+        entry = module.program(program, keep_return)
+
+    # Generar el código recorre el árbol con recursión, un árbol muy profundo no se traduce
+    except RecursionError as error:
+        raise _Unsupported() from error
+
+    source = module.source(entry)
+    code = _cache.get(source)
+
+    if code is None:
+
+        # El compilador de Python tiene sus propios límites (bloques anidados, paréntesis, profundidad) que un programa válido de lpp puede pasar
+        try:
+            code = compile(source, "<lpp>", "exec")
+
+        except (SyntaxError, RecursionError, MemoryError) as error:
+            raise _Unsupported() from error
+
+        if len(_cache) >= MAX_CACHED:
+            _cache.clear()
+
+        _cache[source] = code
+
+    namespace: Dict[str, Any] = dict(_RUNTIME)
+    exec(code, namespace)
+
+    return namespace["_make"](module.nodes)
+
+
+class _Module:
+
+    def __init__(self) -> None:
+
+        self.nodes: List[ast.ASTNode] = []
+        self._constants: List[str] = []
+        self._constant_names: Dict[Tuple[type, Any], str] = {}
+        self._functions: List[List[str]] = []
+        self._templates: List[str] = []
+        self._function_count: int = 0
+
+
+    def source(self, entry: str) -> str:
+
+        lines: List[str] = ["def _make(_nodes):"]
+        lines.extend(_INDENT + constant for constant in self._constants)
+
+        for function in self._functions:
+            lines.extend(_INDENT + line for line in function)
+
+        lines.extend(_INDENT + template for template in self._templates)
+
+        lines.append(f"{_INDENT}return {entry}")
+
+        return "\n".join(lines) + "\n"
+
+
+    # Con keep_return los regresa del nivel superior salen envueltos en su Return, como en evaluator.evaluate
+    def program(self, program: ast.Program, keep_return: bool = False) -> str:
+
+        return self._add_function("_env", [], program.statements, fast=False, keep_return=keep_return)
+
+
+    # Regresa el nombre de la plantilla (función de Python y nodo) con la que se crean las funciones de lpp
+    def function(self, function: ast.Function) -> str:
+
+        assert function.body is not None
+
+        parameters = [parameter.value for parameter in function.parameters]
+
+        # Primero intentamos con variables locales de Python, si el cuerpo crea funciones o necesita el evaluador sus variables tienen que vivir en un Environment
+        try:
+            name = self._add_function("_env", parameters, function.body.statements, fast=True)
+
+        except _Unsupported:
+            name = self._add_function("_outer", parameters, function.body.statements, fast=False)
+
+        template = f"_p{len(self._templates)}"
+        self._templates.append(f"{template} = ({name}, _nodes[{self.node(function)}])")
+
+        return template
+
+
+    def constant(self, value: Object) -> str:
+
+        key = (type(value), cast(Any, value).value)
+        name = self._constant_names.get(key)
+
+        if name is None:
+
+            name = self._constant_names[key] = f"_k{len(self._constants)}"
+
+            if type(value) == Integer:
+                self._constants.append(f"{name} = _integer({cast(Integer, value).value!r})")
+
+            else:
+                self._constants.append(f"{name} = _String({cast(String, value).value!r})")
+
+        return name
+
+
+    def node(self, node: ast.ASTNode) -> int:
+
+        self.nodes.append(node)
+
+        return len(self.nodes) - 1
+
+
+    def _add_function(self,
+                      env_name: str,
+                      parameters: List[str],
+                      statements: List[ast.Statement],
+                      fast: bool,
+                      keep_return: bool = False) -> str:
+
+        # Las funciones que contiene se agregan antes que ella, por eso el nombre sale de un contador aparte
+        name = f"_f{self._function_count}"
+        self._function_count += 1
+
+        self._functions.append(_Function(self, parameters, statements, fast, keep_return).translate(env_name, name))
+
+        return name
+
+
+class _Function:
+
+    def __init__(self,
+                 module: _Module,
+                 parameters: List[str],
+                 statements: List[ast.Statement],
+                 fast: bool,
+                 keep_return: bool = False) -> None:
+
+        self._module: _Module = module
+        self._parameters: List[str] = parameters
+        self._statements: List[ast.Statement] = statements
+        self._fast: bool = fast
+        self._keep_return: bool = keep_return
+        self._lines: List[str] = []
+        self._temporaries: int = 0
+        # En modo rápido cada variable de lpp es una variable local de Python
+        self._locals: Dict[str, str] = {}
+        self._unset_locals: Set[str] = set()
+
+
+    def translate(self, env_name: str, name: str) -> List[str]:
+
+        arguments = [f"v{idx}" for idx in range(len(self._parameters))]
+
+        if self._fast:
+
+            for parameter, argument in zip(self._parameters, arguments):
+                self._locals[parameter] = argument
+
+            for variable in _let_names(self._statements):
+
+                if variable not in self._locals:
+                    self._locals[variable] = f"v{len(arguments) + len(self._unset_locals)}"
+                    self._unset_locals.add(variable)
+                    self._emit(1, f"{self._locals[variable]} = _UNSET")
+
+        elif env_name == "_outer":
+
+            self._emit(1, "_env = _Environment(_outer)")
+
+            for parameter, argument in zip(self._parameters, arguments):
+                self._emit(1, f"_env[{parameter!r}] = {argument}")
+
+        self._statements_block(self._statements, 1, tail=True)
+
+        return [f"def {name}({', '.join([env_name] + arguments)}):"] + self._lines
+
+
+    # tail indica que el valor del último statement es el resultado de la función
+    def _statements_block(self, statements: List[ast.Statement], depth: int, tail: bool) -> None:
+
+        if len(statements) == 0:
+            self._emit(depth, "return None" if tail else "pass")
+            return
+
+        for idx, statement in enumerate(statements):
+
+            last = tail and idx == len(statements) - 1
+
+            if type(statement) == ast.ReturnStatement:
+
+                return_value = cast(ast.ReturnStatement, statement).return_value
+                assert return_value is not None
+
+                if self._keep_return:
+                    self._emit(depth, f"return _Return({self._expression(return_value)})")
+
+                else:
+                    self._emit(depth, f"return {self._expression(return_value)}")
+
+                # Lo que sigue de un regresa nunca se ejecuta
+                return
+
+            elif type(statement) == ast.LetStatement:
+
+                let_statement = cast(ast.LetStatement, statement)
+                assert let_statement.name is not None and let_statement.value is not None
+
+                value = self._expression(let_statement.value)
+                name = let_statement.name.value
+
+                if self._fast:
+                    self._emit(depth, f"{self._locals[name]} = {value}")
+
+                else:
+                    self._emit(depth, f"_env[{name!r}] = {value}")
+
+                if last:
+                    self._emit(depth, "return None")
+
+            elif type(statement) == ast.ExpressionStatement:
+
+                expression = cast(ast.ExpressionStatement, statement).expression
+                assert expression is not None
+
+                if type(expression) == ast.If:
+                    self._if_statement(cast(ast.If, expression), depth, last)
+
+                elif last:
+
+                    # Un valor Return que venía guardado en una variable se desenvuelve igual que en _apply_function
+                    if _may_return(expression) and not self._keep_return:
+                        temporary = self._temporary()
+                        self._emit(depth, f"{temporary} = {self._expression(expression)}")
+                        self._emit(depth, f"return {temporary}.value if type({temporary}) is _Return else {temporary}")
+
+                    else:
+                        self._emit(depth, f"return {self._expression(expression)}")
+
+                else:
+                    self._stop_on(self._expression(expression), depth, _may_return(expression))
+
+            elif type(statement) == ast.AssignStatement:
+
+                self._assign(cast(ast.AssignStatement, statement), depth)
+
+                if last:
+                    self._emit(depth, "return None")
+
+            elif type(statement) == ast.While:
+
+                self._while(cast(ast.While, statement), depth)
+
+                if last:
+                    self._emit(depth, "return None")
+
+            else:
+                raise _Unsupported()
+
+
+    def _assign(self, assign_statement: ast.AssignStatement, depth: int) -> None:
+
+        assert assign_statement.name is not None and assign_statement.value is not None
+
+        name = assign_statement.name.value
+        value = self._temporary()
+        assign = f"_assign(_env, {name!r}, {value}, {assign_statement.name.token.line}, {assign_statement.name.token.column})"
+
+        self._emit(depth, f"{value} = {self._expression(assign_statement.value)}")
+
+        if name in self._locals and name not in self._unset_locals:
+            self._emit(depth, f"{self._locals[name]} = {value}")
+            return
+
+        # Una variable local que todavía no se declara se busca en los ambientes de afuera, igual que al leerla
+        if name in self._locals:
+            self._emit(depth, f"if {self._locals[name]} is not _UNSET:")
+            self._emit(depth + 1, f"{self._locals[name]} = {value}")
+            self._emit(depth, f"elif ({value} := {assign}) is not None:")
+
+        else:
+            self._emit(depth, f"if ({value} := {assign}) is not None:")
+
+        self._emit(depth + 1, f"return {value}")
+
+
+    # Un ciclo de Python: un error en la condición o un statement del cuerpo que termina el bloque regresan de la función
+    def _while(self, while_statement: ast.While, depth: int) -> None:
+
+        assert while_statement.condition is not None and while_statement.body is not None
+
+        condition = self._temporary()
+
+        self._emit(depth, "while True:")
+        self._emit(depth + 1, "if _budget.active:")
+        self._emit(depth + 2, "_budget.charge()")
+        self._emit(depth + 1, f"{condition} = {self._expression(while_statement.condition)}")
+        self._emit(depth + 1, f"if {condition} is _FALSE or {condition} is _NULL:")
+        self._emit(depth + 2, "break")
+        self._emit(depth + 1, f"if type({condition}) is _Error:")
+        self._emit(depth + 2, f"return {condition}")
+        self._statements_block(while_statement.body.statements, depth + 1, tail=False)
+
+
+    def _stop_on(self, value: str, depth: int, may_return: bool) -> None:
+
+        temporary = self._temporary()
+
+        self._emit(depth, f"{temporary} = {value}")
+        self._emit(depth, f"if type({temporary}) is _Error:")
+        self._emit(depth + 1, f"return {temporary}")
+
+        if may_return:
+            self._emit(depth, f"if type({temporary}) is _Return:")
+            self._emit(depth + 1, f"return {temporary}" if self._keep_return else f"return {temporary}.value")
+
+
+    def _if_statement(self, if_expression: ast.If, depth: int, tail: bool) -> None:
+
+        assert if_expression.condition is not None and if_expression.consequence is not None
+
+        condition = self._temporary()
+
+        self._emit(depth, f"{condition} = {self._expression(if_expression.condition)}")
+        self._emit(depth, f"if {condition} is not _FALSE and {condition} is not _NULL:")
+        self._statements_block(if_expression.consequence.statements, depth + 1, tail)
+
+        if if_expression.alternative is not None:
+            self._emit(depth, "else:")
+            self._statements_block(if_expression.alternative.statements, depth + 1, tail)
+
+        elif tail:
+            self._emit(depth, "else:")
+            self._emit(depth + 1, "return _NULL")
+
+
+    def _expression(self, expression: ast.Expression) -> str:
+
+        node_type = type(expression)
+
+        if node_type == ast.Integer:
+
+            value = cast(ast.Integer, expression).value
+            assert value is not None
+
+            return self._module.constant(Integer(value))
+
+        elif node_type == ast.StringLiteral:
+            return self._module.constant(String(cast(ast.StringLiteral, expression).value))
+
+        elif node_type == ast.Boolean:
+            return "_TRUE" if cast(ast.Boolean, expression).value else "_FALSE"
+
+        elif node_type == ast.Identifier:
+            return self._identifier(cast(ast.Identifier, expression))
+
+        elif node_type == ast.Prefix:
+            return self._prefix(cast(ast.Prefix, expression))
+
+        elif node_type == ast.Infix:
+            return self._infix(cast(ast.Infix, expression))
+
+        elif node_type == ast.Call:
+
+            call = cast(ast.Call, expression)
+            assert call.arguments is not None
+
+            arguments = [self._expression(call.function)] + [self._expression(argument) for argument in call.arguments]
+
+            return f"_call({call.token.line}, {call.token.column}, {', '.join(arguments)})"
+
+        elif node_type == ast.If:
+            return self._if_expression(cast(ast.If, expression))
+
+        elif node_type == ast.Function:
+
+            # Las funciones de lpp guardan el ambiente donde se crearon, en modo rápido no hay uno
+            if self._fast:
+                raise _Unsupported()
+
+            return f"_closure({self._module.function(cast(ast.Function, expression))}, _env)"
+
+        return self._walk(expression)
+
+
+    def _identifier(self, identifier: ast.Identifier) -> str:
+
+        name = identifier.value
+        load = f"_load(_env, {name!r}, {identifier.token.line}, {identifier.token.column})"
+
+        if name not in self._locals:
+            return load
+
+        variable = self._locals[name]
+
+        if name in self._unset_locals:
+            return f"({variable} if {variable} is not _UNSET else {load})"
+
+        return variable
+
+
+    def _prefix(self, prefix: ast.Prefix) -> str:
+
+        assert prefix.right is not None
+
+        right = self._expression(prefix.right)
+        value = self._temporary()
+
+        if prefix.operator == "!":
+            return f"(_TRUE if ({value} := {right}) is _FALSE or {value} is _NULL else _FALSE)"
+
+        position = f"{prefix.token.line}, {prefix.token.column}"
+
+        if prefix.operator == "-":
+            return f"(_integer(-{value}.value) if type({value} := {right}) is _Integer else _prefix('-', {value}, {position}))"
+
+        return f"_prefix({prefix.operator!r}, {right}, {position})"
+
+
+    def _infix(self, infix: ast.Infix) -> str:
+
+        assert infix.left is not None and infix.right is not None
+
+        operator = infix.operator
+        position = f"{infix.token.line}, {infix.token.column}"
+        left = self._expression(infix.left)
+        right = self._expression(infix.right)
+
+        if operator in _ARITHMETIC_OPERATORS:
+            python_operator = _ARITHMETIC_OPERATORS[operator]
+            result = "_integer({} " + python_operator + " {})"
+
+        elif operator in _COMPARISON_OPERATORS:
+            python_operator = _COMPARISON_OPERATORS[operator]
+            result = "(_TRUE if {} " + python_operator + " {} else _FALSE)"
+
+        else:
+            return f"_infix({operator!r}, {left}, {right}, {position})"
+
+        left_value = self._temporary()
+
+        # Con un entero literal a la derecha solo hay que revisar el tipo del lado izquierdo
+        if type(infix.right) == ast.Integer:
+
+            literal = cast(ast.Integer, infix.right).value
+
+            return f"({result.format(f'{left_value}.value', repr(literal))} " \
+                f"if type({left_value} := {left}) is _Integer " \
+                f"else _infix({operator!r}, {left_value}, {right}, {position}))"
+
+        right_value = self._temporary()
+
+        # & en lugar de and para evaluar siempre los dos lados, igual que el evaluador
+        return f"({result.format(f'{left_value}.value', f'{right_value}.value')} " \
+            f"if (type({left_value} := {left}) is _Integer) & (type({right_value} := {right}) is _Integer) " \
+            f"else _infix({operator!r}, {left_value}, {right_value}, {position}))"
+
+
+    def _if_expression(self, if_expression: ast.If) -> str:
+
+        assert if_expression.condition is not None and if_expression.consequence is not None
+
+        consequence = self._branch(if_expression.consequence)
+        alternative = self._branch(if_expression.alternative) if if_expression.alternative is not None else "_NULL"
+
+        # Solo las ramas de una sola expresión se pueden escribir como expresión de Python
+        if consequence is None or alternative is None:
+            return self._walk(if_expression)
+
+        condition = self._temporary()
+
+        return f"({consequence} " \
+            f"if ({condition} := {self._expression(if_expression.condition)}) is not _FALSE and {condition} is not _NULL " \
+            f"else {alternative})"
+
+
+    def _branch(self, block: ast.Block) -> Optional[str]:
+
+        if len(block.statements) == 0:
+            return "None"
+
+        if len(block.statements) == 1 and type(block.statements[0]) == ast.ExpressionStatement:
+
+            expression = cast(ast.ExpressionStatement, block.statements[0]).expression
+            assert expression is not None
+
+            return self._expression(expression)
+
+        return None
+
+
+    # Lo que no sabemos traducir lo evalúa el evaluador, para eso sus variables tienen que estar en un Environment
+    def _walk(self, node: ast.ASTNode) -> str:
+
+        if self._fast:
+            raise _Unsupported()
+
+        return f"_walk(_nodes[{self._module.node(node)}], _env)"
+
+
+    def _temporary(self) -> str:
+
+        self._temporaries += 1
+
+        return f"_t{self._temporaries}"
+
+
+    def _emit(self, depth: int, line: str) -> None:
+
+        self._lines.append(_INDENT * depth + line)
+
+
+# Los nombres que un cuerpo define con variable, incluidos sus si y mientras pero sin entrar a las funciones que contiene
+def _let_names(statements: List[ast.Statement]) -> List[str]:
+
+    names: List[str] = []
+
+    for statement in statements:
+
+        if type(statement) == ast.LetStatement:
+
+            let_statement = cast(ast.LetStatement, statement)
+            assert let_statement.name is not None
+
+            if let_statement.name.value not in names:
+                names.append(let_statement.name.value)
+
+        elif type(statement) == ast.While:
+
+            body = cast(ast.While, statement).body
+            assert body is not None
+
+            names.extend(name for name in _let_names(body.statements) if name not in names)
+
+        elif type(statement) == ast.ExpressionStatement:
+
+            expression = cast(ast.ExpressionStatement, statement).expression
+
+            if type(expression) == ast.If:
+
+                if_expression = cast(ast.If, expression)
+
+                for block in (if_expression.consequence, if_expression.alternative):
+
+                    if block is not None:
+                        names.extend(name for name in _let_names(block.statements) if name not in names)
+
+    return names
+
+
+# Las expresiones que pueden producir un objeto Return, los operadores y los literales nunca lo hacen
+def _may_return(expression: ast.Expression) -> bool:
+
+    return type(expression) not in (ast.Integer, ast.StringLiteral, ast.Boolean, ast.Prefix, ast.Infix, ast.Function)
+
+
+def _load(env: Environment, name: str, line: int, column: int) -> Object:
+
+    scope: Optional[Environment] = env
+
+    while scope is not None:
+
+        store = scope._store
+
+        if name in store:
+            return store[name]
+
+        scope = scope._outer
+
+    builtin = BUILTINS.get(name)
+
+    if builtin is not None:
+        return builtin
+
+    return _locate(_new_error(_UNKNOWN_IDENTIFIER, [name]), line, column)
+
+
+def _assign(env: Environment, name: str, value: Object, line: int, column: int) -> Optional[Object]:
+
+    if env.assign(name, value):
+        return None
+
+    return _locate(_new_error(_UNKNOWN_IDENTIFIER, [name]), line, column)
+
+
+def _call(line: int, column: int, fn: Object, *args: Object) -> Object:
+
+    if type(fn) is TranspiledFunction and len(args) == cast(TranspiledFunction, fn).arity:
+
+        if budget.active:
+            budget.charge()
+
+        function = cast(TranspiledFunction, fn)
+        result = function.python(function.env, *args)
+
+    # Builtins, funciones creadas por otros motores y llamadas con otro número de argumentos
+    else:
+        result = _apply_function(fn, list(args))
+
+    if type(result) is Error:
+        return _locate(result, line, column)
+
+    return result
+
+
+def _closure(template: Tuple[Callable[..., Object], ast.Function], env: Environment) -> TranspiledFunction:
+
+    python, function = template
+
+    assert function.body is not None
+
+    return TranspiledFunction(function.parameters, function.body, env, python)
+
+
+def _infix(operator: str, left: Object, right: Object, line: int, column: int) -> Object:
+
+    return _locate(_evaluate_infix_expression(operator, left, right), line, column)
+
+
+def _prefix(operator: str, right: Object, line: int, column: int) -> Object:
+
+    return _locate(_evaluate_prefix_expression(operator, right), line, column)
+
+
+def _locate(obj: Object, line: int, column: int) -> Object:
+
+    if type(obj) is Error:
+
+        error = cast(Error, obj)
+
+        if error.line == 0 and line > 0:
+            error.line = line
+            error.column = column
+
+    return obj
+
+
+# Todo lo que el código generado puede usar
+_RUNTIME: Dict[str, Any] = {
+    "_assign": _assign,
+    "_budget": budget,
+    "_call": _call,
+    "_closure": _closure,
+    "_Environment": Environment,
+    "_Error": Error,
+    "_FALSE": FALSE,
+    "_infix": _infix,
+    "_integer": to_integer_object,
+    "_Integer": Integer,
+    "_load": _load,
+    "_NULL": NULL,
+    "_prefix": _prefix,
+    "_Return": Return,
+    "_String": String,
+    "_TRUE": TRUE,
+    "_UNSET": _UNSET,
+    "_walk": evaluator.evaluate,
+}
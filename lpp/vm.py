@@ -0,0 +1,375 @@
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import lpp.ast as ast
+import lpp.budget as budget
+import lpp.stack_evaluator as stack_evaluator
+from lpp.builtins import BUILTINS
+from lpp.code import (
+    Bytecode,
+    FunctionCode,
+    OpCode,
+    OPERATORS
+)
+from lpp.compiler import compile_program
+from lpp.evaluator import (
+    _apply_function,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _new_error,
+    _UNKNOWN_IDENTIFIER,
+    FALSE,
+    NULL,
+    TRUE
+)
+from lpp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Integer,
+    Object,
+    Return,
+    to_integer_object
+)
+from lpp.stack_evaluator import _STACK_OVERFLOW
+
+
+# Los opcodes como enteros simples, comparar contra una variable local es más rápido que contra un miembro de IntEnum
+_CONSTANT = OpCode.CONSTANT.value
+_POP = OpCode.POP.value
+_TRUE = OpCode.TRUE.value
+_FALSE = OpCode.FALSE.value
+_NULL = OpCode.NULL.value
+_NONE = OpCode.NONE.value
+_ADD = OpCode.ADD.value
+_SUB = OpCode.SUB.value
+_MUL = OpCode.MUL.value
+_DIV = OpCode.DIV.value
+_EQUAL = OpCode.EQUAL.value
+_NOT_EQUAL = OpCode.NOT_EQUAL.value
+_LESS_THAN = OpCode.LESS_THAN.value
+_GREATER_THAN = OpCode.GREATER_THAN.value
+_LESS_EQUAL = OpCode.LESS_EQUAL.value
+_GREATER_EQUAL = OpCode.GREATER_EQUAL.value
+_MINUS = OpCode.MINUS.value
+_BANG = OpCode.BANG.value
+_JUMP = OpCode.JUMP.value
+_JUMP_NOT_TRUTHY = OpCode.JUMP_NOT_TRUTHY.value
+_POP_UNLESS_ERROR = OpCode.POP_UNLESS_ERROR.value
+_GET_NAME = OpCode.GET_NAME.value
+_SET_NAME = OpCode.SET_NAME.value
+_CLOSURE = OpCode.CLOSURE.value
+_CALL = OpCode.CALL.value
+_RETURN_VALUE = OpCode.RETURN_VALUE.value
+_JUMP_IF_ERROR = OpCode.JUMP_IF_ERROR.value
+_ASSIGN_NAME = OpCode.ASSIGN_NAME.value
+_MAKE_RETURN = OpCode.MAKE_RETURN.value
+
+_OPERATORS: Dict[int, str] = {op.value: operator for op, operator in OPERATORS.items()}
+
+# Lo que guardamos de quien hizo una llamada para continuar cuando la función regrese: instrucciones, constantes, posiciones, ip, ambiente y tamaño del stack
+Frame = Tuple[List[int], List[Any], Dict[int, Tuple[int, int]], int, Environment, int]
+
+
+# Una función de lpp creada por la máquina virtual, guarda el bytecode de su cuerpo
+class Closure(Function):
+
+    __slots__ = ("function",)
+
+
+    def __init__(self, function: FunctionCode, env: Environment) -> None:
+
+        # Sin super().__init__, se crea una por cada vez que se evalúa una función literal
+        self.parameters = function.parameters
+        self.body = function.body
+        self.env = env
+        self.function = function
+
+
+class VM:
+
+    def __init__(self, bytecode: Bytecode, env: Environment, keep_return: bool = False) -> None:
+
+        self._bytecode: Bytecode = bytecode
+        self._env: Environment = env
+        self._keep_return: bool = keep_return
+
+
+    # Un solo ciclo ejecuta el programa y todas las llamadas: las llamadas a funciones de lpp no usan la pila de Python
+    def run(self) -> Optional[Object]:
+
+        instructions, constants, positions = self._bytecode
+        env = self._env
+        stack: List[Any] = []
+        frames: List[Frame] = []
+        base = 0
+        ip = 0
+        current_budget = budget.current()
+        # Los marcos no usan la pila de Python, sin este límite una recursión infinita crece hasta acabarse la memoria
+        max_depth = stack_evaluator.MAX_CALL_DEPTH
+        keep_return = self._keep_return
+
+        while True:
+
+            op = instructions[ip]
+            operand = instructions[ip + 1]
+            ip += 2
+
+            if op == _GET_NAME:
+
+                name = constants[operand]
+                scope: Optional[Environment] = env
+
+                while scope is not None:
+
+                    store = scope._store
+
+                    if name in store:
+                        stack.append(store[name])
+                        break
+
+                    scope = scope._outer
+
+                else:
+                    builtin = BUILTINS.get(name)
+                    stack.append(builtin if builtin is not None
+                                 else _located(_new_error(_UNKNOWN_IDENTIFIER, [name]), positions, ip))
+
+            elif op == _CONSTANT:
+                stack.append(constants[operand])
+
+            elif op == _POP_UNLESS_ERROR:
+
+                value_type = type(stack[-1])
+
+                if value_type is Error or value_type is Return:
+                    ip = operand
+
+                else:
+                    stack.pop()
+
+            elif op == _JUMP_NOT_TRUTHY:
+
+                condition = stack.pop()
+
+                if condition is FALSE or condition is NULL:
+                    ip = operand
+
+            elif op == _JUMP:
+
+                # Solo los saltos hacia atrás repiten código, son las vueltas de los ciclos
+                if current_budget is not None and operand < ip:
+                    current_budget.charge()
+
+                ip = operand
+
+            elif op == _JUMP_IF_ERROR:
+
+                if type(stack[-1]) is Error:
+                    ip = operand
+
+            elif op == _ASSIGN_NAME:
+
+                name = constants[operand]
+
+                if env.assign(name, stack[-1]):
+                    stack[-1] = None
+
+                else:
+                    stack[-1] = _located(_new_error(_UNKNOWN_IDENTIFIER, [name]), positions, ip)
+
+            elif _ADD <= op <= _DIV:
+
+                right = stack.pop()
+                left = stack[-1]
+
+                if type(left) is Integer and type(right) is Integer:
+
+                    if op == _ADD:
+                        stack[-1] = to_integer_object(left.value + right.value)
+
+                    elif op == _SUB:
+                        stack[-1] = to_integer_object(left.value - right.value)
+
+                    elif op == _MUL:
+                        stack[-1] = to_integer_object(left.value * right.value)
+
+                    else:
+                        stack[-1] = to_integer_object(left.value // right.value)
+
+                else:
+                    stack[-1] = _infix(op, left, right, positions, ip)
+
+            elif _EQUAL <= op <= _GREATER_EQUAL:
+
+                right = stack.pop()
+                left = stack[-1]
+
+                if type(left) is Integer and type(right) is Integer:
+
+                    if op == _LESS_THAN:
+                        result = left.value < right.value
+
+                    elif op == _GREATER_THAN:
+                        result = left.value > right.value
+
+                    elif op == _EQUAL:
+                        result = left.value == right.value
+
+                    elif op == _NOT_EQUAL:
+                        result = left.value != right.value
+
+                    elif op == _LESS_EQUAL:
+                        result = left.value <= right.value
+
+                    else:
+                        result = left.value >= right.value
+
+                    stack[-1] = TRUE if result else FALSE
+
+                else:
+                    stack[-1] = _infix(op, left, right, positions, ip)
+
+            elif op == _CALL:
+
+                fn = stack[-1 - operand]
+
+                if type(fn) is Closure and operand == len(fn.function.names):
+
+                    if current_budget is not None:
+                        current_budget.charge()
+
+                    # Igual que en stack_evaluator, pasar del límite termina toda la ejecución
+                    if len(frames) >= max_depth:
+                        return _located(_new_error(_STACK_OVERFLOW, []), positions, ip)
+
+                    frames.append((instructions, constants, positions, ip, env, base))
+
+                    env = Environment(outer=fn.env)
+                    env._store.update(zip(fn.function.names, stack[len(stack) - operand:]))
+
+                    del stack[len(stack) - operand - 1:]
+                    base = len(stack)
+
+                    instructions, constants, positions = fn.function.bytecode
+                    ip = 0
+
+                else:
+                    args = stack[len(stack) - operand:]
+                    del stack[len(stack) - operand - 1:]
+                    stack.append(_call(fn, args, positions, ip))
+
+            elif op == _RETURN_VALUE:
+
+                value = stack.pop()
+
+                # Sin marcos termina el programa, un regresa es el que no tiene operando; un valor Return ya viene envuelto
+                if not frames and keep_return:
+                    return value if operand else Return(value)
+
+                if operand and type(value) is Return:
+                    value = value.value
+
+                if not frames:
+                    return value
+
+                # Un regresa dentro de una expresión puede dejar valores a medio usar en el stack
+                del stack[base:]
+
+                instructions, constants, positions, ip, env, base = frames.pop()
+
+                if type(value) is Error:
+                    value = _located(value, positions, ip)
+
+                stack.append(value)
+
+            elif op == _SET_NAME:
+                env._store[constants[operand]] = stack.pop()
+                env._version += 1
+
+            elif op == _CLOSURE:
+                stack.append(Closure(constants[operand], env))
+
+            elif op == _TRUE:
+                stack.append(TRUE)
+
+            elif op == _FALSE:
+                stack.append(FALSE)
+
+            elif op == _NULL:
+                stack.append(NULL)
+
+            elif op == _NONE:
+                stack.append(None)
+
+            elif op == _BANG:
+                value = stack[-1]
+                stack[-1] = TRUE if value is FALSE or value is NULL else FALSE
+
+            elif op == _MINUS:
+
+                value = stack[-1]
+
+                if type(value) is Integer:
+                    stack[-1] = to_integer_object(-value.value)
+
+                else:
+                    stack[-1] = _located(_evaluate_prefix_expression("-", value), positions, ip)
+
+            elif op == _POP:
+                stack.pop()
+
+            elif op == _MAKE_RETURN:
+                stack[-1] = Return(stack[-1])
+
+            else:
+                raise ValueError(f"Opcode desconocido: {op}")
+
+
+def run(program: ast.Program, env: Environment, keep_return: bool = False) -> Optional[Object]:
+
+    return VM(compile_program(program), env, keep_return).run()
+
+
+# La misma firma que evaluator.evaluate, para poder escoger el motor desde main.py y el REPL
+def evaluate(node: ast.ASTNode, env: Environment, keep_return: bool = False) -> Optional[Object]:
+
+    return run(cast(ast.Program, node), env, keep_return)
+
+
+def _infix(op: int, left: Object, right: Object, positions: Dict[int, Tuple[int, int]], ip: int) -> Object:
+
+    return _located(_evaluate_infix_expression(_OPERATORS[op], left, right), positions, ip)
+
+
+# Builtins, funciones creadas por el evaluador y llamadas con otro número de argumentos
+def _call(fn: Object, args: List[Object], positions: Dict[int, Tuple[int, int]], ip: int) -> Object:
+
+    if type(fn) is Builtin:
+        result = cast(Builtin, fn).fn(*args)
+
+    else:
+        result = _apply_function(fn, args)
+
+    return _located(result, positions, ip)
+
+
+# ip ya apunta a la instrucción siguiente, la posición es la de la instrucción que produjo el valor
+def _located(obj: Object, positions: Dict[int, Tuple[int, int]], ip: int) -> Object:
+
+    if type(obj) is Error:
+
+        error = cast(Error, obj)
+        position = positions.get(ip - 2)
+
+        if error.line == 0 and position is not None and position[0] > 0:
+            error.line, error.column = position
+
+    return obj
@@ -1,13 +1,93 @@
+from argparse import ArgumentParser
+from sys import stdin
+
+from typing import (
+    List,
+    Optional
+)
+
+from lpp.batch import (
+    print_reports,
+    validate
+)
+from lpp.budget import new_budget
+from lpp.engines import (
+    DEFAULT_ENGINE,
+    ENGINES
+)
 from lpp.repl import start_repl
+from lpp.runner import (
+    run_file,
+    run_stdin
+)
+from lpp.server import (
+    DEFAULT_TIMEOUT,
+    serve
+)
+import lpp.stack_evaluator as stack_evaluator
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+
+    arguments = ArgumentParser(description="Lenguaje de Programación Platzi")
+    arguments.add_argument("programa", nargs="?", default=None,
+                           help="archivo .lpp a ejecutar, con - o un pipe se lee de la entrada estándar; sin él se abre el REPL")
+    arguments.add_argument("--validar", nargs="+", metavar="RUTA",
+                           help="lexea y parsea los archivos .lpp (o directorios) indicados y reporta sus errores")
+    arguments.add_argument("--procesos", type=int, default=None,
+                           help="número de procesos para --validar o --servidor (por defecto uno por núcleo)")
+    arguments.add_argument("--resultados", default=None, metavar="ARCHIVO",
+                           help="archivo donde --validar guarda los resultados de los archivos que no cambian")
+    arguments.add_argument("--servidor", default=None, metavar="SOCKET",
+                           help="se queda escuchando en el socket Unix indicado y ejecuta los programas que recibe en procesos ya iniciados")
+    arguments.add_argument("--tiempo", type=float, default=None, metavar="SEGUNDOS",
+                           help=f"tiempo máximo de cada programa (de cada línea en el REPL), con --servidor por defecto {DEFAULT_TIMEOUT:g}")
+    arguments.add_argument("--pasos", type=int, default=None, metavar="N",
+                           help="máximo de llamadas a funciones y vueltas de ciclos de cada programa (de cada línea en el REPL)")
+    arguments.add_argument("--optimizar", action="store_true",
+                           help="simplifica las expresiones constantes del programa antes de evaluarlo")
+    arguments.add_argument("--motor", choices=sorted(ENGINES), default=DEFAULT_ENGINE,
+                           help="cómo se ejecutan los programas: recorriendo el árbol, con closures, con la máquina virtual, traducidos a Python, con una pila propia o propagando regresa y los errores como excepciones")
+    arguments.add_argument("--profundidad", type=int, default=stack_evaluator.MAX_CALL_DEPTH, metavar="N",
+                           help="máximo de llamadas anidadas con --motor pila antes de un error de desbordamiento de pila")
+    arguments.add_argument("--sin-cache", dest="cache", action="store_false",
+                           help="no carga ni guarda el programa ya parseado en el directorio __lppcache__ junto al archivo")
+    arguments.add_argument("--desensamblar", action="store_true",
+                           help="muestra el bytecode de cada programa antes de ejecutarlo")
+
+    options = arguments.parse_args(argv)
 
+    stack_evaluator.MAX_CALL_DEPTH = options.profundidad
+
+    if options.validar:
+        return print_reports(validate(options.validar, options.procesos, options.resultados))
+
+    if options.servidor:
+        return serve(options.servidor,
+                     options.procesos,
+                     options.tiempo or DEFAULT_TIMEOUT,
+                     options.motor,
+                     options.optimizar,
+                     options.pasos)
+
+    if options.programa == "-" or (options.programa is None and not stdin.isatty()):
+        return run_stdin(options.optimizar, options.motor, options.desensamblar, new_budget(options.pasos, options.tiempo))
+
+    if options.programa is not None:
+        return run_file(options.programa,
+                        options.optimizar,
+                        options.motor,
+                        options.desensamblar,
+                        new_budget(options.pasos, options.tiempo),
+                        options.cache)
 
-def main() -> None:
-    
     print("¡Bienvenido al lenguaje de Programación Platzi!")
     print("Escribe una oración para comenzar.")
 
-    start_repl()
+    start_repl(options.optimizar, options.motor, options.desensamblar, options.pasos, options.tiempo)
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
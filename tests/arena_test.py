@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from typing import (
+    Any,
+    List
+)
+
+from lpp.arena import (
+    from_arena,
+    to_arena
+)
+from lpp.ast import (
+    ASTNode,
+    Call,
+    ExpressionStatement,
+    Function,
+    Identifier,
+    Infix,
+    Program
+)
+from lpp.iterative_parser import IterativeParser
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+SOURCE: str = """
+    variable suma = funcion(x, y) {
+        si (x > -1 === !falso) { regresa x + y; } si_no { regresa "nada"; }
+    };
+    suma(1, 2);
+    mientras (x < 3) { x = x + 1; }
+    f(;
+    variable g = funcion() { verdadero };
+"""
+
+
+class ArenaTest(TestCase):
+
+    def test_round_trip(self) -> None:
+
+        program: Program = Parser(TokenBuffer(SOURCE)).parse_program()
+        rebuilt: Program = from_arena(to_arena(program))
+
+        self.assertEqual(self._dump(rebuilt), self._dump(program))
+
+
+    def test_layout(self) -> None:
+
+        arena = to_arena(Parser(TokenBuffer("a + 1; f(a)")).parse_program())
+
+        # Los hijos siempre van antes que sus padres y la raíz es el último nodo
+        self.assertIs(arena.kind(arena.root), Program)
+        self.assertEqual([arena.kind(index) for index in arena.child_indexes(arena.root)],
+                         [ExpressionStatement, ExpressionStatement])
+
+        infix = arena.child_indexes(arena.child_indexes(arena.root)[0])[0]
+        self.assertIs(arena.kind(infix), Infix)
+        self.assertEqual(arena.value(infix), "+")
+
+        # El literal "a" se guarda una sola vez aunque aparezca en dos nodos
+        self.assertEqual(arena.pool.count("a"), 1)
+
+        call = arena.child_indexes(arena.child_indexes(arena.root)[1])[0]
+        self.assertIs(arena.kind(call), Call)
+        self.assertEqual([arena.kind(index) for index in arena.child_indexes(call)],
+                         [Identifier, Identifier])
+
+
+    def test_deep_program(self) -> None:
+
+        depth: int = 50_000
+        source: str = "funcion() { " * depth + "1" + " }" * depth
+
+        program: Program = IterativeParser(TokenBuffer(source)).parse_program()
+        arena = to_arena(program)
+        rebuilt: Program = from_arena(arena)
+
+        self.assertEqual(len(arena), 3 * depth + 3)
+
+        statement: Any = rebuilt.statements[0]
+        self.assertIsInstance(statement.expression, Function)
+
+
+    def _dump(self, node: Any) -> Any:
+
+        if isinstance(node, list):
+            return [self._dump(item) for item in node]
+
+        if not isinstance(node, ASTNode):
+            return node
+
+        slots: List[str] = [slot for cls in type(node).__mro__ for slot in getattr(cls, "__slots__", ())]
+
+        return (type(node).__name__, {slot: self._dump(getattr(node, slot)) for slot in slots})
@@ -0,0 +1,106 @@
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from typing import (
+    Dict,
+    List
+)
+
+from lpp.batch import (
+    collect_files,
+    FileReport,
+    validate
+)
+
+
+VALID_SOURCE: str = """
+    variable suma = funcion(x, y) { x + y; };
+    suma(1, 2);
+"""
+
+INVALID_SOURCE: str = """
+    variable = 5;
+"""
+
+
+class BatchTest(TestCase):
+
+    def test_reports_errors_with_positions(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            self._write(directory, {"bueno.lpp": VALID_SOURCE, "malo.lpp": INVALID_SOURCE})
+            reports = self._by_name(validate([directory], 2, path.join(directory, "resultados.json")))
+
+            self.assertEqual(reports["bueno.lpp"].errors, [])
+            self.assertEqual(len(reports["malo.lpp"].errors), 2)
+            self.assertIn("(línea 2, columna 14)", reports["malo.lpp"].errors[0])
+
+
+    def test_unchanged_files_are_skipped(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            results = path.join(directory, "resultados.json")
+            self._write(directory, {"bueno.lpp": VALID_SOURCE, "malo.lpp": INVALID_SOURCE})
+
+            first = self._by_name(validate([directory], 2, results))
+            self.assertFalse(any(report.cached for report in first.values()))
+
+            self._write(directory, {"bueno.lpp": VALID_SOURCE + "\n1;"})
+            second = self._by_name(validate([directory], 2, results))
+
+            self.assertFalse(second["bueno.lpp"].cached)
+            self.assertTrue(second["malo.lpp"].cached)
+            self.assertEqual(second["malo.lpp"].errors, first["malo.lpp"].errors)
+
+
+    def test_sequential_and_parallel_agree(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            sources = {f"programa_{idx}.lpp": VALID_SOURCE * idx + INVALID_SOURCE * (idx % 2) for idx in range(8)}
+            self._write(directory, sources)
+
+            sequential = validate([directory], 1, path.join(directory, "secuencial.json"))
+            parallel = validate([directory], 3, path.join(directory, "paralelo.json"))
+
+            self.assertEqual(sequential, parallel)
+            self.assertEqual(len(collect_files([directory])), 8)
+
+
+    def test_deeply_nested_file_does_not_stop_the_batch(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            self._write(directory, {"anidado.lpp": "(" * 5000 + "1" + ")" * 5000 + ";", "malo.lpp": INVALID_SOURCE})
+
+            for processes in (1, 2):
+
+                reports = self._by_name(validate([directory], processes, path.join(directory, f"resultados_{processes}.json")))
+
+                self.assertEqual(reports["anidado.lpp"].errors, [])
+                self.assertEqual(len(reports["malo.lpp"].errors), 2)
+
+
+    def test_unreadable_file(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            reports = validate([path.join(directory, "no_existe.lpp")], 1, path.join(directory, "resultados.json"))
+
+            self.assertEqual(len(reports), 1)
+            self.assertEqual(len(reports[0].errors), 1)
+
+
+    def _by_name(self, reports: List[FileReport]) -> Dict[str, FileReport]:
+
+        return {path.basename(report.path): report for report in reports}
+
+
+    def _write(self, directory: str, sources: Dict[str, str]) -> None:
+
+        for name, source in sources.items():
+            with open(path.join(directory, name), "w", encoding="utf-8") as file:
+                file.write(source)
@@ -0,0 +1,172 @@
+from contextlib import (
+    redirect_stderr,
+    redirect_stdout
+)
+from io import (
+    BytesIO,
+    StringIO
+)
+from unittest import TestCase
+
+from typing import (
+    Any,
+    Optional
+)
+
+import lpp
+import lpp.budget as budget
+from lpp.budget import (
+    Budget,
+    evaluate_with_budget
+)
+from lpp.engines import ENGINES
+from lpp.object import (
+    Environment,
+    Error,
+    Object
+)
+from lpp.parser import Parser
+from lpp.runner import (
+    EXIT_RUNTIME_ERROR,
+    run_stream
+)
+from lpp.token_buffer import TokenBuffer
+
+
+INFINITE_LOOP: str = "mientras (verdadero) { 1; }"
+
+INFINITE_RECURSION: str = """
+    variable f = funcion(n) { f(n + 1) + 1 };
+    f(0);
+"""
+
+FIBONACCI: str = """
+    variable fib = funcion(n) {
+        si (n < 2) { regresa n; }
+        fib(n - 1) + fib(n - 2);
+    };
+"""
+
+
+class BudgetTest(TestCase):
+
+    def test_steps_stop_infinite_loops(self) -> None:
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+
+                evaluated = self._evaluate(INFINITE_LOOP, engine, Budget(steps=1000))
+
+                self.assertEquals(self._inspect(evaluated), "Error: Se agotaron los 1000 pasos permitidos")
+
+
+    def test_infinite_recursion_ends_in_an_error(self) -> None:
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+
+                evaluated = self._evaluate(INFINITE_RECURSION, engine, Budget(steps=100000))
+
+                # Los motores que usan la pila de Python llegan a su límite antes que a los pasos
+                self.assertIsInstance(evaluated, Error)
+
+
+    def test_deadline_stops_exponential_programs(self) -> None:
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+
+                program_budget = Budget(seconds=0.05)
+                evaluated = self._evaluate(FIBONACCI + "fib(40);", engine, program_budget)
+
+                self.assertEquals(self._inspect(evaluated), "Error: Se agotó el tiempo de 0.05 segundos")
+                self.assertTrue(program_budget.timed_out)
+
+
+    def test_deadline_is_checked_on_every_step(self) -> None:
+
+        program_budget = Budget(seconds=60)
+        program_budget._deadline = 0
+
+        with self.assertRaises(budget.BudgetExhausted):
+            program_budget.charge()
+
+        self.assertEquals(program_budget.used, 1)
+        self.assertTrue(program_budget.timed_out)
+
+
+    def test_running_out_of_memory_ends_in_an_error(self) -> None:
+
+        def exhausting(node: Any, env: Environment) -> Optional[Object]:
+            raise MemoryError()
+
+        evaluated = evaluate_with_budget(exhausting, Parser(TokenBuffer("1;")).parse_program(), Environment(), Budget(steps=10))
+
+        self.assertEquals(self._inspect(evaluated), "Error: Se agotó la memoria")
+        self.assertEquals(budget.active, 0)
+
+
+    def test_enough_budget_gives_the_same_result(self) -> None:
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+
+                program_budget = Budget(steps=1000, seconds=60)
+                evaluated = self._evaluate(FIBONACCI + "fib(10);", engine, program_budget)
+
+                self.assertEquals(self._inspect(evaluated), "55")
+                self.assertEquals(program_budget.used, 177)
+                self.assertFalse(program_budget.timed_out)
+
+
+    def test_no_budget_is_active_afterwards(self) -> None:
+
+        self._evaluate(INFINITE_LOOP, "evaluador", Budget(steps=10))
+
+        self.assertEquals(budget.active, 0)
+        self.assertIsNone(budget.current())
+        self.assertEquals(self._inspect(self._evaluate(FIBONACCI + "fib(15);", "evaluador")), "610")
+
+
+    def test_runner_shares_the_budget_across_statements(self) -> None:
+
+        source = "mientras (verdadero) { 1; }\n5;"
+        output = StringIO()
+        errors = StringIO()
+
+        with redirect_stdout(output), redirect_stderr(errors):
+            exit_code = run_stream(BytesIO(source.encode("utf-8")), budget=Budget(steps=50))
+
+        self.assertEquals(exit_code, EXIT_RUNTIME_ERROR)
+        self.assertEquals(output.getvalue(), "")
+        self.assertEquals(errors.getvalue().splitlines(), ["Error: Se agotaron los 50 pasos permitidos"])
+
+
+    def test_compiled_programs(self) -> None:
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+
+                program = lpp.compile("mientras (n > 0) { n = n - 1; } n;", engine=engine)
+
+                self.assertEquals(self._inspect(program.run({"n": 10}, steps=20)), "0")
+                self.assertEquals(self._inspect(program.run({"n": 100}, steps=20)), "Error: Se agotaron los 20 pasos permitidos")
+
+
+    def _evaluate(self, source: str, engine: str, program_budget: Optional[Budget] = None) -> Optional[Object]:
+
+        parser: Parser = Parser(TokenBuffer(source))
+        program = parser.parse_program()
+
+        self.assertEquals(parser.errors, [])
+
+        if program_budget is None:
+            return ENGINES[engine](program, Environment())
+
+        return evaluate_with_budget(ENGINES[engine], program, Environment(), program_budget)
+
+
+    def _inspect(self, result: Optional[Object]) -> Any:
+
+        assert result is not None
+        return result.inspect()
@@ -0,0 +1,129 @@
+from os import (
+    listdir,
+    path,
+    utime
+)
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from lpp.ast import Program
+from lpp.cache import (
+    CACHE_DIRECTORY,
+    dump_program,
+    load_program,
+    ParseCache,
+    script_cache
+)
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+SOURCE: str = """
+    variable suma = funcion(x, y) {
+        si (x > -1 === !falso) { regresa x + y; } si_no { regresa "nada"; }
+    };
+    suma(1, 2);
+    mientras (x < 3) { x = x + 1; }
+    variable f = funcion() { verdadero };
+"""
+
+
+class CacheTest(TestCase):
+
+    def test_round_trip(self) -> None:
+
+        program: Program = Parser(TokenBuffer(SOURCE)).parse_program()
+        loaded = load_program(dump_program(program, SOURCE), SOURCE)
+
+        assert loaded is not None
+        self.assertEqual(str(loaded), str(program))
+        self.assertEqual([statement.token for statement in loaded.statements],
+                         [statement.token for statement in program.statements])
+
+
+    def test_stale_data_is_ignored(self) -> None:
+
+        program: Program = Parser(TokenBuffer(SOURCE)).parse_program()
+        data: bytes = dump_program(program, SOURCE)
+
+        self.assertIsNone(load_program(data, SOURCE + " "))
+        self.assertIsNone(load_program(b"XXXX" + data[4:], SOURCE))
+        self.assertIsNone(load_program(data[:4] + bytes([255]) + data[5:], SOURCE))
+
+
+    def test_parse_stores_and_loads(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            cache: ParseCache = script_cache(path.join(directory, "programa.lpp"))
+
+            self.assertIsNone(cache.load(SOURCE))
+
+            program, errors = cache.parse(SOURCE)
+            self.assertEqual(errors, [])
+            self.assertEqual(len(listdir(path.join(directory, CACHE_DIRECTORY))), 1)
+
+            loaded = cache.load(SOURCE)
+
+            assert loaded is not None
+            self.assertEqual(str(loaded), str(program))
+
+
+    def test_unwritable_cache_still_parses(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            # Un archivo donde debería estar el directorio del cache hace fallar a store
+            blocked = path.join(directory, "bloqueado")
+
+            with open(blocked, "w"):
+                pass
+
+            program, errors = ParseCache(blocked).parse(SOURCE)
+
+            self.assertEqual(errors, [])
+            self.assertEqual(len(program.statements), 4)
+
+            cache: ParseCache = ParseCache(directory)
+            cache.parse(SOURCE)
+
+            with patch("lpp.cache.utime", side_effect=PermissionError):
+                loaded = cache.load(SOURCE)
+
+            assert loaded is not None
+            self.assertEqual(str(loaded), str(program))
+
+
+    def test_programs_with_errors_are_not_cached(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            cache: ParseCache = ParseCache(directory)
+            _, errors = cache.parse("variable = 5;")
+
+            self.assertNotEqual(errors, [])
+            self.assertEqual(listdir(directory), [])
+
+
+    def test_eviction(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            cache: ParseCache = ParseCache(directory)
+            sources = [f"variable x = {idx};" for idx in range(3)]
+
+            for source in sources:
+                cache.parse(source)
+
+            sizes = [path.getsize(path.join(directory, name)) for name in listdir(directory)]
+
+            # Ponemos la fecha de uno de ellos hasta atrás y dejamos espacio solo para tres archivos
+            oldest = listdir(directory)[0]
+            utime(path.join(directory, oldest), (0, 0))
+
+            small: ParseCache = ParseCache(directory, max_bytes=sum(sizes) + 16)
+            small.parse("variable y = 10;")
+
+            self.assertEqual(len(listdir(directory)), 3)
+            self.assertNotIn(oldest, listdir(directory))
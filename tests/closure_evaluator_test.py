@@ -0,0 +1,75 @@
+from typing import (
+    List,
+    Tuple
+)
+
+from lpp.closure_evaluator import evaluate
+from lpp.evaluator import evaluate as evaluate_tree
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object
+)
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+from tests import evaluator_test
+
+
+# Las mismas pruebas del evaluador, pero ejecutando los programas compilados a closures
+class ClosureEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    def test_parameters_keep_their_order(self) -> None:
+
+        tests: List[Tuple[str, int]] = [
+            ('variable resta = funcion(x, y) { x - y }; resta(10, 3);', 7),
+            ('variable f = funcion(a, b, c) { a * 100 + b * 10 + c }; f(1, 2, 3);', 123),
+        ]
+
+        for source, expected in tests:
+            self._test_integer_object(self._evaluate_tests(source), expected)
+            self._test_integer_object(self._evaluate_tree(source), expected)
+
+
+    def test_closures(self) -> None:
+
+        source: str = '''
+            variable sumador = funcion(x) { funcion(y) { x + y } };
+            variable suma_dos = sumador(2);
+            variable fib = funcion(n) { si (n < 2) { regresa n; } fib(n - 1) + fib(n - 2) };
+            suma_dos(fib(15));
+        '''
+
+        self._test_integer_object(self._evaluate_tests(source), 612)
+
+
+    def test_errors_keep_their_position(self) -> None:
+
+        source: str = 'variable f = funcion(x) {\n  x + verdadero\n};\nf(1);'
+        expected: str = 'Error: Discrepancia de tipos: INTEGER + BOOLEAN (línea 2, columna 5)'
+
+        for evaluate_program in (evaluate, evaluate_tree):
+
+            evaluated = evaluate_program(Parser(TokenBuffer(source)).parse_program(), Environment())
+
+            assert evaluated is not None
+            self.assertEqual(evaluated.inspect(), expected)
+
+
+    def _evaluate_tests(self, source: str) -> Object:
+
+        parser: Parser = Parser(Lexer(source))
+        evaluated = evaluate(parser.parse_program(), Environment())
+
+        assert evaluated is not None
+
+        return evaluated
+
+
+    def _evaluate_tree(self, source: str) -> Object:
+
+        parser: Parser = Parser(Lexer(source))
+        evaluated = evaluate_tree(parser.parse_program(), Environment())
+
+        assert evaluated is not None
+
+        return evaluated
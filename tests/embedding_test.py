@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+from sys import (
+    getswitchinterval,
+    setswitchinterval
+)
+from unittest import TestCase
+
+from typing import (
+    Any,
+    List,
+    Optional
+)
+
+import lpp
+from lpp.engines import ENGINES
+from lpp.object import Object
+
+
+RULES: str = """
+    variable limite = 100;
+    variable descuento = funcion(total) {
+        si (total > limite) { regresa total / 10; }
+        0;
+    };
+    si (cliente == "frecuente") { descuento(total) + 5 } si_no { descuento(total) }
+"""
+
+
+class EmbeddingTest(TestCase):
+
+    def test_runs_with_different_bindings(self) -> None:
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+
+                rules = lpp.compile(RULES, engine=engine)
+
+                self.assertEquals(self._inspect(rules.run({"total": 500, "cliente": "nuevo"})), "50")
+                self.assertEquals(self._inspect(rules.run({"total": 50, "cliente": "frecuente"})), "5")
+                self.assertEquals(self._inspect(rules.run({"total": 1000, "cliente": "frecuente"})), "105")
+
+
+    def test_each_run_gets_a_new_environment(self) -> None:
+
+        program = lpp.compile("si (primera) { variable secreto = 1; } secreto;")
+
+        self.assertEquals(self._inspect(program.run({"primera": True})), "1")
+        self.assertEquals(self._inspect(program.run({"primera": False})),
+                          "Error: Identificador no encontrado: secreto (línea 1, columna 40)")
+
+
+    def test_python_values(self) -> None:
+
+        program = lpp.compile("si (activo) { longitud(nombre) + n } si_no { nada }")
+
+        self.assertEquals(self._inspect(program.run({"activo": True, "nombre": "abc", "n": 2})), "5")
+        self.assertEquals(self._inspect(program.run({"activo": False, "nombre": "", "n": 0, "nada": None})), "nulo")
+
+        with self.assertRaises(TypeError):
+            program.run({"activo": 1.5})
+
+
+    def test_parse_errors(self) -> None:
+
+        with self.assertRaises(lpp.ParseError) as context:
+            lpp.compile("variable = 5;")
+
+        self.assertEquals(len(context.exception.errors), 2)
+
+
+    def test_concurrent_runs(self) -> None:
+
+        interval = getswitchinterval()
+
+        # Cambiar de hilo muy seguido hace que las ejecuciones se mezclen a mitad de cada búsqueda
+        setswitchinterval(1e-6)
+
+        try:
+
+            for engine in ENGINES:
+                with self.subTest(engine=engine):
+
+                    rules = lpp.compile(RULES, engine=engine)
+                    totals: List[int] = list(range(0, 3000, 7))
+
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        results = list(executor.map(lambda total: self._inspect(rules.run({"total": total, "cliente": "nuevo"})), totals))
+
+                    self.assertEquals(results, [str(total // 10 if total > 100 else 0) for total in totals])
+
+        finally:
+            setswitchinterval(interval)
+
+
+    def _inspect(self, result: Optional[Object]) -> Any:
+
+        return None if result is None else result.inspect()
@@ -267,6 +267,9 @@ class EvaluatorTest(TestCase):
                 suma(5 + 5, suma(10, 10));
             ''', 30),
             ('funcion(x) { x }(5)', 5),
+            ('variable resta = funcion(x, y) { x - y }; resta(5, 3);', 2),
+            ('variable resta = funcion(x, y) { regresa x - y; }; resta(3, 5);', -2),
+            ('variable primero = funcion(x) { x }; primero(1, 2);', 1),
         ]
 
         for source, expected in tests:
@@ -350,6 +353,98 @@ class EvaluatorTest(TestCase):
                 self._test_error_object(evaluated, expected)
                 
 
+    def test_redefined_globals(self) -> None:
+
+        tests: List[Tuple[str, int]] = [
+            ('variable x = 1; variable f = funcion() { x }; variable a = f(); variable x = 2; a + f();', 3),
+            ('variable f = funcion() { longitud("ab") }; variable a = f(); variable longitud = funcion(s) { 10 }; a + f();', 12),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+
+    def test_while_loops(self) -> None:
+
+        tests: List[Tuple[str, int]] = [
+            ('variable i = 0; variable s = 0; mientras (i < 10) { s = s + i; i = i + 1; } s;', 45),
+            ('variable f = funcion(n) { variable i = 0; variable s = 0; mientras (i < n) { s = s + i; i = i + 1; } s }; f(100);', 4950),
+            ('variable f = funcion(n) { variable i = 0; mientras (verdadero) { si (i == n) { regresa i * 2; } i = i + 1; } }; f(7);', 14),
+            ('variable i = 0; mientras (i < 5) { variable j = i; i = i + 1; } j;', 4),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+
+    def test_reassignment(self) -> None:
+
+        tests: List[Tuple[str, int]] = [
+            ('variable a = 1; a = a + 1; a;', 2),
+            ('variable c = 0; variable inc = funcion() { c = c + 1; c }; inc(); inc(); c;', 2),
+            ('variable f = funcion() { variable x = 1; variable g = funcion() { x = x + 1; x }; g(); g() }; f();', 3),
+            ('variable f = funcion(n) { n = n * 2; n }; f(4);', 8),
+            ('variable x = 1; variable f = funcion() { x = 2; variable x = 3; x }; f() + x * 10;', 23),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+
+    def test_loop_and_assignment_errors(self) -> None:
+
+        tests: List[Tuple[str, str]] = [
+            ('x = 5; 1', 'Identificador no encontrado: x'),
+            ('variable f = funcion() { y = 1; 2 }; f();', 'Identificador no encontrado: y'),
+            ('mientras (1 + verdadero) { 1 } 2', 'Discrepancia de tipos: INTEGER + BOOLEAN'),
+            ('variable i = 0; mientras (i < 3) { i = i + 1; 1 + "a"; } i', 'Discrepancia de tipos: INTEGER + STRING'),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_error_object(evaluated, expected)
+
+
+    def test_return_inside_if_expression(self) -> None:
+
+        # Un regresa dentro de un si usado como expresión no termina la función: el si vale el Return y la función sigue
+        tests: List[Tuple[str, Any]] = [
+            ('variable f = funcion(x) { variable a = si (x > 0) { regresa x; }; 7 }; f(3);', 7),
+            ('variable f = funcion(x) { variable a = si (x > 0) { si (verdadero) { regresa x; }; 9 }; 7 }; f(3);', 7),
+            ('variable f = funcion(x) { variable a = si (x > 0) { regresa x; }; a }; f(3);', 3),
+            ('variable f = funcion(x) { variable a = si (x > 0) { regresa x; }; a; 7 }; f(3);', 3),
+            ('variable f = funcion(x) { si (x > 0) { regresa x; }; 7 }; f(3);', 3),
+            ('variable a = si (verdadero) { regresa 3; }; 10;', 10),
+            ('variable f = funcion(x) { variable a = si (x > 0) { regresa x; }; a + 4 }; f(3);', 'Discrepancia de tipos: RETURN + INTEGER'),
+        ]
+
+        for source, expected in tests:
+
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+
+            else:
+                self._test_error_object(evaluated, expected)
+
+
+    def test_wrong_number_of_arguments(self) -> None:
+
+        tests: List[Tuple[str, str]] = [
+            ('variable resta = funcion(x, y) { x - y }; resta(5);', 'Número incorrecto de argumentos: se recibieron 1, se requieren 2'),
+            ('funcion(x) { x }()', 'Número incorrecto de argumentos: se recibieron 0, se requieren 1'),
+            ('variable f = funcion(n) { si (n == 0) { regresa 0; } f(); }; f(2);', 'Número incorrecto de argumentos: se recibieron 0, se requieren 1'),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_error_object(evaluated, expected)
+
+
     def _test_error_object(self, evaluated: Object, expected: str) -> None:
 
         self.assertIsInstance(evaluated, Error)
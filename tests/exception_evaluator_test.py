@@ -0,0 +1,84 @@
+from sys import (
+    getrecursionlimit,
+    setrecursionlimit
+)
+
+from typing import (
+    List,
+    Optional
+)
+
+import lpp.evaluator as evaluator
+from lpp.exception_evaluator import evaluate
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object
+)
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+from tests import evaluator_test
+
+
+# Las mismas pruebas del evaluador con regresa y los errores propagados como excepciones
+class ExceptionEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    def test_same_results_as_evaluator(self) -> None:
+
+        tests: List[str] = [
+            # Un regresa dentro de un si usado como valor se guarda en la variable
+            'variable a = 2; variable b = si (a > 1) { regresa 5; 6 }; b',
+            'variable b = si (verdadero) { regresa 5; }; b + 1',
+            'variable f = funcion() { variable b = si (verdadero) { regresa 5; }; b; 7 }; f();',
+            'variable f = funcion() { regresa si (verdadero) { regresa 5; }; }; f();',
+            # Los errores dentro de una expresión son valores
+            'variable e = 1 + verdadero; e == e',
+            '(1 + verdadero) + 5',
+            'variable f = funcion() { si (verdadero) { 1 + "a"; } 5 }; f();',
+            'si (verdadero) { si (verdadero) { -"a"; } 5 } 7',
+            'variable f = funcion(x) { si (x > 0) { regresa f(x - 1); } nada }; f(3);',
+            'variable f = funcion(x) { longitud(x) }; f(1);',
+            'variable g = funcion() { 5(1) }; g();',
+            'variable f = funcion() { variable x = 1; }; variable g = funcion() { regresa 3; 4 }; g();',
+            'si (falso) { 1 }',
+        ]
+
+        for source in tests:
+
+            expected = evaluator.evaluate(Parser(TokenBuffer(source)).parse_program(), Environment())
+            evaluated = evaluate(Parser(TokenBuffer(source)).parse_program(), Environment())
+
+            self.assertEqual(self._inspect(evaluated), self._inspect(expected), source)
+
+
+    def test_deep_tail_recursion(self) -> None:
+
+        source: str = '''
+            variable cuenta = funcion(n) { si (n == 0) { regresa "listo"; } cuenta(n - 1) };
+            cuenta(5000);
+        '''
+
+        recursion_limit = getrecursionlimit()
+        setrecursionlimit(300)
+
+        try:
+            evaluated = self._evaluate_tests(source)
+
+        finally:
+            setrecursionlimit(recursion_limit)
+
+        self._test_string_object(evaluated, 'listo')
+
+
+    def _inspect(self, evaluated: Optional[Object]) -> Optional[str]:
+
+        return None if evaluated is None else evaluated.inspect()
+
+
+    def _evaluate_tests(self, source: str) -> Object:
+
+        evaluated = evaluate(Parser(Lexer(source)).parse_program(), Environment())
+
+        assert evaluated is not None
+
+        return evaluated
@@ -0,0 +1,144 @@
+from unittest import TestCase
+
+from typing import (
+    Any,
+    List,
+    Tuple
+)
+
+from lpp.ast import (
+    ASTNode,
+    Program
+)
+from lpp.incremental import IncrementalParser
+from lpp.parser import Parser
+from lpp.token import Token
+from lpp.token_buffer import TokenBuffer
+
+
+SOURCE: str = """variable a = 5;
+variable suma = funcion(x, y) {
+    regresa x + y;
+};
+suma(a, 10);
+variable b = a * 2;
+"""
+
+
+class IncrementalParserTest(TestCase):
+
+    def test_initial_parse(self) -> None:
+
+        parser: IncrementalParser = IncrementalParser(SOURCE)
+
+        self._test_same_as_full_parse(parser)
+        self.assertEqual(len(parser.program.statements), 4)
+
+
+    def test_edit_reuses_untouched_statements(self) -> None:
+
+        parser: IncrementalParser = IncrementalParser(SOURCE)
+        before: Program = parser.program
+
+        start = SOURCE.index("10")
+        after: Program = parser.edit(start, start + 2, "20")
+
+        self._test_same_as_full_parse(parser)
+        self.assertEqual(str(after.statements[2]), "suma(a, 20)")
+
+        # Solo se vuelven a parsear el statement editado y el anterior
+        self.assertEqual(parser.reparsed, 2)
+        self.assertIs(after.statements[0], before.statements[0])
+        self.assertIs(after.statements[3], before.statements[3])
+
+
+    def test_edit_that_adds_lines(self) -> None:
+
+        parser: IncrementalParser = IncrementalParser(SOURCE)
+        before: Program = parser.program
+
+        parser.edit(0, 0, "variable z = 1;\n\n")
+
+        self._test_same_as_full_parse(parser)
+        self.assertIs(parser.program.statements[4], before.statements[3])
+
+        # El statement reutilizado no se modifica, located_program da una copia con su nueva línea
+        self.assertEqual(before.statements[3].token.line, 6)
+        self.assertEqual(parser.located_program().statements[4].token.line, 8)
+
+
+    def test_edit_that_moves_columns(self) -> None:
+
+        source = "1; 2; 3; variable a = 4; a + longitud(\"abc\"); 5;\n6;"
+        parser: IncrementalParser = IncrementalParser(source)
+        before: Program = parser.program
+
+        parser.edit(0, 1, "100")
+        self._test_same_as_full_parse(parser)
+        self.assertIs(parser.program.statements[4], before.statements[4])
+
+        parser.edit(0, 0, "\n")
+        self._test_same_as_full_parse(parser)
+        self.assertIs(parser.program.statements[4], before.statements[4])
+
+
+    def test_edit_that_merges_statements(self) -> None:
+
+        parser: IncrementalParser = IncrementalParser(SOURCE)
+
+        start = SOURCE.index(";\nsuma")
+        parser.edit(start, start + 1, " +")
+
+        self._test_same_as_full_parse(parser)
+        self.assertEqual(len(parser.program.statements), 3)
+        self.assertEqual(str(parser.program.statements[1]),
+                         "variable suma = (funcion(x, y) regresa (x + y); + suma(a, 10));")
+
+
+    def test_edit_with_errors(self) -> None:
+
+        parser: IncrementalParser = IncrementalParser(SOURCE)
+
+        parser.edit(0, 0, "variable = 3;\n")
+        self._test_same_as_full_parse(parser)
+        self.assertEqual(len(parser.errors), 2)
+
+        parser.edit(0, 0, "\n")
+        self._test_same_as_full_parse(parser)
+
+        parser.edit(1, len("\nvariable = 3;\n"), "")
+        self._test_same_as_full_parse(parser)
+        self.assertEqual(parser.errors, [])
+
+
+    def _test_same_as_full_parse(self, parser: IncrementalParser) -> None:
+
+        full: Parser = Parser(TokenBuffer(parser.source))
+        program: Program = full.parse_program()
+
+        self.assertEqual(str(parser.program), str(program))
+        self.assertEqual(parser.errors, full.errors)
+        self.assertEqual(self._tokens(parser.located_program()), self._tokens(program))
+
+
+    def _tokens(self, program: Program) -> List[Token]:
+
+        tokens: List[Token] = []
+        pending: List[Any] = list(program.statements)
+
+        # Todos los tokens del árbol, no solo el primero de cada statement
+        while pending:
+
+            node = pending.pop()
+
+            if isinstance(node, list):
+                pending.extend(node)
+
+            elif isinstance(node, ASTNode):
+
+                names: Tuple[str, ...] = type(node).__slots__
+
+                tokens.append(node.token) # type: ignore
+                pending.extend(getattr(node, name) for name in names if name != "token")
+
+        return tokens
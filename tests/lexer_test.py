@@ -1,20 +1,30 @@
 from unittest import TestCase
-from typing import List
+from typing import (
+    Callable,
+    List
+)
 
 from lpp.token import (
     Token,
     TokenType
 )
 
-from lpp.lexer import Lexer
+from lpp.lexer import (
+    Lexer,
+    RegexLexer,
+    TokenSource
+)
 
 
 class LexerTest(TestCase):
 
+    lexer_class: Callable[[str], TokenSource] = Lexer
+
+
     def test_illegal(self) -> None:
 
         source: str = "@¡¿"
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -33,7 +43,7 @@ class LexerTest(TestCase):
     def test_one_character_operator(self) -> None:
 
         source: str = "=+-/*<>!"
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -58,7 +68,7 @@ class LexerTest(TestCase):
     def test_eof(self) -> None:
 
         source: str = "+"
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -77,7 +87,7 @@ class LexerTest(TestCase):
     def test_delimiters(self) -> None:
 
         source: str = "(){},;"
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -100,7 +110,7 @@ class LexerTest(TestCase):
     def test_assignment(self) -> None:
         
         source: str = "variable cinco = 5;"
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -127,7 +137,7 @@ class LexerTest(TestCase):
             };
         """
 
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -163,7 +173,7 @@ class LexerTest(TestCase):
             variable resultado = suma(dos, tres);
         """
 
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -197,7 +207,7 @@ class LexerTest(TestCase):
             }
         """
 
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -227,7 +237,39 @@ class LexerTest(TestCase):
 
         self.assertEquals(tokens, expected_tokens)
 
-    
+
+    def test_while_loop(self) -> None:
+
+        source: str = "mientras (i < 3) { i = i + 1; }"
+
+        lexer: TokenSource = self.lexer_class(source)
+
+        tokens: List[Token] = []
+
+        for i in range(14):
+
+            tokens.append(lexer.next_token())
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.WHILE, "mientras"),
+            Token(TokenType.LPAREN, "("),
+            Token(TokenType.IDENT, "i"),
+            Token(TokenType.LT, "<"),
+            Token(TokenType.INT, "3"),
+            Token(TokenType.RPAREN, ")"),
+            Token(TokenType.LBRACE, "{"),
+            Token(TokenType.IDENT, "i"),
+            Token(TokenType.ASSIGN, "="),
+            Token(TokenType.IDENT, "i"),
+            Token(TokenType.PLUS, "+"),
+            Token(TokenType.INT, "1"),
+            Token(TokenType.SEMICOLON, ";"),
+            Token(TokenType.RBRACE, "}"),
+        ]
+
+        self.assertEquals(tokens, expected_tokens)
+
+
     def test_two_character_operator(self) -> None:
         
         source: str = """
@@ -237,7 +279,7 @@ class LexerTest(TestCase):
             10 >= 9;
         """
 
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -277,7 +319,7 @@ class LexerTest(TestCase):
             10 !== 9;
         """
 
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -308,7 +350,7 @@ class LexerTest(TestCase):
             10 != 9;
         """
 
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
 
         tokens: List[Token] = []
 
@@ -345,7 +387,7 @@ class LexerTest(TestCase):
             "Platzi es la mejor escuela online";
         '''
 
-        lexer: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
         tokens: List[Token] = []
 
         for i in range(4):
@@ -359,3 +401,29 @@ class LexerTest(TestCase):
         ]
 
         self.assertEquals(tokens, expected_tokens)
+
+
+
+# Todas las pruebas de LexerTest se vuelven a correr con el motor de una sola expresión regular
+class RegexLexerTest(LexerTest):
+
+    lexer_class: Callable[[str], TokenSource] = RegexLexer
+
+
+    def test_same_tokens_as_lexer(self) -> None:
+
+        source: str = """
+            variable áéíóú_ñ1 = funcion(x, y) {
+                si (x >= 10 !== y <= 3) { regresa "hola mundo"; } si_no { regresa 'adiós' }
+            };
+            10 === 10 != 9 == !verdadero - falso * 2 / 1 @ ¿ "sin cerrar
+        """
+
+        expected: Lexer = Lexer(source)
+        lexer: TokenSource = self.lexer_class(source)
+
+        while (token := expected.next_token()).token_type != TokenType.EOF:
+            self.assertEqual(lexer.next_token(), token)
+
+        self.assertEqual(lexer.next_token(), Token(TokenType.EOF, ""))
+        self.assertEqual(lexer.next_token(), Token(TokenType.EOF, ""))
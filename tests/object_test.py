@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+import lpp.object as lpp_object
+from lpp.evaluator import evaluate
+from lpp.object import (
+    configure_small_integers,
+    Environment,
+    Integer,
+    to_integer_object
+)
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+class ObjectTest(TestCase):
+
+    def tearDown(self) -> None:
+
+        configure_small_integers(-5, 256)
+
+
+    def test_small_integers_are_shared(self) -> None:
+
+        self.assertIs(to_integer_object(-5), to_integer_object(-5))
+        self.assertIs(to_integer_object(256), to_integer_object(256))
+        self.assertIsNot(to_integer_object(257), to_integer_object(257))
+        self.assertEqual(to_integer_object(257).value, 257)
+
+
+    def test_configure_small_integers(self) -> None:
+
+        configure_small_integers(0, 1000)
+
+        self.assertEqual((lpp_object.SMALL_INTEGER_MIN, lpp_object.SMALL_INTEGER_MAX), (0, 1000))
+        self.assertIs(to_integer_object(1000), to_integer_object(1000))
+        self.assertIsNot(to_integer_object(-1), to_integer_object(-1))
+
+
+    def test_literals_and_results_are_reused(self) -> None:
+
+        program = Parser(TokenBuffer('variable f = funcion() { 1000 }; f();')).parse_program()
+
+        first = evaluate(program, Environment())
+        second = evaluate(program, Environment())
+
+        self.assertIsInstance(first, Integer)
+        self.assertIs(first, second)
+
+        string = Parser(TokenBuffer('"abc";')).parse_program()
+        self.assertIs(evaluate(string, Environment()), evaluate(string, Environment()))
+
+        self.assertIs(evaluate(Parser(TokenBuffer('2 + 3;')).parse_program(), Environment()), to_integer_object(5))
@@ -0,0 +1,114 @@
+from unittest import TestCase
+
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.object import Environment
+from lpp.optimizer import optimize
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+class OptimizerTest(TestCase):
+
+    def test_constant_folding(self) -> None:
+
+        tests: List[Tuple[str, str]] = [
+            ('2 * 3 + 4;', '10'),
+            ('"a" + "b";', '"ab"'),
+            ('-(-4) * (1 + 1);', '8'),
+            ('!verdadero;', 'falso'),
+            ('1 < 2 == verdadero;', 'verdadero'),
+            ('"a" == "a";', 'verdadero'),
+            ('2 * 3 + x;', '(6 + x)'),
+            ('mientras (x < 2 * 5) { x = x + 2 * 3; }', 'mientras (x < 10) x = (x + 6);'),
+        ]
+
+        for source, expected in tests:
+            self.assertEqual(str(self._optimize(source)), expected)
+
+
+    def test_errors_are_not_folded(self) -> None:
+
+        tests: List[str] = [
+            '(10 / 0)',
+            '(5 + verdadero)',
+            '("a" - "b")',
+            '(-verdadero)',
+        ]
+
+        for source in tests:
+            self.assertEqual(str(self._optimize(source)), source)
+
+
+    def test_identities(self) -> None:
+
+        tests: List[Tuple[str, str]] = [
+            ('!!(a == b);', '(a == b)'),
+            ('!!!x;', '(!x)'),
+            # x puede no ser un entero, así que x * 1 puede ser un error y no se simplifica
+            ('x * 1;', '(x * 1)'),
+            ('!!x;', '(!(!x))'),
+        ]
+
+        for source, expected in tests:
+            self.assertEqual(str(self._optimize(source)), expected)
+
+
+    def test_branch_pruning(self) -> None:
+
+        tests: List[Tuple[str, str]] = [
+            ('si (verdadero) { 1; 2 } si_no { 3 }; 4', '124'),
+            ('si (1 > 2) { 1 } si_no { 3 };', '3'),
+            ('variable x = si (0) { 1 } si_no { 2 };', 'variable x = si 0 1;'),
+            ('funcion() { regresa 1; 2; 3 };', 'funcion() regresa 1;'),
+            ('funcion() { si (verdadero) { regresa 1; } 2 };', 'funcion() regresa 1;'),
+        ]
+
+        for source, expected in tests:
+            self.assertEqual(str(self._optimize(source)), expected)
+
+
+    def test_same_results(self) -> None:
+
+        tests: List[str] = [
+            'variable doble = funcion(x) { x * 2 * 1 + 0 }; doble(2 + 3);',
+            'variable f = funcion(x) { si (verdadero) { regresa x; } 10 }; f(5);',
+            'si (falso) { 10 };',
+            'variable a = 5; !!(a == 5);',
+            '5 + verdadero;',
+            'variable x = "a" + "b"; longitud(x + "c");',
+            'si (10 > 1) { si (10 > 1) { regresa 10; } regresa 1; }',
+            '"Hola" - "mundo";',
+        ]
+
+        for source in tests:
+            expected = self._evaluate(self._parse(source))
+            self.assertEqual(self._evaluate(self._optimize(source)), expected, source)
+
+
+    def _evaluate(self, program: Program) -> Optional[str]:
+
+        evaluated = evaluate(program, Environment())
+
+        return None if evaluated is None else evaluated.inspect()
+
+
+    def _optimize(self, source: str) -> Program:
+
+        return optimize(self._parse(source))
+
+
+    def _parse(self, source: str) -> Program:
+
+        parser: Parser = Parser(TokenBuffer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+
+        return program
@@ -3,12 +3,14 @@ from unittest import TestCase
 from typing import (
     Any,
     cast,
+    Callable,
     List,
     Tuple,
     Type
 )
 
 from lpp.ast import (
+    AssignStatement,
     Block,
     Boolean,
     Call,
@@ -23,18 +25,28 @@ from lpp.ast import (
     Prefix,
     Program,
     ReturnStatement,
-    StringLiteral
+    Statement,
+    StringLiteral,
+    While
+)
+from lpp.iterative_parser import IterativeParser
+from lpp.lexer import (
+    Lexer,
+    RegexLexer,
+    TokenSource
 )
-from lpp.lexer import Lexer
 from lpp.parser import Parser
 
 class ParserTest(TestCase):
+
+    parser_class: Callable[[TokenSource], Parser] = Parser
+
     
     def test_parse_program(self) -> None:
 
         source: str = "variable x = 5;"
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -51,7 +63,7 @@ class ParserTest(TestCase):
         """
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -73,7 +85,7 @@ class ParserTest(TestCase):
         """
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -106,7 +118,7 @@ class ParserTest(TestCase):
         source: str = "variable x 5;"
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -123,7 +135,7 @@ class ParserTest(TestCase):
         """
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -155,7 +167,7 @@ class ParserTest(TestCase):
         source: str = "foobar;"
         
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -171,7 +183,7 @@ class ParserTest(TestCase):
         source: str = "5;"
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -187,7 +199,7 @@ class ParserTest(TestCase):
         source: str = "!5; -15; -verdadero; -falso"
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -228,7 +240,7 @@ class ParserTest(TestCase):
         """
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -273,7 +285,7 @@ class ParserTest(TestCase):
         source: str = "verdadero; falso;"
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -327,7 +339,7 @@ class ParserTest(TestCase):
         for source, expected_result, expected_statement_count in test_sources:
 
             lexer: Lexer = Lexer(source)
-            parser: Parser = Parser(lexer)
+            parser: Parser = self.parser_class(lexer)
 
             program: Program = parser.parse_program()
             
@@ -340,7 +352,7 @@ class ParserTest(TestCase):
         source: str = 'suma(1, 2 * 3, 4 + 5);'
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -366,7 +378,7 @@ class ParserTest(TestCase):
         source: str = "si (x < y) { z }"
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -392,7 +404,7 @@ class ParserTest(TestCase):
         source: str = 'si (a > b) { x } si_no { z; x; }'
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -421,7 +433,7 @@ class ParserTest(TestCase):
         source: str = "funcion(x, y) { x + y}"
 
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -468,7 +480,7 @@ class ParserTest(TestCase):
         for test in tests:
 
             lexer: Lexer = Lexer(test["input"]) # type: ignore
-            parser: Parser = Parser(lexer)
+            parser: Parser = self.parser_class(lexer)
 
             program: Program = parser.parse_program()
 
@@ -488,7 +500,7 @@ class ParserTest(TestCase):
 
         source: str = '"hello world!"'
         lexer: Lexer = Lexer(source)
-        parser: Parser = Parser(lexer)
+        parser: Parser = self.parser_class(lexer)
 
         program: Program = parser.parse_program()
 
@@ -499,6 +511,48 @@ class ParserTest(TestCase):
         self.assertEquals(string_literal.value, 'hello world!')
 
 
+    def test_while_statement(self) -> None:
+
+        source: str = 'mientras (i < 10) { i = i + 1; x }'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = self.parser_class(lexer)
+
+        program: Program = parser.parse_program()
+
+        self.assertEquals(parser.errors, [])
+        self.assertEquals(len(program.statements), 1)
+
+        while_statement = cast(While, program.statements[0])
+        self.assertIsInstance(while_statement, While)
+
+        assert while_statement.condition is not None and while_statement.body is not None
+        self._test_infix_expression(while_statement.condition, "i", "<", 10)
+        self.assertEquals(len(while_statement.body.statements), 2)
+
+        assign_statement = cast(AssignStatement, while_statement.body.statements[0])
+        self.assertIsInstance(assign_statement, AssignStatement)
+
+        assert assign_statement.name is not None and assign_statement.value is not None
+        self._test_identifier(assign_statement.name, "i")
+        self._test_infix_expression(assign_statement.value, "i", "+", 1)
+        self.assertEquals(str(program), "mientras (i < 10) i = (i + 1);x")
+
+
+    def test_assignment_is_not_an_expression(self) -> None:
+
+        source: str = 'x == y; x = y; x'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = self.parser_class(lexer)
+
+        program: Program = parser.parse_program()
+
+        self._test_program_statements(parser, program, 3)
+
+        self.assertIsInstance(program.statements[0], ExpressionStatement)
+        self.assertIsInstance(program.statements[1], AssignStatement)
+        self.assertIsInstance(program.statements[2], ExpressionStatement)
+
+
     def _test_block(self,
                     block: Block,
                     statements_number,
@@ -597,4 +651,89 @@ class ParserTest(TestCase):
         
         integer = cast(Integer, expression)
         self.assertEquals(integer.value, expected_value)
-        self.assertEquals(integer.token.literal, str(expected_value))
\ No newline at end of file
+        self.assertEquals(integer.token.literal, str(expected_value))
+
+# Todas las pruebas de ParserTest se vuelven a correr con el parser que no usa recursión
+class IterativeParserTest(ParserTest):
+
+    parser_class: Callable[[TokenSource], Parser] = IterativeParser
+
+
+    def test_same_trees_as_parser(self) -> None:
+
+        sources: List[str] = [
+            "-a * b + !c(1, 2 * 3)(4) - (5 + -6) / f() == 7 !== 8 <= 9;",
+            "variable f = funcion(x, y) { si (x > y) { regresa x; } si_no { regresa y } }; f(1, 2)",
+            "si (a) { b } si_no { c }(1); funcion() { 1; 2 }(3) + 4",
+            "mientras (i < f(2)) { i = i + 1; mientras (j) { j = falso } }; i = 3 x",
+            "mientras i { }; mientras (i) i; mientras (i) { x = }",
+            "variable = 5; regresa (1; f(1,; 2 + ; (1 + 2",
+            "-(1 + 2; !; f(1, 2 3); si (x { y }; funcion(x { }; 99999999999999999999999999",
+        ]
+
+        for source in sources:
+
+            expected: Parser = Parser(Lexer(source))
+            expected_program: Program = expected.parse_program()
+
+            parser: Parser = self.parser_class(Lexer(source))
+            program: Program = parser.parse_program()
+
+            self.assertEqual(self._dump(program), self._dump(expected_program))
+            self.assertEqual(parser.errors, expected.errors)
+
+
+    def test_deep_nesting(self) -> None:
+
+        depth: int = 100_000
+
+        sources: List[Tuple[str, Type, str]] = [
+            ("(" * depth + "1" + ")" * depth, Integer, ""),
+            ("-" * depth + "1", Prefix, "right"),
+            ("1" + " + 1" * depth, Infix, "left"),
+            ("1" + " + (1" * depth + ")" * depth, Infix, "right"),
+            ("f(" * depth + ")" * depth, Call, "arguments"),
+            ("si (x) { " * depth + "1" + " }" * depth, If, "consequence"),
+            ("funcion() { " * depth + "1" + " }" * depth, Function, "body"),
+        ]
+
+        for source, node_type, child in sources:
+
+            parser: Parser = self.parser_class(RegexLexer(source))
+            program: Program = parser.parse_program()
+
+            self.assertEqual(parser.errors, [])
+            self.assertEqual(len(program.statements), 1)
+
+            node: Any = cast(ExpressionStatement, program.statements[0]).expression
+            self.assertIsInstance(node, node_type)
+
+            # Recorremos el árbol sin recursión para comprobar que tiene la profundidad esperada
+            levels: int = 0
+
+            while child and isinstance(node, node_type):
+
+                node = getattr(node, child)
+                levels += 1
+
+                if isinstance(node, list):
+                    node = node[0] if node else None
+
+                elif isinstance(node, Block):
+                    node = cast(ExpressionStatement, node.statements[0]).expression
+
+            self.assertEqual(levels, depth if child else 0)
+
+
+    def _dump(self, node: Any) -> Any:
+
+        if isinstance(node, list):
+            return [self._dump(item) for item in node]
+
+        if not isinstance(node, (Program, Expression, Statement)):
+            return node
+
+        slots = [slot for cls in type(node).__mro__ for slot in getattr(cls, "__slots__", ())]
+        fields = {slot: self._dump(getattr(node, slot)) for slot in slots}
+
+        return (type(node).__name__, fields)
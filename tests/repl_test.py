@@ -0,0 +1,77 @@
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from typing import List
+
+from lpp.engines import ENGINES
+from lpp.repl import start_repl
+
+
+class REPLTest(TestCase):
+
+    def test_session_keeps_its_environment(self) -> None:
+
+        lines: List[str] = [
+            "variable x = 5;",
+            "variable suma = funcion(a) { a + x };",
+            "x = x + 1;",
+            "suma(1);",
+            "mientras (x < 10) { x = x + 1; }",
+            "x;",
+        ]
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEquals(self._run(lines, engine), ["7", "10"])
+
+
+    def test_lines_are_evaluated_once(self) -> None:
+
+        # Antes cada línea volvía a ejecutar todo el historial y la variable crecía con cada entrada
+        output = self._run(["variable x = 1;", "x = x + 1;", "x;", "x;"])
+
+        self.assertEquals(output, ["2", "2"])
+
+
+    def test_replay_and_history(self) -> None:
+
+        output = self._run(["variable x = 1;", "x = x * 2;", "$2", "$2", "x;", "$9", "historia"])
+
+        self.assertEquals(output, [
+            "8",
+            "El comando '$9' no existe",
+            "",
+            "1.- variable x = 1;",
+            "2.- x = x * 2;",
+            "3.- x = x * 2;",
+            "4.- x = x * 2;",
+            "5.- x;",
+            "",
+        ])
+
+
+    def test_parse_errors_do_not_end_the_session(self) -> None:
+
+        output = self._run(["variable x = 5;", "variable = 3;", "x;"])
+
+        self.assertEquals(output[-1], "5")
+
+
+    def test_errors_have_their_position(self) -> None:
+
+        output = self._run(["variable x = 5;", "x + verdadero;", "variable = 3;"])
+
+        self.assertEquals(output[0], "Error: Discrepancia de tipos: INTEGER + BOOLEAN (línea 1, columna 3)")
+        self.assertIn("(línea 1, columna 10)", output[1])
+
+
+    def _run(self, lines: List[str], engine: str = "evaluador") -> List[str]:
+
+        output = StringIO()
+
+        with patch("builtins.input", side_effect=lines + ["salir()"]), redirect_stdout(output):
+            start_repl(engine=engine)
+
+        return output.getvalue().splitlines()
@@ -0,0 +1,149 @@
+from gc import collect
+from unittest import TestCase
+from weakref import ref
+
+from typing import (
+    Any,
+    cast,
+    List,
+    Optional,
+    Tuple
+)
+
+from lpp.ast import (
+    GLOBAL,
+    Program
+)
+from lpp.evaluator import evaluate
+from lpp.object import (
+    Environment,
+    Frame
+)
+from lpp.parser import Parser
+from lpp.resolver import resolve
+from lpp.token_buffer import TokenBuffer
+
+
+class ResolverTest(TestCase):
+
+    def test_addresses(self) -> None:
+
+        program: Any = resolve(self._parse('''
+            variable a = 1;
+            funcion(b, c) {
+                variable d = b;
+                funcion(e) { a + c + d + e }
+            };
+        '''))
+
+        outer = program.statements[1].expression
+        inner = outer.body.statements[1].expression.body.statements[0].expression
+
+        self.assertEqual(outer.body.scope.names, ["b", "c", "d"])
+        self.assertEqual(outer.body.scope.arity, 2)
+        self.assertEqual(inner.left.left.left.depth, 2)
+        self.assertEqual(inner.left.left.left.slot, GLOBAL)
+
+        addresses: List[Tuple[Optional[int], Optional[int]]] = [
+            (inner.left.left.right.depth, inner.left.left.right.slot),
+            (inner.left.right.depth, inner.left.right.slot),
+            (inner.right.depth, inner.right.slot),
+        ]
+
+        self.assertEqual(addresses, [(1, 1), (1, 2), (0, 0)])
+
+
+    def test_declarations_inside_blocks(self) -> None:
+
+        program: Any = resolve(self._parse('''
+            funcion(x) {
+                si (x) { variable y = 1; } si_no { variable z = 2; }
+                variable w = si (x) { variable v = 3; v };
+                mientras (x) { variable u = 4; x = falso; }
+            };
+        '''))
+
+        function = program.statements[0].expression
+        assignment = function.body.statements[2].body.statements[1]
+
+        self.assertEqual(function.body.scope.names, ["x", "y", "z", "w", "v", "u"])
+        self.assertEqual((assignment.name.depth, assignment.name.slot), (0, 0))
+
+
+    def test_same_results_as_lookup_by_name(self) -> None:
+
+        tests: List[Tuple[str, str]] = [
+            # Se lee antes de declararse en la función, así que se usa la de afuera
+            ('variable x = 5; variable f = funcion() { variable y = x; variable x = 2; x + y }; f();', '7'),
+            # La closure se crea antes de que exista la variable, pero se llama después
+            ('variable f = funcion() { variable g = funcion() { x }; variable x = 3; g() }; f();', '3'),
+            ('variable f = funcion(x, x) { x }; f(1, 2);', '2'),
+            ('variable f = funcion(x) { x }; f(1, 2);', '1'),
+            ('variable f = funcion() { longitud("abc") }; f();', '3'),
+            ('variable f = funcion() { y }; variable y = 4; f();', '4'),
+            ('variable f = funcion() { nada }; f();', 'Error: Identificador no encontrado: nada (línea 1, columna 26)'),
+        ]
+
+        for source, expected in tests:
+
+            evaluated = evaluate(self._parse(source), Environment())
+
+            assert evaluated is not None
+            self.assertEqual(evaluated.inspect(), expected, source)
+
+
+    def test_function_calls_use_frames(self) -> None:
+
+        env = Environment()
+        evaluate(self._parse('variable f = funcion(x) { variable y = x; funcion() { y } }; variable g = f(1);'), env)
+
+        self.assertIsInstance(env["g"].env, Frame)
+        self.assertEqual(env["g"].env._values[1].value, 1)
+
+
+    def test_builtin_lookups_are_cached_per_environment(self) -> None:
+
+        program: Any = self._parse('variable f = funcion() { x + longitud("abc") }; f();')
+        expression = program.statements[0].value.body.statements[0].expression
+        identifier = expression.right.function
+
+        first = Environment()
+        first["x"] = evaluate(self._parse('1;'), Environment())
+        second = Environment()
+        second["x"] = evaluate(self._parse('10;'), Environment())
+
+        self.assertEqual(cast(Any, evaluate(program, first)).value, 4)
+        self.assertIs(identifier.cached[0](), first)
+        self.assertEqual(cast(Any, evaluate(program, second)).value, 13)
+        self.assertIs(identifier.cached[0](), second)
+        self.assertIsNone(expression.left.cached)
+
+
+    def test_cached_lookups_do_not_keep_the_environment_alive(self) -> None:
+
+        program: Any = self._parse('variable x = 2; variable f = funcion() { x * 3 }; f();')
+        env = Environment()
+
+        self.assertEqual(cast(Any, evaluate(program, env)).value, 6)
+
+        collected = ref(env)
+        del env
+        collect()
+
+        self.assertIsNone(collected())
+
+
+    def test_unknown_identifiers_are_not_cached(self) -> None:
+
+        program: Any = self._parse('variable f = funcion() { nada }; f();')
+
+        first = evaluate(program, Environment())
+        second = evaluate(program, Environment())
+
+        self.assertIsNot(first, second)
+        self.assertIsNone(program.statements[0].value.body.statements[0].expression.cached)
+
+
+    def _parse(self, source: str) -> Program:
+
+        return Parser(TokenBuffer(source)).parse_program()
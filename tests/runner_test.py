@@ -0,0 +1,200 @@
+from contextlib import (
+    redirect_stderr,
+    redirect_stdout
+)
+from io import (
+    BytesIO,
+    StringIO
+)
+from os import (
+    listdir,
+    path
+)
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from typing import (
+    cast,
+    List,
+    Tuple
+)
+
+from lpp.cache import CACHE_DIRECTORY
+from lpp.engines import ENGINES
+from lpp.object import (
+    Environment,
+    Object,
+    Return
+)
+from lpp.parser import Parser
+from lpp.runner import (
+    EXIT_PARSE_ERROR,
+    EXIT_RUNTIME_ERROR,
+    run_file,
+    run_statements,
+    run_stream
+)
+from lpp.stream_lexer import StreamLexer
+from lpp.token_buffer import TokenBuffer
+
+
+PROGRAM: str = """
+    variable fib = funcion(n) {
+        si (n < 2) { regresa n; }
+        fib(n - 1) + fib(n - 2);
+    };
+    fib(10);
+    variable i = 0;
+    mientras (i < 3) { i = i + 1; }
+    i;
+"""
+
+
+class RunnerTest(TestCase):
+
+    def test_prints_each_statement_result(self) -> None:
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEquals(self._run(PROGRAM, engine), (0, ["55", "3"], []))
+
+
+    def test_runtime_error_stops_the_program(self) -> None:
+
+        exit_code, output, errors = self._run("variable x = 1; x; y; x;")
+
+        self.assertEquals(exit_code, EXIT_RUNTIME_ERROR)
+        self.assertEquals(output, ["1"])
+        self.assertEquals(errors, ["Error: Identificador no encontrado: y (línea 1, columna 20)"])
+
+
+    def test_parse_errors_are_all_reported(self) -> None:
+
+        exit_code, output, errors = self._run("1;\nvariable = 3;\n5 +;\n2;")
+
+        self.assertEquals(exit_code, EXIT_PARSE_ERROR)
+        self.assertEquals(output, ["1"])
+        self.assertEquals(len(errors), 3)
+        self.assertIn("(línea 2, columna 10)", errors[0])
+        self.assertIn("(línea 3, columna 4)", errors[2])
+
+
+    def test_top_level_return_ends_the_program(self) -> None:
+
+        self.assertEquals(self._run("1; regresa 2; 3;"), (0, ["1", "2"], []))
+
+
+    def test_return_inside_top_level_blocks_ends_the_program(self) -> None:
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+
+                self.assertEquals(self._run('si (verdadero) { regresa 5; }\n"despues";', engine), (0, ["5"], []))
+                self.assertEquals(self._run('mientras (verdadero) { si (verdadero) { regresa 7; } }\n"despues";', engine), (0, ["7"], []))
+                self.assertEquals(self._run('si (falso) { regresa 1; } si_no { 3 }\n"despues";', engine), (0, ["3", "despues"], []))
+                # Un si usado como valor no termina el programa
+                self.assertEquals(self._run('variable x = si (verdadero) { regresa 5; };\n"despues";', engine), (0, ["despues"], []))
+                self.assertEquals(self._run('si (verdadero) { regresa 1 + verdadero; }\n"despues";', engine)[:2], (EXIT_RUNTIME_ERROR, []))
+
+
+    def test_engines_can_keep_the_top_level_return(self) -> None:
+
+        program = Parser(TokenBuffer('1; si (verdadero) { regresa 5; } 2;')).parse_program()
+
+        for engine, evaluate in ENGINES.items():
+            with self.subTest(engine=engine):
+
+                kept = evaluate(program, Environment(), keep_return=True)
+
+                self.assertIs(type(kept), Return)
+                self.assertEquals(cast(Return, kept).value.inspect(), "5")
+                self.assertEquals(cast(Object, evaluate(program, Environment())).inspect(), "5")
+
+
+    def test_statements_have_no_value(self) -> None:
+
+        sources: List[str] = [
+            'variable i = 0;',
+            'variable i = 0; i = 1;',
+            'variable i = 0; mientras (i < 3) { i = i + 1; }',
+            'mientras (falso) { 1 }',
+        ]
+
+        for engine, evaluate in ENGINES.items():
+            for source in sources:
+                with self.subTest(engine=engine, source=source):
+                    self.assertIsNone(evaluate(Parser(TokenBuffer(source)).parse_program(), Environment()))
+
+
+    def test_statements_run_before_the_rest_is_parsed(self) -> None:
+
+        parser = Parser(StreamLexer(BytesIO(b"variable x = 5; x; x + ;"), chunk_size=4))
+        output = StringIO()
+
+        with redirect_stdout(output), redirect_stderr(StringIO()):
+            exit_code = run_statements(parser)
+
+        self.assertEquals(exit_code, EXIT_PARSE_ERROR)
+        self.assertEquals(output.getvalue(), "5\n")
+
+
+    def test_run_file(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            filename = path.join(directory, "programa.lpp")
+
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write(PROGRAM)
+
+            output = StringIO()
+
+            with redirect_stdout(output):
+                exit_code = run_file(filename)
+
+            self.assertEquals(exit_code, 0)
+            self.assertEquals(output.getvalue().splitlines(), ["55", "3"])
+
+            with redirect_stderr(StringIO()):
+                self.assertEquals(run_file(path.join(directory, "no_existe.lpp")), EXIT_PARSE_ERROR)
+
+
+    def test_run_file_with_cache(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            filename = path.join(directory, "programa.lpp")
+
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write(PROGRAM)
+
+            for _ in range(2):
+
+                output = StringIO()
+
+                with redirect_stdout(output):
+                    exit_code = run_file(filename, cached=True)
+
+                self.assertEquals(exit_code, 0)
+                self.assertEquals(output.getvalue().splitlines(), ["55", "3"])
+                self.assertEquals(len(listdir(path.join(directory, CACHE_DIRECTORY))), 1)
+
+            # Un programa con errores de sintaxis no se guarda
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write("1;\nvariable = 3;")
+
+            with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                self.assertEquals(run_file(filename, cached=True), EXIT_PARSE_ERROR)
+
+            self.assertEquals(len(listdir(path.join(directory, CACHE_DIRECTORY))), 1)
+
+
+    def _run(self, source: str, engine: str = "evaluador") -> Tuple[int, List[str], List[str]]:
+
+        output = StringIO()
+        errors = StringIO()
+
+        with redirect_stdout(output), redirect_stderr(errors):
+            exit_code = run_stream(BytesIO(source.encode("utf-8")), engine=engine)
+
+        return exit_code, output.getvalue().splitlines(), errors.getvalue().splitlines()
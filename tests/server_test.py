@@ -0,0 +1,195 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+from socket import (
+    AF_UNIX,
+    socket,
+    SOCK_STREAM
+)
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase
+
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+from lpp.server import (
+    INVALID_REQUEST,
+    Job,
+    OK,
+    PARSE_ERROR,
+    receive_message,
+    RUNTIME_ERROR,
+    send_message,
+    Server,
+    submit,
+    TIMEOUT,
+    WorkerPool
+)
+
+
+class ServerTest(TestCase):
+
+    _directory: TemporaryDirectory
+    _socket_path: str
+    _server: Server
+    _thread: Thread
+
+
+    @classmethod
+    def setUpClass(cls) -> None:
+
+        cls._directory = TemporaryDirectory()
+        cls._socket_path = path.join(cls._directory.name, "lpp.sock")
+        cls._server = Server(cls._socket_path, workers=2, timeout=5)
+        cls._thread = Thread(target=cls._server.serve_forever)
+        cls._thread.start()
+
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+
+        cls._server.shutdown()
+        cls._server.server_close()
+        cls._thread.join()
+        cls._directory.cleanup()
+
+
+    def test_runs_programs(self) -> None:
+
+        response = self._submit("""
+            variable fib = funcion(n) {
+                si (n < 2) { regresa n; }
+                fib(n - 1) + fib(n - 2);
+            };
+            fib(15);
+        """)
+
+        self.assertEquals(response, {"estado": OK, "resultado": "610", "errores": []})
+        self.assertEquals(self._submit("variable x = 5;")["resultado"], None)
+        self.assertEquals(self._submit("2 * 21;", motor="vm", optimizar=True)["resultado"], "42")
+
+
+    def test_each_program_gets_a_new_environment(self) -> None:
+
+        self._submit("variable secreto = 1;")
+
+        self.assertEquals(self._submit("secreto;")["estado"], RUNTIME_ERROR)
+
+
+    def test_errors(self) -> None:
+
+        parse_error = self._submit("variable = 5;")
+        runtime_error = self._submit("5 + verdadero;")
+
+        self.assertEquals(parse_error["estado"], PARSE_ERROR)
+        self.assertEquals(len(parse_error["errores"]), 2)
+        self.assertEquals(runtime_error["estado"], RUNTIME_ERROR)
+        self.assertEquals(runtime_error["errores"], ["Error: Discrepancia de tipos: INTEGER + BOOLEAN (línea 1, columna 3)"])
+
+
+    def test_timeout(self) -> None:
+
+        # Más programas infinitos que procesos, el presupuesto de tiempo los detiene sin tener que matar a ninguno
+        for _ in range(3):
+
+            response = self._submit("mientras (verdadero) { 1; }", tiempo=0.2)
+
+            self.assertEquals(response["estado"], TIMEOUT)
+            self.assertEquals(response["errores"], ["Error: Se agotó el tiempo de 0.2 segundos"])
+
+        self.assertEquals(self._submit("1 + 1;")["resultado"], "2")
+
+
+    def test_steps(self) -> None:
+
+        response = self._submit("mientras (verdadero) { 1; }", pasos=100)
+
+        self.assertEquals(response["estado"], RUNTIME_ERROR)
+        self.assertEquals(response["errores"], ["Error: Se agotaron los 100 pasos permitidos"])
+        self.assertEquals(self._submit("variable f = funcion(n) { n }; f(3);", pasos=1)["resultado"], "3")
+
+
+    def test_server_steps_are_a_limit(self) -> None:
+
+        with TemporaryDirectory() as directory:
+
+            socket_path = path.join(directory, "limitado.sock")
+            server = Server(socket_path, workers=1, timeout=5, steps=50)
+            thread = Thread(target=server.serve_forever)
+            thread.start()
+
+            try:
+
+                # Sin pasos, con pasos nulos o con más pasos de los permitidos se usan los del servidor
+                for options in ({}, {"pasos": None}, {"pasos": 1000}):
+
+                    response = submit(socket_path, "mientras (verdadero) { 1; }", **options)
+
+                    self.assertEquals(response["errores"], ["Error: Se agotaron los 50 pasos permitidos"])
+
+            finally:
+
+                server.shutdown()
+                server.server_close()
+                thread.join()
+
+
+    def test_failed_workers_are_replaced(self) -> None:
+
+        pool = WorkerPool(workers=1)
+
+        try:
+
+            # Con un tiempo NaN falla la espera mientras el proceso sigue ocupado con el ciclo
+            with self.assertRaises(ValueError):
+                pool.run(Job("mientras (verdadero) { 1; }", seconds=float("nan")))
+
+            self.assertEquals(pool.run(Job("1 + 1;", seconds=2))["resultado"], "2")
+
+        finally:
+            pool.close()
+
+
+    def test_concurrent_requests(self) -> None:
+
+        sources: List[str] = [f"{n} * {n};" for n in range(20)]
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(executor.map(self._submit, sources))
+
+        self.assertEquals([response["resultado"] for response in responses], [str(n * n) for n in range(20)])
+
+
+    def test_several_programs_per_connection(self) -> None:
+
+        with socket(AF_UNIX, SOCK_STREAM) as connection:
+
+            connection.connect(self._socket_path)
+
+            for n in range(3):
+                send_message(connection, {"programa": f"{n} + 1;"})
+                self.assertEquals(receive_message(connection), {"estado": OK, "resultado": str(n + 1), "errores": []})
+
+
+    def test_invalid_requests(self) -> None:
+
+        self.assertEquals(self._submit("1;", motor="ninguno")["estado"], INVALID_REQUEST)
+        self.assertEquals(self._submit("1;", tiempo=-1)["estado"], INVALID_REQUEST)
+        self.assertEquals(self._submit("1;", tiempo=float("nan"))["estado"], INVALID_REQUEST)
+        self.assertEquals(self._submit("1;", tiempo=float("inf"))["estado"], INVALID_REQUEST)
+        self.assertEquals(self._submit("1;", pasos=0)["estado"], INVALID_REQUEST)
+        self.assertEquals(self._submit("1;", pasos=True)["estado"], INVALID_REQUEST)
+
+        with socket(AF_UNIX, SOCK_STREAM) as connection:
+
+            connection.connect(self._socket_path)
+            connection.sendall(b"\x00\x00\x00\x03abc")
+
+            self.assertEquals(receive_message(connection)["estado"], INVALID_REQUEST) # type: ignore
+
+
+    def _submit(self, source: str, **options: Any) -> Dict[str, Any]:
+        return submit(self._socket_path, source, **options)
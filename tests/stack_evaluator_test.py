@@ -0,0 +1,68 @@
+from sys import (
+    getrecursionlimit,
+    setrecursionlimit
+)
+
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object
+)
+from lpp.parser import Parser
+from lpp.stack_evaluator import evaluate
+from lpp.token_buffer import TokenBuffer
+from tests import evaluator_test
+
+
+# Las mismas pruebas del evaluador con la evaluación en una pila propia
+class StackEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    def test_deep_recursion(self) -> None:
+
+        source: str = '''
+            variable suma = funcion(n) { si (n == 0) { regresa 0; } n + suma(n - 1) };
+            suma(20000);
+        '''
+
+        recursion_limit = getrecursionlimit()
+        setrecursionlimit(300)
+
+        try:
+            evaluated = self._evaluate_tests(source)
+
+        finally:
+            setrecursionlimit(recursion_limit)
+
+        self._test_integer_object(evaluated, 200010000)
+
+
+    def test_stack_overflow(self) -> None:
+
+        source: str = 'variable infinita = funcion(n) {\n  1 + infinita(n + 1)\n};\ninfinita(0);'
+
+        evaluated = evaluate(Parser(TokenBuffer(source)).parse_program(), Environment(), max_depth=1000)
+
+        assert evaluated is not None
+        self.assertEqual(evaluated.inspect(), 'Error: desbordamiento de pila (línea 2, columna 15)')
+
+
+    def test_tail_calls_do_not_count(self) -> None:
+
+        source: str = '''
+            variable cuenta = funcion(n) { si (n == 0) { regresa "listo"; } cuenta(n - 1) };
+            cuenta(5000);
+        '''
+
+        evaluated = evaluate(Parser(Lexer(source)).parse_program(), Environment(), max_depth=10)
+
+        assert evaluated is not None
+        self._test_string_object(evaluated, 'listo')
+
+
+    def _evaluate_tests(self, source: str) -> Object:
+
+        evaluated = evaluate(Parser(Lexer(source)).parse_program(), Environment())
+
+        assert evaluated is not None
+
+        return evaluated
@@ -0,0 +1,114 @@
+from io import (
+    BytesIO,
+    StringIO
+)
+from os import remove
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+from typing import List
+
+from lpp.lexer import (
+    RegexLexer,
+    TokenSource
+)
+from lpp.parser import Parser
+from lpp.stream_lexer import (
+    open_lexer,
+    StreamLexer
+)
+from lpp.token import (
+    Token,
+    TokenType
+)
+from lpp.token_buffer import TokenBuffer
+
+
+SOURCE: str = """
+    variable año = funcion(x, y) {
+        regresa x + y === "un string que
+cruza varias líneas" !== 'ñandú';
+    };
+    año(10, 200) <= 3000 != 4 == verdadero; @ "sin cerrar
+"""
+
+
+class StreamLexerTest(TestCase):
+
+    def test_same_tokens_as_lexer(self) -> None:
+
+        expected: List[Token] = self._tokens(RegexLexer(SOURCE))
+
+        # Con pedazos pequeños casi todos los tokens y strings quedan partidos entre dos lecturas
+        for chunk_size in (1, 2, 3, 7, 64):
+
+            tokens = self._tokens(StreamLexer(StringIO(SOURCE), chunk_size))
+
+            self.assertEqual([(token.token_type, token.literal) for token in tokens],
+                             [(token.token_type, token.literal) for token in expected])
+
+
+    def test_utf8_bytes_split_between_chunks(self) -> None:
+
+        expected: List[Token] = self._tokens(TokenBuffer(SOURCE))
+
+        for chunk_size in (1, 2, 5):
+
+            tokens = self._tokens(StreamLexer(BytesIO(SOURCE.encode("utf-8")), chunk_size))
+            self.assertEqual(tokens, expected)
+
+
+    def test_positions(self) -> None:
+
+        expected: List[Token] = self._tokens(TokenBuffer(SOURCE))
+        tokens: List[Token] = self._tokens(StreamLexer(StringIO(SOURCE), 4))
+
+        self.assertEqual(tokens, expected)
+
+
+    def test_open_memory_mapped_file(self) -> None:
+
+        with NamedTemporaryFile("wb", suffix=".lpp", delete=False) as file:
+            file.write(SOURCE.encode("utf-8"))
+
+        try:
+
+            with open_lexer(file.name, chunk_size=16) as lexer:
+                tokens = self._tokens(lexer)
+
+            with open_lexer(file.name) as lexer:
+                program = Parser(lexer).parse_program()
+
+        finally:
+            remove(file.name)
+
+        self.assertEqual(tokens, self._tokens(TokenBuffer(SOURCE)))
+        self.assertEqual(len(program.statements), 4)
+
+
+    def test_empty_file(self) -> None:
+
+        with NamedTemporaryFile("wb", suffix=".lpp", delete=False) as file:
+            pass
+
+        try:
+
+            with open_lexer(file.name) as lexer:
+                token = lexer.next_token()
+
+        finally:
+            remove(file.name)
+
+        self.assertEqual(token, Token(TokenType.EOF, "", 1, 1))
+
+
+    def _tokens(self, lexer: TokenSource) -> List[Token]:
+
+        tokens: List[Token] = []
+
+        while (token := lexer.next_token()).token_type != TokenType.EOF:
+            tokens.append(token)
+
+        tokens.append(token)
+
+        return tokens
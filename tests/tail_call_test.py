@@ -0,0 +1,85 @@
+from sys import (
+    getrecursionlimit,
+    setrecursionlimit
+)
+from unittest import TestCase
+
+from typing import (
+    List,
+    Tuple
+)
+
+from lpp.evaluator import evaluate
+from lpp.object import Environment
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+
+
+class TailCallTest(TestCase):
+
+    def setUp(self) -> None:
+
+        # Con un límite tan bajo cualquier recursión que use la pila de Python falla
+        self._recursion_limit = getrecursionlimit()
+        setrecursionlimit(300)
+
+
+    def tearDown(self) -> None:
+
+        setrecursionlimit(self._recursion_limit)
+
+
+    def test_tail_calls_run_in_constant_stack(self) -> None:
+
+        tests: List[Tuple[str, str]] = [
+            ('variable cuenta = funcion(n) { si (n == 0) { regresa "listo"; } cuenta(n - 1) }; cuenta(50000);', 'listo'),
+            ('variable cuenta = funcion(n) { si (n == 0) { 0 } si_no { cuenta(n - 1) } }; cuenta(50000);', '0'),
+            ('variable cuenta = funcion(n) { si (n > 0) { regresa cuenta(n - 1); } n }; cuenta(50000);', '0'),
+            ('''
+                variable par = funcion(n) { si (n == 0) { regresa verdadero; } impar(n - 1) };
+                variable impar = funcion(n) { si (n == 0) { regresa falso; } par(n - 1) };
+                par(50001);
+             ''', 'falso'),
+        ]
+
+        for source, expected in tests:
+            self.assertEqual(self._evaluate(source), expected)
+
+
+    def test_calls_that_are_not_in_tail_position(self) -> None:
+
+        tests: List[Tuple[str, str]] = [
+            ('variable suma = funcion(n) { si (n == 0) { regresa 0; } n + suma(n - 1) }; suma(10);', '55'),
+            # El si no es lo último, así que su valor se descarta
+            ('variable f = funcion(n) { si (n > 0) { f(n - 1) } "fin" }; f(3);', 'fin'),
+            ('variable f = funcion() { longitud("abc") }; f();', '3'),
+            ('variable f = funcion() { regresa longitud("ab"); }; f();', '2'),
+            ('variable f = funcion() { variable a = si (verdadero) { regresa 5; }; a }; f();', '5'),
+        ]
+
+        for source, expected in tests:
+            self.assertEqual(self._evaluate(source), expected)
+
+
+    def test_error_position(self) -> None:
+
+        source: str = '''
+            variable falla = funcion(x) { x + verdadero };
+            variable f = funcion(x) { longitud(x) };
+            variable g = funcion(x) { f(x) };
+            variable h = funcion(x) { falla(x) };
+        '''
+
+        self.assertEqual(self._evaluate(source + 'g(1);'),
+                         'Error: argumento para longitud sin soporte, se recibió INTEGER (línea 3, columna 47)')
+        self.assertEqual(self._evaluate(source + 'h(1);'),
+                         'Error: Discrepancia de tipos: INTEGER + BOOLEAN (línea 2, columna 45)')
+
+
+    def _evaluate(self, source: str) -> str:
+
+        evaluated = evaluate(Parser(TokenBuffer(source)).parse_program(), Environment())
+
+        assert evaluated is not None
+
+        return evaluated.inspect()
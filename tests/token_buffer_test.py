@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from typing import (
+    cast,
+    List
+)
+
+from lpp.evaluator import evaluate
+from lpp.lexer import RegexLexer
+from lpp.object import (
+    Environment,
+    Error
+)
+from lpp.parser import Parser
+from lpp.token import (
+    Token,
+    TokenType
+)
+from lpp.token_buffer import TokenBuffer
+
+
+class TokenBufferTest(TestCase):
+
+    def test_same_tokens_as_lexer(self) -> None:
+
+        source: str = """
+            variable suma = funcion(x, y) {
+                regresa x + y === "hola" !== 'mundo';
+            };
+            suma(1, 2) <= 3 @ "sin cerrar
+        """
+
+        lexer: RegexLexer = RegexLexer(source)
+        buffer: TokenBuffer = TokenBuffer(source)
+
+        for idx in range(len(buffer)):
+
+            expected = lexer.next_token()
+            token = buffer.next_token()
+
+            self.assertEqual((token.token_type, token.literal),
+                             (expected.token_type, expected.literal))
+            self.assertEqual(buffer.token_type(idx), expected.token_type)
+            self.assertEqual(buffer.literal(idx), expected.literal)
+
+        self.assertEqual(buffer.next_token().token_type, TokenType.EOF)
+
+
+    def test_positions(self) -> None:
+
+        source: str = 'variable x = 5;\n  "hola";\n\nx'
+        buffer: TokenBuffer = TokenBuffer(source)
+
+        tokens: List[Token] = [buffer.next_token() for _ in range(len(buffer))]
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.LET, "variable", 1, 1),
+            Token(TokenType.IDENT, "x", 1, 10),
+            Token(TokenType.ASSIGN, "=", 1, 12),
+            Token(TokenType.INT, "5", 1, 14),
+            Token(TokenType.SEMICOLON, ";", 1, 15),
+            Token(TokenType.STRING, "hola", 2, 3),
+            Token(TokenType.SEMICOLON, ";", 2, 9),
+            Token(TokenType.IDENT, "x", 4, 1),
+            Token(TokenType.EOF, "", 4, 2),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+        self.assertEqual(buffer.position(5), (2, 3))
+        self.assertEqual(buffer.token(7), Token(TokenType.IDENT, "x", 4, 1))
+
+
+    def test_parse_error_position(self) -> None:
+
+        source: str = "variable x = 5;\nvariable = 10;"
+        parser: Parser = Parser(TokenBuffer(source))
+
+        parser.parse_program()
+
+        self.assertEqual(parser.errors[0],
+                         "Se esperaba que el siguiente token fuera TokenType.IDENT " +
+                         "pero se obtuvo TokenType.ASSIGN (línea 2, columna 10)")
+
+
+    def test_runtime_error_position(self) -> None:
+
+        source: str = "variable x = 5;\n\n  x + verdadero;"
+        parser: Parser = Parser(TokenBuffer(source))
+
+        evaluated = evaluate(parser.parse_program(), Environment())
+
+        self.assertIsInstance(evaluated, Error)
+
+        evaluated = cast(Error, evaluated)
+        self.assertEqual((evaluated.line, evaluated.column), (3, 5))
+        self.assertEqual(evaluated.inspect(),
+                         "Error: Discrepancia de tipos: INTEGER + BOOLEAN (línea 3, columna 5)")
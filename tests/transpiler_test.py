@@ -0,0 +1,109 @@
+from typing import (
+    List,
+    Tuple
+)
+
+import lpp
+from lpp.evaluator import evaluate
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object
+)
+from lpp.parser import Parser
+from lpp.transpiler import (
+    evaluate as evaluate_python,
+    translate
+)
+from tests import evaluator_test
+
+
+# Las mismas pruebas del evaluador, pero traduciendo los programas a Python
+class TranspilerTest(evaluator_test.EvaluatorTest):
+
+    def test_same_results_as_evaluator(self) -> None:
+
+        tests: List[str] = [
+            'variable resta = funcion(x, y) { x - y }; resta(10, 3);',
+            'variable f = funcion(x, x) { x }; f(1, 2);',
+            'variable sumador = funcion(x) { variable z = x * 2; funcion(y) { x + y + z } }; sumador(2)(3);',
+            'variable f = funcion() { 5 + verdadero; 10 }; f();',
+            'variable f = funcion(x) { si (x) { variable y = x; y } }; f(1);',
+            'variable x = 5; variable f = funcion() { variable y = x; variable x = 2; x + y }; f();',
+            'variable x = si (falso) { 1 }; x;',
+            'variable f = funcion() { si (verdadero) { foo; 1 } 2 }; f();',
+            'variable x = si (verdadero) { foo; 1 }; 3;',
+            'variable f = funcion(a) { variable b = si (a > 1) { regresa 5; 6 }; b }; f(2);',
+            'variable f = funcion(x) {\n  x + verdadero\n};\nf(1);',
+            'variable f = funcion(x) { -x }; f("a");',
+            'longitud(1) + 2;',
+            'variable f = funcion(a, b) { a }; f(1, 2, 3);',
+            '1 + funcion() { regresa 2; 3 }();',
+            '"a" < "b";',
+            'variable f = funcion(a) { si (a) { 1 } si_no { 2 } }; f(falso) + f(0);',
+            'variable f = funcion(a) { !a == !!a }; f(5);',
+            '5; 6; variable a = 2;',
+            '',
+        ]
+
+        for source in tests:
+            self.assertEqual(self._inspect(evaluate_python, source), self._inspect(evaluate, source), source)
+
+
+    def test_translated_code_is_reused(self) -> None:
+
+        source: str = 'variable doble = funcion(x) { x * 2 }; doble(21);'
+
+        first = translate(Parser(Lexer(source)).parse_program())
+        second = translate(Parser(Lexer(source)).parse_program())
+
+        self.assertIs(first.__code__, second.__code__)
+
+        evaluated = first(Environment())
+
+        assert evaluated is not None
+        self._test_integer_object(evaluated, 42)
+
+
+    def test_deep_recursion(self) -> None:
+
+        source: str = '''
+            variable cuenta = funcion(n) { si (n == 0) { regresa "listo"; } cuenta(n - 1) };
+            cuenta(200);
+        '''
+
+        self._test_string_object(self._evaluate_tests(source), 'listo')
+
+
+    def test_programs_python_cannot_compile(self) -> None:
+
+        # Son válidos en lpp pero pasan los límites del compilador de Python (bloques anidados y paréntesis), así que se ejecutan con el evaluador
+        tests: List[Tuple[str, int]] = [
+            ('variable i = 0; ' + 'mientras (i < 1) { ' * 25 + 'i = i + 1;' + ' }' * 25 + ' i;', 1),
+            (' + '.join(['1'] * 250) + ';', 250),
+        ]
+
+        for source, expected in tests:
+
+            self._test_integer_object(self._evaluate_tests(source), expected)
+
+            evaluated = lpp.compile(source, engine="python").run()
+
+            assert evaluated is not None
+            self._test_integer_object(evaluated, expected)
+
+
+    def _evaluate_tests(self, source: str) -> Object:
+
+        evaluated = evaluate_python(Parser(Lexer(source)).parse_program(), Environment())
+
+        assert evaluated is not None
+
+        return evaluated
+
+
+    def _inspect(self, backend, source: str) -> str:
+
+        evaluated = backend(Parser(Lexer(source)).parse_program(), Environment())
+
+        return 'None' if evaluated is None else evaluated.inspect()
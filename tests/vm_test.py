@@ -0,0 +1,128 @@
+from typing import (
+    List,
+    Tuple
+)
+
+import lpp.stack_evaluator as stack_evaluator
+from lpp.code import (
+    disassemble,
+    OpCode
+)
+from lpp.compiler import compile_program
+from lpp.evaluator import evaluate
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object
+)
+from lpp.parser import Parser
+from lpp.token_buffer import TokenBuffer
+from lpp.vm import run
+from tests import evaluator_test
+
+
+# Las mismas pruebas del evaluador, pero compilando a bytecode y ejecutando en la máquina virtual
+class VMTest(evaluator_test.EvaluatorTest):
+
+    def test_bytecode(self) -> None:
+
+        bytecode = compile_program(Parser(Lexer('variable a = 1 + 2; -a;')).parse_program())
+
+        self.assertEqual(bytecode.instructions[::2], [
+            OpCode.CONSTANT,
+            OpCode.CONSTANT,
+            OpCode.ADD,
+            OpCode.SET_NAME,
+            OpCode.GET_NAME,
+            OpCode.MINUS,
+            OpCode.RETURN_VALUE,
+        ])
+
+
+    def test_disassemble(self) -> None:
+
+        bytecode = compile_program(Parser(Lexer('variable f = funcion(x) { x * 2 }; f("a");')).parse_program())
+
+        self.assertEqual(disassemble(bytecode), '\n'.join([
+            'programa:',
+            '0000 CLOSURE 0 (funcion_0)',
+            '0002 SET_NAME 1 (f)',
+            '0004 GET_NAME 1 (f)',
+            '0006 CONSTANT 2 ("a")',
+            '0008 CALL 1',
+            '0010 RETURN_VALUE 1',
+            '',
+            'funcion_0(x):',
+            '0000 GET_NAME 0 (x)',
+            '0002 CONSTANT 1 (2)',
+            '0004 MUL',
+            '0006 RETURN_VALUE 1',
+        ]))
+
+
+    def test_same_results_as_evaluator(self) -> None:
+
+        tests: List[str] = [
+            'variable resta = funcion(x, y) { x - y }; resta(10, 3);',
+            'variable sumador = funcion(x) { funcion(y) { x + y } }; sumador(2)(3);',
+            'variable f = funcion() { 5 + verdadero; 10 }; f();',
+            'variable f = funcion(x) { si (x) { variable y = x; y } }; f(1);',
+            'variable x = si (falso) { 1 }; x;',
+            'variable f = funcion() { si (verdadero) { foo; 1 } 2 }; f();',
+            'variable x = si (verdadero) { foo; 1 }; 3;',
+            'variable f = funcion(x) {\n  x + verdadero\n};\nf(1);',
+            'longitud(1) + 2;',
+            'variable f = funcion(a, b) { a }; f(1, 2, 3);',
+            '1 + funcion() { regresa 2; 3 }();',
+            '"a" < "b";',
+            '5; 6; variable a = 2;',
+            '',
+        ]
+
+        for source in tests:
+            self.assertEqual(self._inspect(run, source), self._inspect(evaluate, source), source)
+
+
+    def test_deep_recursion(self) -> None:
+
+        # Las llamadas de lpp no ocupan la pila de Python
+        source: str = '''
+            variable cuenta = funcion(n) { si (n == 0) { regresa "listo"; } cuenta(n - 1) };
+            cuenta(20000);
+        '''
+
+        self._test_string_object(self._evaluate_tests(source), 'listo')
+
+
+    def test_stack_overflow(self) -> None:
+
+        source: str = 'variable infinita = funcion(n) {\n  1 + infinita(n + 1)\n};\ninfinita(0);'
+        max_depth = stack_evaluator.MAX_CALL_DEPTH
+
+        # El mismo límite de --profundidad que usa stack_evaluator
+        stack_evaluator.MAX_CALL_DEPTH = 1000
+
+        try:
+            evaluated = run(Parser(TokenBuffer(source)).parse_program(), Environment())
+
+        finally:
+            stack_evaluator.MAX_CALL_DEPTH = max_depth
+
+        assert evaluated is not None
+        self.assertEqual(evaluated.inspect(), 'Error: desbordamiento de pila (línea 2, columna 15)')
+
+
+    def _evaluate_tests(self, source: str) -> Object:
+
+        evaluated = run(Parser(Lexer(source)).parse_program(), Environment())
+
+        assert evaluated is not None
+
+        return evaluated
+
+
+    def _inspect(self, backend, source: str) -> str:
+
+        evaluated = backend(Parser(Lexer(source)).parse_program(), Environment())
+
+        return 'None' if evaluated is None else evaluated.inspect()